@@ -0,0 +1 @@
+"""Benchmarks for the Adap1Status integration."""
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark of the status payload decode path.
+
+Compares the previous path (stdlib json decoding of the whole body into a
+fresh dict, which is what aiohttp's ClientResponse.json() does) with
+decode_status() from the integration, which decodes the raw bytes with the
+fastest available backend and keeps only the known keys.
+
+Usage:
+    python3 benchmarks/bench_decode.py [--number 20000] [--extra-fields 40]
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from custom_components.adap1status.parser import decode_status, orjson  # noqa: E402
+
+SAMPLE_STATUS = {
+    "os_version": "1.2.3",
+    "local_ip": "192.168.1.100",
+    "hostname": "ada-p1-meter",
+    "ssid": "TestWiFi",
+    "mqtt_server": "192.168.1.10",
+    "mqtt_connected": True,
+    "uptime_hhmm": "12:34",
+    "uptime_seconds": 45240,
+    "wifi_rssi": -65,
+    "wifi_channel": 6,
+    "serial_recent_sec": 5,
+    "heap_total": 327680,
+    "heap_free": 123456,
+    "heap_min_free": 100000,
+    "heap_max_alloc": 98304,
+    "heap_fragmentation": 15,
+    "fs_total": 1048576,
+    "fs_used": 524288,
+    "watchdog_enabled": True,
+    "watchdog_last_kick_ms": 100,
+    "telegram_url_mode": False,
+    "telegram_url_set": True,
+    "rules_loaded": True,
+    "chip_cores": 2,
+    "ack_items": 0,
+}
+
+
+def build_body(extra_fields):
+    """Return a status body padded with fields the integration does not know."""
+    payload = dict(SAMPLE_STATUS)
+    for index in range(extra_fields):
+        payload[f"firmware_field_{index}"] = {"value": index, "label": f"x{index}"}
+    return json.dumps(payload, indent=2).encode()
+
+
+def previous_path(body):
+    """Decode the way ClientResponse.json() does: text first, then stdlib json."""
+    return json.loads(body.decode("utf-8"))
+
+
+def run(number, extra_fields):
+    """Time both paths and return the results in microseconds per call."""
+    body = build_body(extra_fields)
+    results = {
+        "backend": "orjson" if orjson is not None else "json",
+        "body_bytes": len(body),
+        "number": number,
+    }
+    for name, func in (("previous", previous_path), ("decode_status", decode_status)):
+        seconds = min(timeit.repeat(lambda: func(body), number=number, repeat=5))
+        results[f"{name}_us"] = round(seconds / number * 1e6, 3)
+    results["speedup"] = round(results["previous_us"] / results["decode_status_us"], 2)
+    return results
+
+
+def main():
+    """Parse the arguments and print the results as JSON."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=20000)
+    parser.add_argument("--extra-fields", type=int, default=40)
+    args = parser.parse_args()
+    print(json.dumps(run(args.number, args.extra_fields), indent=2))
+
+
+if __name__ == "__main__":
+    main()
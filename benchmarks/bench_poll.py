@@ -0,0 +1,223 @@
+"""Poll-to-state benchmarks for the Adap1Status integration.
+
+Sets up 1, 50 and 500 config entries against an in-process mock meter
+server (one port per meter) and measures, per scenario:
+
+- poll latency: one full async_refresh() of a coordinator
+- decode time: decode_status() on the response body
+- state write time: from the decoded payload to all entity states written
+- memory per config entry, including its coordinator and entities
+- event-loop lag while all meters are polled concurrently
+
+Usage:
+    pytest benchmarks/bench_poll.py
+
+The results are printed and, if ADAP1STATUS_BENCH_OUTPUT is set, merged into
+that JSON file keyed by scenario, so that CI can compare them with a
+previous run and gate regressions.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import random
+import statistics
+import time
+import tracemalloc
+from unittest.mock import patch
+
+from aiohttp import web
+from aiohttp.test_utils import unused_port
+import pytest
+
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.adap1status import parser
+from custom_components.adap1status.const import CONF_PORT, DOMAIN
+
+OUTPUT_ENV = "ADAP1STATUS_BENCH_OUTPUT"
+POLL_ROUNDS = 5
+LAG_PROBE_INTERVAL = 0.005
+
+BASE_STATUS = {
+    "os_version": "1.2.3",
+    "local_ip": "127.0.0.1",
+    "hostname": "ada-p1-meter",
+    "ssid": "BenchWiFi",
+    "mqtt_server": "127.0.0.1",
+    "mqtt_connected": True,
+    "uptime_hhmm": "00:00",
+    "uptime_seconds": 0,
+    "wifi_rssi": -60,
+    "wifi_channel": 6,
+    "serial_recent_sec": 5,
+    "heap_total": 327680,
+    "heap_free": 123456,
+    "heap_min_free": 100000,
+    "heap_max_alloc": 98304,
+    "heap_fragmentation": 15,
+    "fs_total": 1048576,
+    "fs_used": 524288,
+    "watchdog_enabled": True,
+    "watchdog_last_kick_ms": 100,
+    "telegram_url_mode": False,
+    "telegram_url_set": True,
+    "rules_loaded": True,
+    "chip_cores": 2,
+    "ack_items": 0,
+}
+
+
+async def _handle_status(request: web.Request) -> web.Response:
+    """Serve a status payload whose volatile fields move on every request."""
+    uptime = int(time.monotonic())
+    payload = {
+        **BASE_STATUS,
+        "uptime_seconds": uptime,
+        "uptime_hhmm": f"{uptime // 3600:02d}:{uptime % 3600 // 60:02d}",
+        "wifi_rssi": -60 + random.randint(-5, 5),
+        "heap_free": 123456 + random.randint(-1000, 1000),
+        "watchdog_last_kick_ms": random.randint(50, 200),
+    }
+    return web.json_response(payload)
+
+
+async def _start_meters(count: int) -> tuple[web.AppRunner, list[int]]:
+    """Serve count mock meters, each on its own local port."""
+    app = web.Application()
+    app.router.add_get("/status", _handle_status)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    ports = [unused_port() for _ in range(count)]
+    for port in ports:
+        await web.TCPSite(runner, "127.0.0.1", port).start()
+    return runner, ports
+
+
+def _summary(samples: list[float]) -> dict[str, float]:
+    """Return mean, p95 and max of a list of durations in milliseconds."""
+    ordered = sorted(samples)
+    return {
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 3),
+        "p95_ms": round(ordered[int(0.95 * (len(ordered) - 1))] * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3),
+    }
+
+
+def _write_results(scenario: str, results: dict) -> None:
+    """Print the results and merge them into the output file, if requested."""
+    print(json.dumps({scenario: results}, indent=2))
+    if not (path := os.environ.get(OUTPUT_ENV)):
+        return
+    existing = {}
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as file:
+            existing = json.load(file)
+    existing[scenario] = results
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(existing, file, indent=2, sort_keys=True)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("entry_count", [1, 50, 500])
+async def test_poll_to_state(hass: HomeAssistant, entry_count: int) -> None:
+    """Measure the cost of polling entry_count meters end to end."""
+    runner, ports = await _start_meters(entry_count)
+    entries = [
+        MockConfigEntry(
+            domain=DOMAIN,
+            version=2,
+            title=f"Bench meter {port}",
+            data={CONF_HOST: "127.0.0.1", CONF_PORT: port},
+            unique_id=f"127.0.0.1:{port}",
+        )
+        for port in ports
+    ]
+
+    # Memory per entry: coordinator, entities, registry entries and states.
+    # The polls are driven by the benchmark, not by the shared scheduler.
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    with patch(
+        "custom_components.adap1status.scheduler.Adap1StatusPollScheduler.async_register",
+        return_value=lambda: None,
+    ):
+        for entry in entries:
+            entry.add_to_hass(hass)
+            assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    memory_per_entry = sum(
+        stat.size_diff for stat in after.compare_to(before, "filename")
+    ) / entry_count
+
+    coordinators = [hass.data[DOMAIN][entry.entry_id] for entry in entries]
+
+    decode_times: list[float] = []
+    write_times: list[float] = []
+    poll_latencies: list[float] = []
+    loop_lags: list[float] = []
+
+    def _timed_decode(body, *args):
+        start = time.perf_counter()
+        try:
+            return decode_status(body, *args)
+        finally:
+            decode_times.append(time.perf_counter() - start)
+
+    decode_status = parser.decode_status
+    for coordinator in coordinators:
+        update_listeners = coordinator.async_update_listeners
+
+        def _timed_update_listeners(update_listeners=update_listeners):
+            start = time.perf_counter()
+            update_listeners()
+            write_times.append(time.perf_counter() - start)
+
+        coordinator.async_update_listeners = _timed_update_listeners
+
+    async def _timed_refresh(coordinator):
+        start = time.perf_counter()
+        await coordinator.async_refresh()
+        poll_latencies.append(time.perf_counter() - start)
+
+    async def _probe_loop_lag(stop: asyncio.Event):
+        while not stop.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(LAG_PROBE_INTERVAL)
+            loop_lags.append(time.perf_counter() - start - LAG_PROBE_INTERVAL)
+
+    with patch("custom_components.adap1status.decode_status", _timed_decode):
+        stop = asyncio.Event()
+        probe = asyncio.create_task(_probe_loop_lag(stop))
+        round_start = time.perf_counter()
+        for _ in range(POLL_ROUNDS):
+            await asyncio.gather(*(_timed_refresh(c) for c in coordinators))
+        round_time = (time.perf_counter() - round_start) / POLL_ROUNDS
+        stop.set()
+        await probe
+
+    assert all(coordinator.last_update_success for coordinator in coordinators)
+
+    _write_results(
+        f"entries_{entry_count}",
+        {
+            "entries": entry_count,
+            "poll_rounds": POLL_ROUNDS,
+            "round_ms": round(round_time * 1000, 3),
+            "poll_latency": _summary(poll_latencies),
+            "decode": _summary(decode_times),
+            "state_write": _summary(write_times),
+            "event_loop_lag": _summary(loop_lags or [0.0]),
+            "memory_per_entry_bytes": round(memory_per_entry),
+        },
+    )
+
+    for entry in entries:
+        assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    await runner.cleanup()
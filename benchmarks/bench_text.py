@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark of the plain-text status parser.
+
+Feeds status bodies to TextStatusDecoder in TEXT_CHUNK_SIZE chunks, the way
+the coordinator reads them, and reports the time per body as well as the
+longest single feed() call, which is how long one chunk can block the event
+loop. Besides a regular body it covers a large body padded with unknown
+lines and malformed bodies (an endless line, an oversized body, binary
+garbage) that the decoder has to reject quickly.
+
+Usage:
+    python3 benchmarks/bench_text.py [--number 2000] [--extra-lines 5000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from custom_components.adap1status.const import (  # noqa: E402
+    MAX_STATUS_BODY_BYTES,
+    TEXT_CHUNK_SIZE,
+)
+from custom_components.adap1status.parser import TextStatusDecoder  # noqa: E402
+
+REGULAR_BODY = (
+    b"voltage: 230.5 V\n"
+    b"current: 5.2 A\n"
+    b"power: 1200 W\n"
+    b"energy: 145.6 kWh\n"
+    b"frequency: 50.0 Hz\n"
+    b"hostname: ada-p1-meter\n"
+    b"uptime_seconds: 45240 s\n"
+    b"heap_free: 123456 B\n"
+)
+
+
+def build_bodies(extra_lines):
+    """Return the bodies to benchmark by name."""
+    padding = b"".join(
+        b"firmware_counter_%d: %d units\n" % (index, index) for index in range(extra_lines)
+    )
+    return {
+        "regular": REGULAR_BODY,
+        "large": REGULAR_BODY + padding,
+        "endless_line": b"voltage: " + b"9" * MAX_STATUS_BODY_BYTES,
+        "oversized": REGULAR_BODY * (MAX_STATUS_BODY_BYTES // len(REGULAR_BODY) + 1),
+        "garbage": bytes(range(256)) * 64,
+    }
+
+
+def parse(body):
+    """Parse a body chunk by chunk; return (status or None, longest feed in s)."""
+    decoder = TextStatusDecoder()
+    longest = 0.0
+    try:
+        for start in range(0, len(body), TEXT_CHUNK_SIZE):
+            started = time.perf_counter()
+            decoder.feed(body[start : start + TEXT_CHUNK_SIZE])
+            longest = max(longest, time.perf_counter() - started)
+        return decoder.finish(), longest
+    except ValueError:
+        return None, longest
+
+
+def run(number, extra_lines):
+    """Time every body and return the results."""
+    results = {"chunk_bytes": TEXT_CHUNK_SIZE, "number": number, "bodies": {}}
+    for name, body in build_bodies(extra_lines).items():
+        status, longest = parse(body)
+        seconds = min(timeit.repeat(lambda: parse(body), number=number, repeat=3))
+        results["bodies"][name] = {
+            "body_bytes": len(body),
+            "accepted": status is not None,
+            "per_body_us": round(seconds / number * 1e6, 3),
+            "longest_feed_us": round(longest * 1e6, 3),
+        }
+    return results
+
+
+def main():
+    """Parse the arguments and print the results as JSON."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=2000)
+    parser.add_argument("--extra-lines", type=int, default=5000)
+    args = parser.parse_args()
+    print(json.dumps(run(args.number, args.extra_lines), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,10 @@
+"""Pytest configuration for the Adap1Status benchmarks."""
+import pytest
+
+pytest_plugins = "pytest_homeassistant_custom_component"
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable custom integrations for all benchmarks."""
+    yield
@@ -1,21 +1,39 @@
 """The Adap1Status integration."""
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
-from datetime import timedelta
-from typing import Any
+import re
+import time
+from collections.abc import Callable, Iterable
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
 
 import aiohttp
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers import device_registry as dr, entity_registry as er
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    HomeAssistant,
+    callback,
+    split_entity_id,
+)
+from homeassistant.helpers import (
+    config_validation as cv,
+    device_registry as dr,
+    entity_registry as er,
+)
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
+from homeassistant.util import dt as dt_util, slugify
 
 from .const import (
     DOMAIN,
@@ -24,12 +42,158 @@ from .const import (
     TIMEOUT,
     CONF_PORT,
     CONF_SCAN_INTERVAL,
+    CONF_ADAPTIVE_POLLING,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_MAX_SCAN_INTERVAL,
+    DEFAULT_ADAPTIVE_POLLING,
+    MIN_SCAN_INTERVAL,
+    MAX_SCAN_INTERVAL,
+    CONF_FAILURE_THRESHOLD,
+    CONF_RECOVERY_TIMEOUT,
+    DEFAULT_FAILURE_THRESHOLD,
+    DEFAULT_RECOVERY_TIMEOUT,
+    CONF_MQTT_TOPIC,
+    PUSH_FALLBACK_SCAN_INTERVAL,
+    MQTT_PUSH_TIMEOUT,
+    CONF_STREAMING,
+    DEFAULT_STREAMING,
+    STREAM_ACCEPT,
+    STREAM_PATH,
+    STREAM_READ_TIMEOUT,
+    STREAM_RECONNECT_MIN_DELAY,
+    STREAM_RECONNECT_MAX_DELAY,
+    CONF_STATISTICS_WINDOW,
+    DEFAULT_STATISTICS_WINDOW,
+    CONF_STATISTICS_KEYS,
+    STATISTICS_DEFAULT_KEYS,
+    STATISTICS_ELIGIBLE_KEYS,
+    STATISTICS_CONTEXT_SUFFIX,
+    NUMERIC_SENSOR_TYPES,
+    STATUS_KEYS,
+    SIGNAL_METER_CHANGED,
+    CONF_DEADBANDS,
+    CONF_DEADBAND_MODE,
+    CONF_DEADBAND_THRESHOLD,
+    CONF_DEADBAND_MAX_SILENCE,
+    HEAP_TREND_CONTEXT,
+    REFRESH_DEBOUNCE,
+    STATIC_KEYS,
+    STATIC_REFRESH_INTERVAL,
+    TEXT_CHUNK_SIZE,
+    TEXT_CONTENT_TYPES,
+    CONF_SAMPLE_INTERVAL,
+    DEFAULT_SAMPLE_INTERVAL,
+    CONF_STALE_AFTER,
+    DEFAULT_STALE_AFTER,
+    CONF_HISTORY_SIZE,
+    DEFAULT_HISTORY_SIZE,
+)
+from .adaptive import AdaptivePollInterval
+from .cache import Adap1StatusStateCache
+from .circuit_breaker import CircuitBreaker
+from .deadband import Deadband
+from .downsample import Downsampler
+from .history import HistoryBuffer
+from .metrics import PollMetrics
+from .parser import StreamFrameDecoder, TextStatusDecoder, decode_status
+from .rolling import RollingWindow
+from .scheduler import (
+    Adap1StatusPollScheduler,
+    async_get_scheduler,
+    async_shutdown_scheduler,
 )
+from .services import async_setup_services
+from .session import async_close_session, async_get_session
+from .trend import HeapTrend
+from .websocket_api import async_setup_websocket_api
+
+if TYPE_CHECKING:
+    from homeassistant.components.mqtt import ReceiveMessage
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS = [Platform.SENSOR, Platform.BINARY_SENSOR]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Adap1Status services and WebSocket commands."""
+    async_setup_services(hass)
+    async_setup_websocket_api(hass)
+    return True
+
+
+def _is_customised(entity_entry: er.RegistryEntry) -> bool:
+    """Return True if the user changed a registry entry."""
+    if (
+        entity_entry.name is not None
+        or entity_entry.icon is not None
+        or entity_entry.area_id is not None
+        or entity_entry.aliases
+        or entity_entry.labels
+        or entity_entry.disabled_by is er.RegistryEntryDisabler.USER
+        or entity_entry.hidden_by is er.RegistryEntryHider.USER
+    ):
+        return True
+    if entity_entry.original_name is None:
+        return False
+    # Generated ids are the slugified name, suffixed with a number on a clash
+    generated = slugify(entity_entry.original_name)
+    object_id = split_entity_id(entity_entry.entity_id)[1]
+    return not re.fullmatch(rf"{re.escape(generated)}(_\d+)?", object_id)
+
+
+@callback
+def async_remove_entities(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    keys: Iterable[str],
+    *,
+    keep_customised: bool = False,
+) -> None:
+    """Remove the registry entries of the entry's entities with the given keys.
+
+    With keep_customised, entries the user renamed, moved to an area,
+    disabled or otherwise changed are left alone.
+    """
+    unique_ids = {f"{entry.entry_id}_{key}" for key in keys}
+    ent_reg = er.async_get(hass)
+    for entity_entry in er.async_entries_for_config_entry(ent_reg, entry.entry_id):
+        if entity_entry.unique_id not in unique_ids:
+            continue
+        if keep_customised and _is_customised(entity_entry):
+            _LOGGER.debug("Keeping customised entity %s", entity_entry.entity_id)
+            continue
+        _LOGGER.debug("Removing unused entity %s", entity_entry.entity_id)
+        ent_reg.async_remove(entity_entry.entity_id)
+
+
+@callback
+def async_remove_unreported_entities(
+    hass: HomeAssistant, entry: ConfigEntry, reported: Iterable[str]
+) -> None:
+    """Remove the entities of payload keys the meter does not report.
+
+    Entities are only created for reported keys, but installations set up
+    before that still carry registry entries for every known key. Entries
+    the user customised are kept.
+    """
+    unreported = STATUS_KEYS.difference(reported)
+    async_remove_entities(
+        hass,
+        entry,
+        [
+            *unreported,
+            *(
+                f"{key}_{statistic}"
+                for key in unreported & NUMERIC_SENSOR_TYPES.keys()
+                for statistic in ("min", "mean", "max")
+            ),
+        ],
+        keep_customised=True,
+    )
+
 
 async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Migrate config entry to a newer version.
@@ -37,6 +201,10 @@ async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
     Version 1 → 2: device and entity identifiers changed from CONF_HOST to
     config_entry.entry_id, which is stable across reinstalls and independent
     of the network address of the device.
+
+    Version 2.1 → 2.2: registry entries of payload keys missing from the
+    cached state are removed once. Without a cached state yet, the step
+    waits for a start after the first successful poll.
     """
     _LOGGER.debug(
         "Migrating Adap1Status config entry from version %s", config_entry.version
@@ -75,6 +243,17 @@ async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
             config_entry.entry_id,
         )
 
+    if config_entry.version == 2 and config_entry.minor_version < 2:
+        cache = Adap1StatusStateCache(hass, config_entry.entry_id)
+        if (cached := await cache.async_load()) is None:
+            return True
+        async_remove_unreported_entities(hass, config_entry, cached)
+        hass.config_entries.async_update_entry(config_entry, minor_version=2)
+        _LOGGER.info(
+            "Successfully migrated Adap1Status config entry '%s' to version 2.2",
+            config_entry.entry_id,
+        )
+
     return True
 
 
@@ -84,14 +263,86 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     port = entry.data.get(CONF_PORT, DEFAULT_PORT)
     scan_interval = entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
     
+    adaptive = None
+    if entry.options.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING):
+        adaptive = AdaptivePollInterval(
+            scan_interval,
+            entry.options.get(CONF_MIN_SCAN_INTERVAL, MIN_SCAN_INTERVAL),
+            entry.options.get(CONF_MAX_SCAN_INTERVAL, MAX_SCAN_INTERVAL),
+        )
+    
+    breaker = CircuitBreaker(
+        host,
+        entry.options.get(CONF_FAILURE_THRESHOLD, DEFAULT_FAILURE_THRESHOLD),
+        entry.options.get(CONF_RECOVERY_TIMEOUT, DEFAULT_RECOVERY_TIMEOUT),
+    )
+    
+    deadbands = {
+        key: Deadband(
+            config[CONF_DEADBAND_MODE],
+            config[CONF_DEADBAND_THRESHOLD],
+            config.get(CONF_DEADBAND_MAX_SILENCE, 0),
+        )
+        for key, config in entry.options.get(CONF_DEADBANDS, {}).items()
+        if key in NUMERIC_SENSOR_TYPES
+    }
+    
+    sample_interval = entry.options.get(CONF_SAMPLE_INTERVAL, DEFAULT_SAMPLE_INTERVAL)
+    cache = Adap1StatusStateCache(hass, entry.entry_id)
+    scheduler = async_get_scheduler(hass)
     coordinator = Adap1StatusDataUpdateCoordinator(
-        hass, host, port, timedelta(seconds=scan_interval)
+        hass,
+        host,
+        port,
+        timedelta(seconds=scan_interval),
+        scheduler=scheduler,
+        adaptive=adaptive,
+        breaker=breaker,
+        statistics_window=entry.options.get(
+            CONF_STATISTICS_WINDOW, DEFAULT_STATISTICS_WINDOW
+        ),
+        statistics_keys=entry.options.get(
+            CONF_STATISTICS_KEYS, STATISTICS_DEFAULT_KEYS
+        ),
+        deadbands=deadbands,
+        cache=cache,
+        sample_interval=(
+            timedelta(seconds=sample_interval) if sample_interval else None
+        ),
+        stale_after=entry.options.get(CONF_STALE_AFTER, DEFAULT_STALE_AFTER),
+        history_size=entry.options.get(CONF_HISTORY_SIZE, DEFAULT_HISTORY_SIZE),
     )
     
-    await coordinator.async_config_entry_first_refresh()
+    if (cached := await cache.async_load()) is not None:
+        # Come up from the last known state instead of waiting for the meter
+        coordinator.data = cached
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} first refresh {host}"
+        )
+    else:
+        await coordinator.async_config_entry_first_refresh()
     
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
+    async_dispatcher_send(hass, SIGNAL_METER_CHANGED, entry.entry_id)
+    
+    if topic := entry.options.get(CONF_MQTT_TOPIC):
+        # Waiting for the MQTT client must not hold up the setup
+        async def _async_subscribe_mqtt() -> None:
+            if (unsubscribe := await coordinator.async_subscribe_mqtt(topic)) is not None:
+                entry.async_on_unload(unsubscribe)
+        
+        entry.async_create_background_task(
+            hass, _async_subscribe_mqtt(), f"{DOMAIN} MQTT subscription {host}"
+        )
+    
+    if entry.options.get(CONF_STREAMING, DEFAULT_STREAMING):
+        entry.async_create_background_task(
+            hass, coordinator.async_stream_status(), f"{DOMAIN} status stream {host}"
+        )
+    
+    # The shared scheduler drives the polls instead of a per-entry timer
+    entry.async_on_unload(scheduler.async_register(coordinator))
     
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     
@@ -106,11 +357,28 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator: Adap1StatusDataUpdateCoordinator = hass.data[DOMAIN].pop(
+            entry.entry_id
+        )
+        async_dispatcher_send(hass, SIGNAL_METER_CHANGED, entry.entry_id)
+        if coordinator.cache is not None:
+            await coordinator.cache.async_close()
+        if not hass.data[DOMAIN]:
+            async_shutdown_scheduler(hass)
+            await async_close_session(hass)
     
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the state cache of a removed config entry.
+
+    The entry is unloaded first, which already flushed the cache, so no
+    delayed write is left to recreate the file.
+    """
+    await Adap1StatusStateCache(hass, entry.entry_id).async_remove()
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry when options change."""
     await hass.config_entries.async_reload(entry.entry_id)
@@ -125,35 +393,638 @@ class Adap1StatusDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         host: str,
         port: int,
         update_interval: timedelta,
+        *,
+        scheduler: Adap1StatusPollScheduler | None = None,
+        adaptive: AdaptivePollInterval | None = None,
+        breaker: CircuitBreaker | None = None,
+        statistics_window: int = 0,
+        statistics_keys: Iterable[str] = STATISTICS_DEFAULT_KEYS,
+        deadbands: dict[str, Deadband] | None = None,
+        cache: Adap1StatusStateCache | None = None,
+        sample_interval: timedelta | None = None,
+        stale_after: float = 0,
+        history_size: int = 0,
     ) -> None:
-        """Initialize the coordinator."""
+        """Initialize the coordinator.
+
+        When a scheduler is given it decides when to poll and bounds the
+        number of concurrent requests, so the coordinator does not arm its
+        own update timer. When an adaptive interval is given, it replaces
+        update_interval after every poll. When a circuit breaker is given,
+        polls are skipped without touching the network while it is open.
+        A statistics_window above zero keeps rolling min/mean/max over that
+        many samples for each of statistics_keys. Keys with a deadband are only
+        dispatched once their value changed significantly. When a cache is
+        given, every good payload is handed to it for persisting. With a
+        sample_interval, the meter is polled at that rate instead and the
+        downsampled samples are published every update_interval. Keys that
+        were not reported for stale_after seconds (0 never) are marked stale.
+        A history_size above zero keeps that many raw samples for export.
+        """
         self.host = host
         self.port = port
-        self.session = async_get_clientsession(hass)
+        self.downsampler: Downsampler | None = None
+        self._publish_interval = update_interval.total_seconds()
+        self._sampled_since = 0.0
+        self._latest_sample: dict[str, Any] = {}
+        self._publish_requested = False
+        if sample_interval is not None:
+            self.downsampler = Downsampler()
+            update_interval = sample_interval
+        self.poll_interval = update_interval
+        self._base_interval = update_interval
+        self.session = async_get_session(hass)
+        self._scheduler = scheduler
+        self._adaptive = adaptive
+        self.breaker = breaker
+        # Shared by all entities of the entry, set by the first one created
+        self.device_info: DeviceInfo | None = None
+        self.statistics: dict[str, RollingWindow] = (
+            {
+                key: RollingWindow(statistics_window)
+                for key in statistics_keys
+                if key in STATISTICS_ELIGIBLE_KEYS
+            }
+            if statistics_window > 0
+            else {}
+        )
+        self.history = (
+            HistoryBuffer(history_size, frozenset(NUMERIC_SENSOR_TYPES))
+            if history_size > 0
+            else None
+        )
+        self.cache = cache
+        self.metrics = PollMetrics()
+        # Serialises polls so an on-demand refresh can wait for a running one
+        self._poll_lock = asyncio.Lock()
+        self._polled_at = 0.0
+        self._on_demand_refresh: asyncio.Task[None] | None = None
+        self.heap_trend = HeapTrend()
+        # Keys reported so far, and when each was last reported
+        self._known_keys: set[str] = set()
+        self._key_listeners: list[Callable[[set[str]], None]] = []
+        self._key_seen_at: dict[str, float] = {}
+        self._created_at = time.monotonic()
+        self.stale_after = stale_after
+        self.stale_keys: frozenset[str] = frozenset()
+        self.deadbands = deadbands or {}
+        # When the value of each deadband key was last dispatched
+        self._published_at: dict[str, float] = {}
+        # Listener contexts of derived values that changed since the last
+        # dispatch, on top of the payload keys that changed
+        self._pending_contexts: set[str] = set()
+        # Push channels (MQTT, status stream) currently delivering updates
+        self._push_sources: set[str] = set()
+        self._mqtt_received_at = 0.0
+        self._mqtt_timeout: CALLBACK_TYPE | None = None
+        # Snapshot of the payload (and availability) as last pushed to the
+        # listeners, used to work out which keys actually changed.
+        self._dispatched_data: dict[str, Any] | None = None
+        self._dispatched_success: bool | None = None
+        # When the last good payload (polled or pushed) was applied
+        self.last_update_success_time: datetime | None = None
+        # Static keys are re-published on a reboot or every
+        # STATIC_REFRESH_INTERVAL seconds, see _static_republish_due
+        self._dispatched_uptime: float | None = None
+        self._static_checked_at = 0.0
         
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=update_interval,
+            update_interval=None if scheduler is not None else update_interval,
         )
     
     async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch data, or a sample to downsample, and publish what is due."""
+        if self.downsampler is None:
+            data = await self._async_update_sample()
+            self._record_sample(data)
+            return data
+        
+        try:
+            self._latest_sample = await self._async_update_sample()
+            self.downsampler.add(self._latest_sample)
+        except UpdateFailed:
+            # A missed sample only matters if the whole interval was missed
+            if self.data is None or (
+                self._publish_due() and not self.downsampler.count
+            ):
+                self._sampled_since = time.monotonic()
+                raise
+        
+        if self.data is not None and not self._publish_due():
+            # Same object as before, so nothing is dispatched
+            return self.data
+        
+        self._publish_requested = False
+        self._sampled_since = time.monotonic()
+        data = self.downsampler.flush(self._latest_sample)
+        self._record_sample(data)
+        return data
+
+    def _publish_due(self) -> bool:
+        """Return True if the downsampled values should be published now."""
+        return (
+            self._publish_requested
+            or time.monotonic() - self._sampled_since >= self._publish_interval
+        )
+
+    async def _async_update_sample(self) -> dict[str, Any]:
+        """Poll the meter and adapt the poll interval to the outcome."""
+        # While push updates arrive (or samples are taken at a fixed rate),
+        # polling is not adaptive
+        adaptive = (
+            self._adaptive
+            if not self._push_sources and self.downsampler is None
+            else None
+        )
+        
+        try:
+            async with self._poll_lock:
+                try:
+                    data = await self._async_guarded_poll()
+                finally:
+                    self._polled_at = time.monotonic()
+        except UpdateFailed:
+            if adaptive is not None:
+                self._set_poll_interval(adaptive.failure())
+            raise
+        
+        if adaptive is not None:
+            self._set_poll_interval(adaptive.success(data))
+        if self.history is not None:
+            self.history.add(data)
+        return data
+
+    async def async_refresh_on_demand(self) -> None:
+        """Refresh now on behalf of a caller, sharing requests with others.
+
+        Calls arriving while a refresh is in flight share its request. A poll
+        that is running or finished less than REFRESH_DEBOUNCE seconds ago
+        answers them instead of a new request.
+        """
+        if self._on_demand_refresh is None:
+            self._on_demand_refresh = self.hass.async_create_task(
+                self._async_debounced_refresh(), f"{DOMAIN} refresh {self.host}"
+            )
+        await asyncio.shield(self._on_demand_refresh)
+
+    async def _async_debounced_refresh(self) -> None:
+        """Refresh unless the data is fresh enough already."""
+        try:
+            async with self._poll_lock:
+                # Only waits for a poll that is already running
+                pass
+            # When sampling, publish with the next sample instead of waiting
+            # for the end of the interval
+            self._publish_requested = True
+            if time.monotonic() - self._polled_at < REFRESH_DEBOUNCE:
+                return
+            await self.async_refresh()
+        finally:
+            self._on_demand_refresh = None
+
+    def _record_sample(self, data: dict[str, Any]) -> None:
+        """Feed a new (possibly partial) payload to the derived values."""
+        now = time.monotonic()
+        for key in data:
+            self._key_seen_at[key] = now
+        
+        for key, window in self.statistics.items():
+            value = data.get(key)
+            if isinstance(value, (int, float)) and window.add(value):
+                self._pending_contexts.add(f"{key}{STATISTICS_CONTEXT_SUFFIX}")
+        
+        uptime = data.get("uptime_seconds")
+        heap_free = data.get("heap_free")
+        heap_min_free = data.get("heap_min_free")
+        if (
+            isinstance(uptime, (int, float))
+            and isinstance(heap_free, (int, float))
+            and self.heap_trend.add(
+                uptime,
+                heap_free,
+                heap_min_free if isinstance(heap_min_free, (int, float)) else None,
+            )
+        ):
+            self._pending_contexts.add(HEAP_TREND_CONTEXT)
+
+    async def _async_guarded_poll(self) -> dict[str, Any]:
+        """Poll the meter unless its circuit breaker is open."""
+        breaker = self.breaker
+        if breaker is None:
+            return await self._async_poll()
+        
+        if not breaker.allow_request():
+            raise UpdateFailed(
+                f"Circuit breaker open for {self.host}, "
+                f"next attempt in {breaker.retry_in:.0f} s"
+            )
+        
+        try:
+            data = await self._async_poll()
+        except UpdateFailed:
+            breaker.record_failure()
+            raise
+        
+        breaker.record_success()
+        return data
+
+    async def async_subscribe_mqtt(self, topic: str) -> CALLBACK_TYPE | None:
+        """Apply status messages pushed by the meter over MQTT.
+
+        MQTT only counts as a push source while messages keep arriving: it is
+        dropped after MQTT_PUSH_TIMEOUT seconds of silence or when the broker
+        connection is lost. Returns the unsubscribe callback, or None if MQTT
+        is not set up.
+        """
+        # MQTT is an optional after-dependency, only import it when used
+        from homeassistant.components import mqtt
+        
+        if not await mqtt.async_wait_for_mqtt_client(self.hass):
+            _LOGGER.warning(
+                "MQTT is not available, %s stays on HTTP polling", self.host
+            )
+            return None
+        
+        unsubscribe = await mqtt.async_subscribe(
+            self.hass, topic, self._async_handle_mqtt_message, encoding=None
+        )
+        unsubscribe_status = mqtt.async_subscribe_connection_status(
+            self.hass, self._async_handle_mqtt_connection
+        )
+        _LOGGER.debug("Subscribed to status messages of %s on %s", self.host, topic)
+        
+        @callback
+        def _async_unsubscribe() -> None:
+            unsubscribe()
+            unsubscribe_status()
+            self._async_mqtt_silent()
+        
+        return _async_unsubscribe
+
+    @callback
+    def _async_handle_mqtt_connection(self, connected: bool) -> None:
+        """Fall back to regular polling while the broker is unreachable."""
+        if not connected:
+            self._async_mqtt_silent()
+
+    @callback
+    def _async_mqtt_silent(self) -> None:
+        """Stop counting MQTT as a push source."""
+        if self._mqtt_timeout is not None:
+            self._mqtt_timeout()
+            self._mqtt_timeout = None
+        if "mqtt" in self._push_sources:
+            _LOGGER.debug("No status messages from %s over MQTT", self.host)
+            self._set_push_source("mqtt", False)
+
+    @callback
+    def _async_check_mqtt_timeout(self, _now: datetime) -> None:
+        """Drop MQTT as a push source once it went silent."""
+        self._mqtt_timeout = None
+        silence = time.monotonic() - self._mqtt_received_at
+        if silence < MQTT_PUSH_TIMEOUT:
+            self._mqtt_timeout = async_call_later(
+                self.hass, MQTT_PUSH_TIMEOUT - silence, self._async_check_mqtt_timeout
+            )
+        else:
+            self._async_mqtt_silent()
+
+    @callback
+    def _async_handle_mqtt_message(self, msg: ReceiveMessage) -> None:
+        """Handle a status message received over MQTT."""
+        try:
+            payload = decode_status(msg.payload)
+        except ValueError as err:
+            _LOGGER.debug("Ignoring invalid status message on %s: %s", msg.topic, err)
+            return
+        # A single timer per silence period instead of one per message
+        self._mqtt_received_at = time.monotonic()
+        if self._mqtt_timeout is None:
+            self._mqtt_timeout = async_call_later(
+                self.hass, MQTT_PUSH_TIMEOUT, self._async_check_mqtt_timeout
+            )
+        if "mqtt" not in self._push_sources:
+            self._set_push_source("mqtt", True)
+        self.async_apply_push(payload)
+
+    async def async_stream_status(self) -> None:
+        """Consume the meter's status stream until cancelled.
+
+        The stream is either server-sent events or newline-delimited JSON.
+        Every frame is applied as it arrives; the connection is re-opened with
+        an exponential back-off whenever it drops or cannot be established.
+        The loop ends once the shared session is closed.
+        """
+        url = f"http://{self.host}:{self.port}{STREAM_PATH}"
+        timeout = aiohttp.ClientTimeout(
+            total=None, sock_connect=TIMEOUT, sock_read=STREAM_READ_TIMEOUT
+        )
+        delay = STREAM_RECONNECT_MIN_DELAY
+        
+        while not self.session.closed:
+            try:
+                async with self.session.get(
+                    url, timeout=timeout, headers={aiohttp.hdrs.ACCEPT: STREAM_ACCEPT}
+                ) as response:
+                    if response.status != 200:
+                        raise aiohttp.ClientResponseError(
+                            response.request_info,
+                            response.history,
+                            status=response.status,
+                            message=f"HTTP {response.status} from {url}",
+                        )
+                    
+                    _LOGGER.debug("Status stream of %s connected", self.host)
+                    self._set_push_source("stream", True)
+                    delay = STREAM_RECONNECT_MIN_DELAY
+                    decoder = StreamFrameDecoder()
+                    async for chunk in response.content.iter_any():
+                        for frame in decoder.feed(chunk):
+                            try:
+                                payload = decode_status(frame)
+                            except ValueError as err:
+                                _LOGGER.debug(
+                                    "Ignoring invalid stream frame from %s: %s",
+                                    self.host,
+                                    err,
+                                )
+                                continue
+                            self.async_apply_push(payload)
+            except (aiohttp.ClientError, TimeoutError, ValueError) as err:
+                _LOGGER.debug("Status stream of %s unavailable: %s", self.host, err)
+            except RuntimeError:
+                # aiohttp refuses requests on a closed session with a RuntimeError
+                if not self.session.closed:
+                    raise
+            
+            self._set_push_source("stream", False)
+            if self.session.closed:
+                break
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, STREAM_RECONNECT_MAX_DELAY)
+        
+        _LOGGER.debug("Status stream of %s stopped, session closed", self.host)
+
+    @property
+    def push_sources(self) -> frozenset[str]:
+        """Return the push channels currently delivering updates."""
+        return frozenset(self._push_sources)
+
+    def _set_push_source(self, source: str, active: bool) -> None:
+        """Track a push channel; while any is active, poll only as a fallback."""
+        if active:
+            self._push_sources.add(source)
+        else:
+            self._push_sources.discard(source)
+        
+        interval = self._base_interval
+        if self._push_sources:
+            interval = max(interval, timedelta(seconds=PUSH_FALLBACK_SCAN_INTERVAL))
+        self._set_poll_interval(interval)
+
+    @callback
+    def async_apply_push(self, payload: dict[str, Any]) -> None:
+        """Merge a pushed, possibly partial, payload and notify the listeners."""
+        if self.breaker is not None:
+            # The meter just proved it is alive
+            self.breaker.record_success()
+        if self.history is not None:
+            self.history.add(payload)
+        self._record_sample(payload)
+        self.async_set_updated_data({**(self.data or {}), **payload})
+
+    def _set_poll_interval(self, interval: timedelta) -> None:
+        """Apply a new poll interval to whichever timer drives the polls."""
+        if interval != self.poll_interval:
+            _LOGGER.debug("Polling %s every %s", self.host, interval)
+        self.poll_interval = interval
+        if self._scheduler is None:
+            self.update_interval = interval
+
+    async def _async_poll(self) -> dict[str, Any]:
         """Fetch data from ADA-P1 Meter JSON API."""
         url = f"http://{self.host}:{self.port}/status"
         
         try:
-            async with self.session.get(
-                url, timeout=aiohttp.ClientTimeout(total=TIMEOUT)
-            ) as response:
-                if response.status != 200:
-                    raise UpdateFailed(f"HTTP {response.status} from {url}")
-                
-                data = await response.json()
-                _LOGGER.debug("Successfully fetched data from %s: %s", url, data)
-                return data
+            async with self._request_slot():
+                try:
+                    data = await self._async_fetch(url)
+                except aiohttp.ServerDisconnectedError:
+                    # The meter closed the pooled keep-alive connection
+                    # between polls; retry once on a fresh connection.
+                    _LOGGER.debug("Keep-alive connection to %s was closed, retrying", url)
+                    data = await self._async_fetch(url)
+            
+            _LOGGER.debug(
+                "Fetched %s bytes from %s in %s ms",
+                self.metrics.payload_bytes,
+                url,
+                self.metrics.latency,
+            )
+            return data
                 
+        except UpdateFailed:
+            raise
+        except TimeoutError as err:
+            self.metrics.record_failure("timeout")
+            raise UpdateFailed(f"Timeout communicating with API at {url}") from err
         except aiohttp.ClientError as err:
+            self.metrics.record_failure("connection")
             raise UpdateFailed(f"Error communicating with API at {url}: {err}") from err
+        except ValueError as err:
+            self.metrics.record_failure("invalid_payload")
+            raise UpdateFailed(f"Invalid payload received from {url}: {err}") from err
         except Exception as err:
+            self.metrics.record_failure("unexpected")
             raise UpdateFailed(f"Unexpected error fetching data from {url}: {err}") from err
+
+    async def _async_fetch(self, url: str) -> dict[str, Any]:
+        """Perform a single status request and record its metrics."""
+        started = time.perf_counter()
+        async with self.session.get(
+            url, timeout=aiohttp.ClientTimeout(total=TIMEOUT)
+        ) as response:
+            if response.status != 200:
+                self.metrics.record_failure(f"http_{response.status}")
+                raise UpdateFailed(f"HTTP {response.status} from {url}")
+            if response.content_type in TEXT_CONTENT_TYPES:
+                return await self._async_read_text(response, started)
+            body = await response.read()
+        
+        # Decode the raw body straight into the known keys
+        received = time.perf_counter()
+        data = decode_status(body)
+        self.metrics.record_success(
+            received - started, len(body), time.perf_counter() - received
+        )
+        return data
+
+    async def _async_read_text(
+        self, response: aiohttp.ClientResponse, started: float
+    ) -> dict[str, Any]:
+        """Parse a plain-text status body line by line as it arrives."""
+        decoder = TextStatusDecoder()
+        decode_time = 0.0
+        async for chunk in response.content.iter_chunked(TEXT_CHUNK_SIZE):
+            decode_started = time.perf_counter()
+            decoder.feed(chunk)
+            decode_time += time.perf_counter() - decode_started
+        
+        decode_started = time.perf_counter()
+        data = decoder.finish()
+        finished = time.perf_counter()
+        decode_time += finished - decode_started
+        self.metrics.record_success(
+            finished - started - decode_time, decoder.size, decode_time
+        )
+        return data
+
+    def _request_slot(self) -> contextlib.AbstractAsyncContextManager[None]:
+        """Return the context that bounds concurrent requests, if any."""
+        if self._scheduler is None:
+            return contextlib.nullcontext()
+        return self._scheduler.async_request_slot()
+
+    def changed_keys(self, data: dict[str, Any]) -> set[str]:
+        """Return the keys whose value differs from the last dispatched payload.
+
+        Changes of keys with a deadband that are too small to matter are left
+        out, so the dispatched value stays as it is.
+        """
+        previous = self._dispatched_data or {}
+        changed = {
+            key
+            for key in data.keys() | previous.keys()
+            if data.get(key) != previous.get(key)
+        }
+        if not self.deadbands:
+            return changed
+        
+        now = time.monotonic()
+        for key in changed & self.deadbands.keys():
+            value, published = data.get(key), previous.get(key)
+            if (
+                isinstance(value, (int, float))
+                and isinstance(published, (int, float))
+                and not self.deadbands[key].is_significant(
+                    published, value, now - self._published_at.get(key, 0.0)
+                )
+            ):
+                changed.discard(key)
+        return changed
+
+    def _mark_dispatched(self, data: dict[str, Any], changed: set[str] | None) -> None:
+        """Remember what the listeners have seen, all of data if changed is None."""
+        snapshot = dict(data)
+        now = time.monotonic()
+        previous = self._dispatched_data or {}
+        for key in self.deadbands:
+            if changed is None or key in changed:
+                self._published_at[key] = now
+            elif key in previous:
+                # Keep comparing against the value the entity still shows
+                snapshot[key] = previous[key]
+        self._dispatched_data = snapshot
+
+    def _static_republish_due(self, data: dict[str, Any]) -> bool:
+        """Return whether the static keys should be re-published, changed or not.
+
+        That is the case after a reboot of the meter (uptime went down) and
+        every STATIC_REFRESH_INTERVAL seconds.
+        """
+        uptime = data.get("uptime_seconds")
+        rebooted = False
+        if isinstance(uptime, (int, float)):
+            rebooted = (
+                isinstance(self._dispatched_uptime, (int, float))
+                and uptime < self._dispatched_uptime
+            )
+            self._dispatched_uptime = uptime
+        
+        now = time.monotonic()
+        due = rebooted or now - self._static_checked_at >= STATIC_REFRESH_INTERVAL
+        if due:
+            self._static_checked_at = now
+        return due
+
+    @callback
+    def async_track_keys(
+        self, key_callback: Callable[[set[str]], None]
+    ) -> CALLBACK_TYPE:
+        """Report the keys seen so far, then every new one as it first appears.
+        
+        Returns a callback that stops reporting new keys.
+        """
+        self._known_keys.update(self.data or {})
+        key_callback(set(self._known_keys))
+        self._key_listeners.append(key_callback)
+        
+        @callback
+        def _async_remove_listener() -> None:
+            self._key_listeners.remove(key_callback)
+        
+        return _async_remove_listener
+
+    def _update_key_tracking(self, data: dict[str, Any]) -> set[str]:
+        """Report new keys and return the keys whose staleness flipped."""
+        if new_keys := data.keys() - self._known_keys:
+            self._known_keys |= new_keys
+            for key_callback in list(self._key_listeners):
+                key_callback(new_keys)
+        
+        if not self.stale_after:
+            return set()
+        now = time.monotonic()
+        stale = frozenset(
+            key
+            for key in self._known_keys
+            if now - self._key_seen_at.get(key, self._created_at) >= self.stale_after
+        )
+        flipped = stale ^ self.stale_keys
+        if flipped:
+            _LOGGER.debug("Stale keys of %s are now %s", self.host, sorted(stale))
+        self.stale_keys = stale
+        return set(flipped)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify only the listeners whose key changed since the last dispatch.
+
+        Entities register with their sensor key as listener context. Listeners
+        without a context (and every listener when availability flips or on
+        the very first dispatch) are always notified. Static keys are also
+        re-published unchanged after a reboot and periodically. Good payloads
+        are also handed to the state cache and checked for new and stale
+        keys.
+        """
+        data = self.data or {}
+        if self.last_update_success and data:
+            self.last_update_success_time = dt_util.utcnow()
+            if self.cache is not None:
+                self.cache.async_schedule_save(data)
+            self._pending_contexts |= self._update_key_tracking(data)
+        pending, self._pending_contexts = self._pending_contexts, set()
+        if (
+            self._dispatched_data is None
+            or self.last_update_success != self._dispatched_success
+        ):
+            self._mark_dispatched(data, None)
+            self._dispatched_success = self.last_update_success
+            self._dispatched_uptime = data.get("uptime_seconds")
+            self._static_checked_at = time.monotonic()
+            super().async_update_listeners()
+            return
+
+        changed = self.changed_keys(data) | pending
+        if self._static_republish_due(data):
+            changed |= STATIC_KEYS
+        self._mark_dispatched(data, changed)
+        if not changed:
+            return
+
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or context in changed:
+                update_callback()
@@ -0,0 +1,72 @@
+"""Adaptive poll interval for the Adap1Status integration."""
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+
+from .const import (
+    ACTIVITY_KEYS,
+    ADAPTIVE_FAILURE_BACKOFF,
+    ADAPTIVE_STABLE_BACKOFF,
+)
+
+
+class AdaptivePollInterval:
+    """Derive the next poll interval from device activity and reachability.
+
+    - Active meter (ack_items changed or serial_recent_sec went down, i.e. a
+      new serial frame arrived): poll at the minimum interval.
+    - Stable values: back off by ADAPTIVE_STABLE_BACKOFF per poll.
+    - Unreachable meter: back off exponentially by ADAPTIVE_FAILURE_BACKOFF.
+
+    The result always stays within the configured minimum and maximum.
+    """
+
+    def __init__(self, base: float, minimum: float, maximum: float) -> None:
+        """Initialize the adaptive interval."""
+        self.minimum = minimum
+        self.maximum = maximum
+        self.base = self._clamp(base)
+        self.current = self.base
+        self.failures = 0
+        self._activity: dict[str, Any] | None = None
+
+    def _clamp(self, seconds: float) -> float:
+        """Keep an interval inside the configured bounds."""
+        return max(self.minimum, min(self.maximum, seconds))
+
+    def _is_active(self, data: dict[str, Any]) -> bool:
+        """Return True if the activity keys moved since the previous poll."""
+        previous = self._activity
+        if previous is None:
+            return False
+        serial_recent = data.get("serial_recent_sec")
+        previous_serial = previous.get("serial_recent_sec")
+        if (
+            isinstance(serial_recent, (int, float))
+            and isinstance(previous_serial, (int, float))
+            and serial_recent < previous_serial
+        ):
+            return True
+        return data.get("ack_items") != previous.get("ack_items")
+
+    def success(self, data: dict[str, Any]) -> timedelta:
+        """Record a successful poll and return the next interval."""
+        if self._is_active(data):
+            self.current = self.minimum
+        elif self.failures:
+            # Reachable again: resume from the configured interval
+            self.current = self.base
+        else:
+            self.current = self._clamp(self.current * ADAPTIVE_STABLE_BACKOFF)
+        self.failures = 0
+        self._activity = {key: data.get(key) for key in ACTIVITY_KEYS}
+        return timedelta(seconds=self.current)
+
+    def failure(self) -> timedelta:
+        """Record a failed poll and return the next interval."""
+        self.failures += 1
+        self.current = self._clamp(
+            max(self.current, self.base) * ADAPTIVE_FAILURE_BACKOFF
+        )
+        return timedelta(seconds=self.current)
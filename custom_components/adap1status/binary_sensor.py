@@ -1,21 +1,61 @@
 """Binary sensor platform for Adap1Status integration."""
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
 import logging
 from typing import Any
 
-from homeassistant.components.binary_sensor import BinarySensorEntity
+from homeassistant.components.binary_sensor import (
+    BinarySensorEntity,
+    BinarySensorEntityDescription,
+)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import Adap1StatusDataUpdateCoordinator
 from .const import DOMAIN, DEFAULT_NAME, BINARY_SENSOR_TYPES
+from .entity import Adap1StatusEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+_TRUE_STRINGS = frozenset(("true", "1", "on", "yes"))
+
+
+@dataclass(frozen=True, kw_only=True)
+class Adap1StatusBinarySensorEntityDescription(BinarySensorEntityDescription):
+    """Describes an Adap1Status binary sensor backed by a payload key."""
+    
+    value_fn: Callable[[Any], bool | None]
+
+
+def _to_bool(value: Any) -> bool | None:
+    """Convert various true/false representations to boolean."""
+    if value is None or isinstance(value, bool):
+        return value
+    
+    if isinstance(value, str):
+        return value.lower() in _TRUE_STRINGS
+    
+    if isinstance(value, (int, float)):
+        return bool(value)
+    
+    return None
+
+
+# The const table is compiled once at import time
+BINARY_SENSOR_DESCRIPTIONS: dict[str, Adap1StatusBinarySensorEntityDescription] = {
+    sensor_key: Adap1StatusBinarySensorEntityDescription(
+        key=sensor_key,
+        name=f"{DEFAULT_NAME} {sensor_info['name']}",
+        icon=sensor_info["icon"],
+        device_class=sensor_info["device_class"],
+        value_fn=_to_bool,
+    )
+    for sensor_key, sensor_info in BINARY_SENSOR_TYPES.items()
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -27,19 +67,34 @@ async def async_setup_entry(
         config_entry.entry_id
     ]
     
-    entities: list[BinarySensorEntity] = []
-    
-    # Add binary sensors
-    for sensor_key in BINARY_SENSOR_TYPES:
-        entities.append(Adap1StatusBinarySensor(coordinator, sensor_key, config_entry))
+    @callback
+    def _async_add_key_sensors(keys: set[str]) -> None:
+        """Add the binary sensors of keys the meter reported for the first time."""
+        entities: list[BinarySensorEntity] = []
+        
+        # Add binary sensors
+        for sensor_key in BINARY_SENSOR_DESCRIPTIONS:
+            if sensor_key not in keys:
+                continue
+            entities.append(
+                Adap1StatusBinarySensor(coordinator, sensor_key, config_entry)
+            )
+        
+        if entities:
+            async_add_entities(entities)
     
-    async_add_entities(entities)
+    # Binary sensors are only created once the meter reports their key
+    config_entry.async_on_unload(coordinator.async_track_keys(_async_add_key_sensors))
 
 
-class Adap1StatusBinarySensor(
-    CoordinatorEntity[Adap1StatusDataUpdateCoordinator], BinarySensorEntity
-):
-    """Representation of an Adap1Status binary sensor."""
+class Adap1StatusBinarySensor(Adap1StatusEntity, BinarySensorEntity):
+    """Representation of an Adap1Status binary sensor.
+    
+    The value is converted once per coordinator update instead of on every
+    state read.
+    """
+    
+    entity_description: Adap1StatusBinarySensorEntityDescription
     
     def __init__(
         self,
@@ -48,50 +103,26 @@ class Adap1StatusBinarySensor(
         config_entry: ConfigEntry,
     ) -> None:
         """Initialize the binary sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, sensor_key, config_entry, sensor_key)
+        self.entity_description = BINARY_SENSOR_DESCRIPTIONS[sensor_key]
         self._sensor_key = sensor_key
-        self._config_entry = config_entry
-        
-        sensor_info = BINARY_SENSOR_TYPES[sensor_key]
-        self._attr_name = f"{DEFAULT_NAME} {sensor_info['name']}"
-        self._attr_device_class = sensor_info["device_class"]
-        self._attr_icon = sensor_info["icon"]
-        
-        # Use the config entry's entry_id as the stable device/entity identifier.
-        # This is assigned once at setup and never changes, regardless of the
-        # device's network address or any runtime value returned by the device.
-        device_id = self._config_entry.entry_id
-        self._attr_unique_id = f"{device_id}_{sensor_key}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, device_id)},
-            name=DEFAULT_NAME,
-            manufacturer="ADA",
-            model="ADA-P1Meter",
-        )
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if the binary sensor is on."""
-        if self.coordinator.data is None:
-            return None
-        
-        value = self.coordinator.data.get(self._sensor_key)
-        if value is None:
-            return None
-        
-        # Convert various true/false representations to boolean
-        if isinstance(value, bool):
-            return value
-        
-        if isinstance(value, str):
-            return value.lower() in ("true", "1", "on", "yes")
-        
-        if isinstance(value, (int, float)):
-            return bool(value)
-        
-        return None
+        self._update_is_on()
     
     @property
     def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.last_update_success
+        """Return False once the meter stopped reporting the sensor's key."""
+        return (
+            super().available and self._sensor_key not in self.coordinator.stale_keys
+        )
+    
+    def _update_is_on(self) -> None:
+        """Convert the current payload value of the sensor's key."""
+        data = self.coordinator.data
+        value = data.get(self._sensor_key) if data is not None else None
+        self._attr_is_on = self.entity_description.value_fn(value)
+    
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_is_on()
+        super()._handle_coordinator_update()
@@ -0,0 +1,97 @@
+"""Bulk import of ADA-P1 meters."""
+from __future__ import annotations
+
+import asyncio
+import csv
+from pathlib import Path
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant import config_entries
+from homeassistant.const import CONF_HOST, CONF_NAME
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+import homeassistant.helpers.config_validation as cv
+from homeassistant.util.yaml import load_yaml
+
+from .config_flow import validate_input
+from .const import CONF_PORT, DEFAULT_PORT, DOMAIN, IMPORT_CONCURRENCY
+
+METER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_HOST): vol.All(cv.string, vol.Strip, vol.Length(min=1)),
+        vol.Optional(CONF_PORT, default=DEFAULT_PORT): vol.All(vol.Coerce(int), cv.port),
+        vol.Optional(CONF_NAME, default=""): vol.Any(None, cv.string),
+    }
+)
+
+
+def load_meter_file(path: str) -> list[Any]:
+    """Read the meters listed in a CSV or YAML file.
+
+    A CSV file has a header row with a host column and optional port and
+    name columns. A YAML file holds a list of hosts or of mappings with the
+    same keys. Rows are returned as read; they are validated on import.
+    """
+    if Path(path).suffix.lower() == ".csv":
+        with open(path, encoding="utf-8", newline="") as file:
+            return [
+                {key: value for key, value in row.items() if value}
+                for row in csv.DictReader(file)
+            ]
+    
+    data = load_yaml(path)
+    if not isinstance(data, list):
+        raise ValueError(f"{path} does not contain a list of meters")
+    return [{CONF_HOST: row} if isinstance(row, str) else row for row in data]
+
+
+async def async_import_meters(
+    hass: HomeAssistant, rows: list[Any]
+) -> dict[str, Any]:
+    """Validate meters concurrently and create an entry for each good one.
+
+    Meters that are already configured are skipped without being contacted.
+    At most IMPORT_CONCURRENCY meters are validated at a time, all over the
+    integration's shared session. Returns a summary with the hosts added and
+    skipped and the reason each failed one was rejected.
+    """
+    summary: dict[str, Any] = {"added": [], "already_configured": [], "failed": {}}
+    configured = {
+        entry.unique_id for entry in hass.config_entries.async_entries(DOMAIN)
+    }
+    meters: dict[str, dict[str, Any]] = {}
+    for index, row in enumerate(rows):
+        try:
+            meter = METER_SCHEMA(row)
+        except vol.Invalid as err:
+            summary["failed"][f"row {index + 1}"] = str(err)
+            continue
+        meter[CONF_NAME] = meter[CONF_NAME] or ""
+        unique_id = meter[CONF_HOST].lower()
+        if unique_id in configured or unique_id in meters:
+            summary["already_configured"].append(meter[CONF_HOST])
+        else:
+            meters[unique_id] = meter
+    
+    semaphore = asyncio.Semaphore(IMPORT_CONCURRENCY)
+    
+    async def _async_import(meter: dict[str, Any]) -> None:
+        """Validate a single meter and start its import flow."""
+        async with semaphore:
+            try:
+                await validate_input(hass, meter)
+            except ConnectionError as err:
+                summary["failed"][meter[CONF_HOST]] = str(err)
+                return
+        result = await hass.config_entries.flow.async_init(
+            DOMAIN, context={"source": config_entries.SOURCE_IMPORT}, data=meter
+        )
+        if result["type"] == FlowResultType.CREATE_ENTRY:
+            summary["added"].append(meter[CONF_HOST])
+        else:
+            summary["already_configured"].append(meter[CONF_HOST])
+    
+    await asyncio.gather(*(_async_import(meter) for meter in meters.values()))
+    return summary
@@ -0,0 +1,73 @@
+"""Last-known-state cache for the Adap1Status integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import CACHE_SAVE_DELAY, DOMAIN, STATUS_KEYS
+
+STORAGE_VERSION = 1
+
+
+class Adap1StatusStateCache:
+    """Persist the last good payload of a config entry.
+
+    On the next start, the entities come up from the cached payload while the
+    first poll of the meter runs in the background. Writes are throttled to
+    at most one every CACHE_SAVE_DELAY seconds; whatever is pending is
+    flushed when Home Assistant stops or the entry is unloaded.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the cache."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}"
+        )
+        self._data: dict[str, Any] = {}
+        self._save_pending = False
+        self._closed = False
+
+    async def async_load(self) -> dict[str, Any] | None:
+        """Return the cached payload, or None if there is none."""
+        if not (stored := await self._store.async_load()):
+            return None
+        # Drop keys a newer version of the integration no longer knows
+        return {
+            key: value for key, value in stored["data"].items() if key in STATUS_KEYS
+        }
+
+    @callback
+    def async_schedule_save(self, data: dict[str, Any]) -> None:
+        """Remember data and write it once the save delay has passed."""
+        if self._closed:
+            return
+        self._data = data
+        # async_delay_save restarts its timer on every call, which would
+        # postpone the write forever while updates keep arriving
+        if not self._save_pending:
+            self._save_pending = True
+            self._store.async_delay_save(self._data_to_save, CACHE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the payload to write."""
+        self._save_pending = False
+        return {"data": self._data}
+
+    async def async_close(self) -> None:
+        """Write a pending save right away and stop accepting new ones.
+
+        Afterwards no delayed write can recreate the file once the entry is
+        removed.
+        """
+        self._closed = True
+        if self._save_pending:
+            self._save_pending = False
+            # Also cancels the delayed write
+            await self._store.async_save({"data": self._data})
+
+    async def async_remove(self) -> None:
+        """Delete the cache."""
+        await self._store.async_remove()
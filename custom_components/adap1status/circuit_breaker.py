@@ -0,0 +1,91 @@
+"""Circuit breaker for unreachable ADA-P1 meters."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from enum import StrEnum
+import logging
+import time
+
+from homeassistant.core import CALLBACK_TYPE, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CircuitState(StrEnum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Per-device circuit breaker.
+
+    After failure_threshold consecutive failures the circuit opens and
+    requests are skipped without touching the network. Once
+    recovery_timeout seconds have passed, a single probe request is let
+    through (half-open): success closes the circuit, failure re-opens it.
+    """
+
+    def __init__(
+        self, name: str, failure_threshold: int, recovery_timeout: float
+    ) -> None:
+        """Initialize the circuit breaker."""
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._listeners: list[Callable[[], None]] = []
+
+    @property
+    def retry_in(self) -> float:
+        """Return the seconds left until the next probe is allowed."""
+        if self.state is not CircuitState.OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.recovery_timeout - time.monotonic())
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> CALLBACK_TYPE:
+        """Listen for state transitions; return a callback that stops listening."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def _async_remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return _async_remove_listener
+
+    def _set_state(self, state: CircuitState) -> None:
+        """Switch to a new state and notify the listeners."""
+        if state is self.state:
+            return
+        _LOGGER.info("Circuit breaker for %s is now %s", self.name, state)
+        self.state = state
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    def allow_request(self) -> bool:
+        """Return True if a request may be sent now."""
+        if self.state is CircuitState.OPEN:
+            if self.retry_in > 0:
+                return False
+            self._set_state(CircuitState.HALF_OPEN)
+        return True
+
+    def record_success(self) -> None:
+        """Record a successful request."""
+        self.failures = 0
+        self._set_state(CircuitState.CLOSED)
+
+    def record_failure(self) -> None:
+        """Record a failed request."""
+        self.failures += 1
+        if (
+            self.state is CircuitState.HALF_OPEN
+            or self.failures >= self.failure_threshold
+        ):
+            self._opened_at = time.monotonic()
+            self._set_state(CircuitState.OPEN)
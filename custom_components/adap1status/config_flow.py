@@ -21,7 +21,51 @@ from .const import (
     TIMEOUT,
     CONF_PORT,
     CONF_SCAN_INTERVAL,
+    CONF_ADAPTIVE_POLLING,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_MAX_SCAN_INTERVAL,
+    DEFAULT_ADAPTIVE_POLLING,
+    MIN_SCAN_INTERVAL,
+    MAX_SCAN_INTERVAL,
+    CONF_FAILURE_THRESHOLD,
+    CONF_RECOVERY_TIMEOUT,
+    DEFAULT_FAILURE_THRESHOLD,
+    DEFAULT_RECOVERY_TIMEOUT,
+    CONF_MQTT_TOPIC,
+    CONF_STREAMING,
+    DEFAULT_STREAMING,
+    CONF_STATISTICS_WINDOW,
+    DEFAULT_STATISTICS_WINDOW,
+    MAX_STATISTICS_WINDOW,
+    CONF_STATISTICS_KEYS,
+    STATISTICS_DEFAULT_KEYS,
+    STATISTICS_ELIGIBLE_KEYS,
+    CONF_DEADBANDS,
+    CONF_CONFIGURE_DEADBAND,
+    CONF_DEADBAND_SENSOR,
+    CONF_DEADBAND_MODE,
+    CONF_DEADBAND_THRESHOLD,
+    CONF_DEADBAND_MAX_SILENCE,
+    DEADBAND_MODE_ABSOLUTE,
+    DEADBAND_MODE_RELATIVE,
+    MAX_DEADBAND_SILENCE,
+    NUMERIC_SENSOR_TYPES,
+    CONF_NETWORK,
+    CONF_METERS,
+    TEXT_CONTENT_TYPES,
+    CONF_SAMPLE_INTERVAL,
+    DEFAULT_SAMPLE_INTERVAL,
+    MAX_SAMPLE_INTERVAL,
+    CONF_STALE_AFTER,
+    DEFAULT_STALE_AFTER,
+    MAX_STALE_AFTER,
+    CONF_HISTORY_SIZE,
+    DEFAULT_HISTORY_SIZE,
+    MAX_HISTORY_SIZE,
 )
+from .discovery import DiscoveredMeter, async_discover_meters
+from .parser import decode_status, decode_text_status
+from .session import async_get_session
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -43,40 +87,56 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     port = data.get(CONF_PORT, DEFAULT_PORT)
     url = f"http://{host}:{port}/status"
     
-    # Try to connect to the device
-    session = aiohttp.ClientSession()
+    # Try to connect to the device over the integration-owned connection pool
+    session = async_get_session(hass)
     try:
         async with session.get(url, timeout=aiohttp.ClientTimeout(total=TIMEOUT)) as response:
             if response.status != 200:
                 raise ConnectionError(f"Device returned HTTP {response.status}")
             
-            # Try to parse as JSON
-            await response.json()
+            # Try to parse as JSON, or the plain-text key/value format
+            body = await response.read()
+            if response.content_type in TEXT_CONTENT_TYPES:
+                decode_text_status(body)
+            else:
+                decode_status(body)
             
     except aiohttp.ClientError as err:
         raise ConnectionError(f"Cannot connect to device: {err}") from err
     except Exception as err:
         raise ConnectionError(f"Unexpected error: {err}") from err
-    finally:
-        await session.close()
     
-    # If name is empty, use default with host
+    return {"title": entry_title(data)}
+
+
+def entry_title(data: dict[str, Any]) -> str:
+    """Return the title of an entry, the default name with the host if unnamed."""
     name = data.get(CONF_NAME, "").strip()
     if not name:
-        name = f"{DEFAULT_NAME} ({host})"
-    
-    return {"title": name}
+        name = f"{DEFAULT_NAME} ({data[CONF_HOST]})"
+    return name
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Adap1Status."""
 
     VERSION = 2
+    MINOR_VERSION = 2
+
+    def __init__(self) -> None:
+        """Initialize the config flow."""
+        self._discovered: dict[str, DiscoveredMeter] = {}
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
-        """Handle the initial step."""
+        """Let the user add a meter by hand or scan a network for meters."""
+        return self.async_show_menu(step_id="user", menu_options=["manual", "scan"])
+
+    async def async_step_manual(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle a meter entered by hand."""
         errors: dict[str, str] = {}
         
         if user_input is not None:
@@ -98,8 +158,97 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 return self.async_create_entry(title=info["title"], data=user_input)
 
         return self.async_show_form(
-            step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+            step_id="manual", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
         )
+
+    async def async_step_scan(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Scan a network for meters that are not configured yet."""
+        errors: dict[str, str] = {}
+        
+        if user_input is not None:
+            try:
+                meters = await async_discover_meters(
+                    async_get_session(self.hass),
+                    user_input[CONF_NETWORK],
+                    user_input[CONF_PORT],
+                )
+            except ValueError:
+                errors[CONF_NETWORK] = "invalid_network"
+            else:
+                configured = self._async_current_ids()
+                self._discovered = {
+                    meter.host: meter
+                    for meter in meters
+                    if meter.host not in configured
+                }
+                if self._discovered:
+                    return await self.async_step_scan_select()
+                errors["base"] = "no_devices_found"
+        
+        return self.async_show_form(
+            step_id="scan",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_NETWORK): cv.string,
+                    vol.Optional(CONF_PORT, default=DEFAULT_PORT): cv.port,
+                }
+            ),
+            errors=errors,
+        )
+
+    async def async_step_scan_select(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Add the meters picked from the scan results.
+
+        This flow creates the entry of the first meter; the others are added
+        through import flows of their own.
+        """
+        if user_input is not None and user_input[CONF_METERS]:
+            first, *others = (
+                self._discovered[host] for host in user_input[CONF_METERS]
+            )
+            for meter in others:
+                self.hass.async_create_task(
+                    self.hass.config_entries.flow.async_init(
+                        DOMAIN,
+                        context={"source": config_entries.SOURCE_IMPORT},
+                        data={CONF_HOST: meter.host, CONF_PORT: meter.port},
+                    )
+                )
+            return await self.async_step_import(
+                {CONF_HOST: first.host, CONF_PORT: first.port}
+            )
+        
+        return self.async_show_form(
+            step_id="scan_select",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_METERS, default=list(self._discovered)
+                    ): cv.multi_select(
+                        {
+                            host: f"{meter.hostname} ({host})"
+                            for host, meter in self._discovered.items()
+                        }
+                    ),
+                }
+            ),
+            description_placeholders={"count": str(len(self._discovered))},
+        )
+
+    async def async_step_import(self, import_data: dict[str, Any]) -> FlowResult:
+        """Create an entry for a meter that has already been validated."""
+        data = {
+            CONF_HOST: import_data[CONF_HOST].strip(),
+            CONF_PORT: import_data.get(CONF_PORT, DEFAULT_PORT),
+            CONF_NAME: import_data.get(CONF_NAME, ""),
+        }
+        await self.async_set_unique_id(data[CONF_HOST].lower())
+        self._abort_if_unique_id_configured()
+        return self.async_create_entry(title=entry_title(data), data=data)
     
     @staticmethod
     @callback
@@ -116,24 +265,166 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
         """Initialize options flow."""
         self.config_entry = config_entry
+        self._options: dict[str, Any] = {}
     
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Manage the options."""
+        errors: dict[str, str] = {}
+        
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            if user_input.get(
+                CONF_MIN_SCAN_INTERVAL, MIN_SCAN_INTERVAL
+            ) > user_input.get(CONF_MAX_SCAN_INTERVAL, MAX_SCAN_INTERVAL):
+                errors["base"] = "invalid_interval_bounds"
+            else:
+                configure_deadband = user_input.pop(CONF_CONFIGURE_DEADBAND, False)
+                self._options = {
+                    **user_input,
+                    CONF_DEADBANDS: dict(
+                        self.config_entry.options.get(CONF_DEADBANDS, {})
+                    ),
+                }
+                if configure_deadband:
+                    return await self.async_step_deadband()
+                return self.async_create_entry(title="", data=self._options)
         
+        options = self.config_entry.options
+        interval_range = vol.All(
+            cv.positive_int, vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL)
+        )
         return self.async_show_form(
             step_id="init",
             data_schema=vol.Schema(
                 {
                     vol.Optional(
                         CONF_SCAN_INTERVAL,
-                        default=self.config_entry.options.get(
-                            CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
+                        default=options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+                    ): interval_range,
+                    vol.Optional(
+                        CONF_ADAPTIVE_POLLING,
+                        default=options.get(
+                            CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
+                        ),
+                    ): cv.boolean,
+                    vol.Optional(
+                        CONF_MIN_SCAN_INTERVAL,
+                        default=options.get(CONF_MIN_SCAN_INTERVAL, MIN_SCAN_INTERVAL),
+                    ): interval_range,
+                    vol.Optional(
+                        CONF_MAX_SCAN_INTERVAL,
+                        default=options.get(CONF_MAX_SCAN_INTERVAL, MAX_SCAN_INTERVAL),
+                    ): interval_range,
+                    vol.Optional(
+                        CONF_FAILURE_THRESHOLD,
+                        default=options.get(
+                            CONF_FAILURE_THRESHOLD, DEFAULT_FAILURE_THRESHOLD
+                        ),
+                    ): vol.All(cv.positive_int, vol.Range(min=1, max=20)),
+                    vol.Optional(
+                        CONF_RECOVERY_TIMEOUT,
+                        default=options.get(
+                            CONF_RECOVERY_TIMEOUT, DEFAULT_RECOVERY_TIMEOUT
+                        ),
+                    ): vol.All(cv.positive_int, vol.Range(min=10, max=3600)),
+                    vol.Optional(
+                        CONF_MQTT_TOPIC,
+                        default=options.get(CONF_MQTT_TOPIC, ""),
+                    ): cv.string,
+                    vol.Optional(
+                        CONF_STREAMING,
+                        default=options.get(CONF_STREAMING, DEFAULT_STREAMING),
+                    ): cv.boolean,
+                    vol.Optional(
+                        CONF_STATISTICS_WINDOW,
+                        default=options.get(
+                            CONF_STATISTICS_WINDOW, DEFAULT_STATISTICS_WINDOW
+                        ),
+                    ): vol.All(
+                        vol.Coerce(int), vol.Range(min=0, max=MAX_STATISTICS_WINDOW)
+                    ),
+                    vol.Optional(
+                        CONF_STATISTICS_KEYS,
+                        default=list(
+                            options.get(CONF_STATISTICS_KEYS, STATISTICS_DEFAULT_KEYS)
+                        ),
+                    ): cv.multi_select(
+                        {
+                            key: info["name"]
+                            for key, info in NUMERIC_SENSOR_TYPES.items()
+                            if key in STATISTICS_ELIGIBLE_KEYS
+                        }
+                    ),
+                    vol.Optional(
+                        CONF_SAMPLE_INTERVAL,
+                        default=options.get(
+                            CONF_SAMPLE_INTERVAL, DEFAULT_SAMPLE_INTERVAL
                         ),
-                    ): vol.All(cv.positive_int, vol.Range(min=10, max=300)),
+                    ): vol.All(
+                        vol.Coerce(int), vol.Range(min=0, max=MAX_SAMPLE_INTERVAL)
+                    ),
+                    vol.Optional(
+                        CONF_STALE_AFTER,
+                        default=options.get(CONF_STALE_AFTER, DEFAULT_STALE_AFTER),
+                    ): vol.All(
+                        vol.Coerce(int), vol.Range(min=0, max=MAX_STALE_AFTER)
+                    ),
+                    vol.Optional(
+                        CONF_HISTORY_SIZE,
+                        default=options.get(CONF_HISTORY_SIZE, DEFAULT_HISTORY_SIZE),
+                    ): vol.All(
+                        vol.Coerce(int), vol.Range(min=0, max=MAX_HISTORY_SIZE)
+                    ),
+                    vol.Optional(CONF_CONFIGURE_DEADBAND, default=False): cv.boolean,
+                }
+            ),
+            errors=errors,
+        )
+
+    async def async_step_deadband(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Set or clear the deadband of one numeric sensor.
+
+        A threshold of 0 removes the deadband of the sensor.
+        """
+        if user_input is not None:
+            deadbands = self._options[CONF_DEADBANDS]
+            sensor_key = user_input[CONF_DEADBAND_SENSOR]
+            if user_input[CONF_DEADBAND_THRESHOLD] > 0:
+                deadbands[sensor_key] = {
+                    CONF_DEADBAND_MODE: user_input[CONF_DEADBAND_MODE],
+                    CONF_DEADBAND_THRESHOLD: user_input[CONF_DEADBAND_THRESHOLD],
+                    CONF_DEADBAND_MAX_SILENCE: user_input[CONF_DEADBAND_MAX_SILENCE],
+                }
+            else:
+                deadbands.pop(sensor_key, None)
+            return self.async_create_entry(title="", data=self._options)
+        
+        return self.async_show_form(
+            step_id="deadband",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_DEADBAND_SENSOR): vol.In(
+                        {
+                            key: config["name"]
+                            for key, config in NUMERIC_SENSOR_TYPES.items()
+                        }
+                    ),
+                    vol.Optional(
+                        CONF_DEADBAND_MODE, default=DEADBAND_MODE_ABSOLUTE
+                    ): vol.In([DEADBAND_MODE_ABSOLUTE, DEADBAND_MODE_RELATIVE]),
+                    vol.Optional(CONF_DEADBAND_THRESHOLD, default=0): vol.All(
+                        vol.Coerce(float), vol.Range(min=0)
+                    ),
+                    vol.Optional(CONF_DEADBAND_MAX_SILENCE, default=0): vol.All(
+                        vol.Coerce(int), vol.Range(min=0, max=MAX_DEADBAND_SILENCE)
+                    ),
                 }
             ),
+            description_placeholders={
+                "configured": ", ".join(sorted(self._options[CONF_DEADBANDS]))
+                or "-"
+            },
         )
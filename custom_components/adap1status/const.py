@@ -3,6 +3,11 @@ from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
 from homeassistant.const import (
     UnitOfDataRate,
+    UnitOfElectricCurrent,
+    UnitOfElectricPotential,
+    UnitOfEnergy,
+    UnitOfFrequency,
+    UnitOfPower,
     UnitOfTime,
     UnitOfInformation,
     PERCENTAGE,
@@ -14,10 +19,173 @@ DEFAULT_NAME = "ADA-P1 Meter"
 DEFAULT_SCAN_INTERVAL = 30
 DEFAULT_PORT = 8989
 TIMEOUT = 5
+MIN_SCAN_INTERVAL = 10
+MAX_SCAN_INTERVAL = 300
+
+# Last-known-state cache, written at most once per this many seconds
+CACHE_SAVE_DELAY = 300
+
+# Subnet discovery
+DISCOVERY_CONCURRENCY = 64
+DISCOVERY_TIMEOUT = 1.0
+MAX_DISCOVERY_HOSTS = 1024
+# Keys every ADA-P1 status payload carries, used to tell meters apart from
+# other devices answering on /status
+DISCOVERY_SIGNATURE_KEYS = ("hostname", "os_version", "chip_cores", "heap_free")
+
+# Bulk import
+SERVICE_IMPORT_METERS = "import_meters"
+SERVICE_REFRESH = "refresh"
+ATTR_METERS = "meters"
+ATTR_FILE = "file"
+IMPORT_CONCURRENCY = 32
+
+# History export
+SERVICE_EXPORT_HISTORY = "export_history"
+ATTR_FORMAT = "format"
+ATTR_DIRECTORY = "directory"
+HISTORY_FORMAT_CSV = "csv"
+HISTORY_FORMAT_BINARY = "binary"
+# Below the configuration directory, unless the call names a directory
+HISTORY_EXPORT_DIR = f"{DOMAIN}_history"
+
+# Poll instrumentation; the metric sensors follow the metrics directly
+METRICS_CONTEXT = "metrics"
+# Histogram bucket bounds
+LATENCY_BUCKETS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+BYTES_BUCKETS = (256, 512, 1024, 2048, 4096, 8192, 16384, 65536)
+DECODE_TIME_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+# On-demand refresh: a poll that finished less than this many seconds ago
+# answers refresh calls instead of a new request
+REFRESH_DEBOUNCE = 1.0
+
+# Refresh tiers: keys that only change across reboots are published as soon
+# as they change, and re-published unchanged when the meter rebooted (uptime
+# went down) or every STATIC_REFRESH_INTERVAL seconds
+STATIC_KEYS = frozenset(
+    {
+        "os_version",
+        "hostname",
+        "local_ip",
+        "ssid",
+        "mqtt_server",
+        "chip_cores",
+        "heap_total",
+        "fs_total",
+    }
+)
+STATIC_REFRESH_INTERVAL = 3600
+
+# Plain-text status format (see API.md), parsed as the body arrives
+TEXT_CONTENT_TYPES = ("text/plain", "text/html")
+TEXT_CHUNK_SIZE = 4096
+# Bounds that keep a misbehaving meter from growing a buffer without limit
+MAX_STATUS_BODY_BYTES = 256 * 1024
+MAX_STATUS_LINE_BYTES = 1024
+
+# High-rate sampling (seconds between samples, 0 disables it); samples are
+# downsampled and published every scan interval
+DEFAULT_SAMPLE_INTERVAL = 0
+MAX_SAMPLE_INTERVAL = MIN_SCAN_INTERVAL - 1
+
+# Entities are created once their key is first reported; a key that has
+# not been reported for this many seconds is marked stale (0 never)
+DEFAULT_STALE_AFTER = 3600
+MAX_STALE_AFTER = 7 * 86400
+
+# Fleet-wide poll scheduling
+DATA_SCHEDULER = f"{DOMAIN}_scheduler"
+DEFAULT_MAX_CONCURRENT_POLLS = 8
+POLL_JITTER = 0.1
+
+# Integration-owned HTTP connection pool
+DATA_SESSION = f"{DOMAIN}_session"
+DATA_SESSION_CLOSE_LISTENER = f"{DOMAIN}_session_close_listener"
+CONNECTIONS_PER_HOST = 2
+# Long enough for an idle connection to survive the default poll interval
+KEEPALIVE_TIMEOUT = 2 * DEFAULT_SCAN_INTERVAL
 
 # Configuration
 CONF_PORT = "port"
 CONF_SCAN_INTERVAL = "scan_interval"
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+CONF_MIN_SCAN_INTERVAL = "min_scan_interval"
+CONF_MAX_SCAN_INTERVAL = "max_scan_interval"
+CONF_FAILURE_THRESHOLD = "failure_threshold"
+CONF_RECOVERY_TIMEOUT = "recovery_timeout"
+CONF_MQTT_TOPIC = "mqtt_topic"
+CONF_STREAMING = "streaming"
+CONF_STATISTICS_WINDOW = "statistics_window"
+CONF_STATISTICS_KEYS = "statistics_keys"
+CONF_SAMPLE_INTERVAL = "sample_interval"
+CONF_STALE_AFTER = "stale_after"
+CONF_HISTORY_SIZE = "history_size"
+CONF_NETWORK = "network"
+CONF_METERS = "meters"
+CONF_DEADBANDS = "deadbands"
+CONF_CONFIGURE_DEADBAND = "configure_deadband"
+CONF_DEADBAND_SENSOR = "sensor"
+CONF_DEADBAND_MODE = "mode"
+CONF_DEADBAND_THRESHOLD = "threshold"
+CONF_DEADBAND_MAX_SILENCE = "max_silence"
+
+# Adaptive polling
+DEFAULT_ADAPTIVE_POLLING = False
+# Keys whose movement means the meter is busy and worth polling faster
+ACTIVITY_KEYS = ("serial_recent_sec", "ack_items")
+ADAPTIVE_STABLE_BACKOFF = 1.5
+ADAPTIVE_FAILURE_BACKOFF = 2.0
+
+# Circuit breaker
+# The breaker sensor follows the breaker's transitions directly
+CIRCUIT_BREAKER_CONTEXT = "circuit_breaker"
+DEFAULT_FAILURE_THRESHOLD = 3
+DEFAULT_RECOVERY_TIMEOUT = 120
+
+# Push updates; HTTP polling only runs as a slow consistency check meanwhile
+PUSH_FALLBACK_SCAN_INTERVAL = 300
+# MQTT counts as a push source until no message arrived for this long
+MQTT_PUSH_TIMEOUT = 600
+
+# Streaming status endpoint (server-sent events or newline-delimited JSON)
+DEFAULT_STREAMING = False
+STREAM_PATH = "/status/stream"
+STREAM_ACCEPT = "text/event-stream, application/x-ndjson"
+# The meter sends a frame at least this often, otherwise the stream is stale
+STREAM_READ_TIMEOUT = 60
+STREAM_RECONNECT_MIN_DELAY = 1
+STREAM_RECONNECT_MAX_DELAY = 300
+# Upper bound for a single frame, so a broken stream cannot grow a buffer
+MAX_STREAM_FRAME_BYTES = 64 * 1024
+
+# Rolling-window statistics (window length in samples, 0 disables them)
+DEFAULT_STATISTICS_WINDOW = 0
+MAX_STATISTICS_WINDOW = 2880
+STATISTICS_CONTEXT_SUFFIX = "_statistics"
+# Keys with statistics sensors unless others are selected in the options
+STATISTICS_DEFAULT_KEYS = ("wifi_rssi", "heap_free", "heap_fragmentation")
+
+# WebSocket commands: fleet snapshot and per-meter delta subscription
+WS_TYPE_FLEET = f"{DOMAIN}/fleet"
+WS_TYPE_FLEET_SUBSCRIBE = f"{DOMAIN}/fleet/subscribe"
+# Dispatched with the entry id when a meter's coordinator is set up or unloaded
+SIGNAL_METER_CHANGED = f"{DOMAIN}_meter_changed"
+
+# Raw sample history per meter (samples kept, 0 disables it)
+DEFAULT_HISTORY_SIZE = 360
+MAX_HISTORY_SIZE = 8640
+
+# Deadbands: a numeric value is only published once it moved far enough
+DEADBAND_MODE_ABSOLUTE = "absolute"
+DEADBAND_MODE_RELATIVE = "relative"
+MAX_DEADBAND_SILENCE = 86400
+
+# Heap-leak trend, fitted since the last reboot of the meter
+HEAP_TREND_CONTEXT = "heap_trend"
+HEAP_TREND_MIN_SAMPLES = 10
+# Seconds of uptime covered before the estimate is trusted
+HEAP_TREND_MIN_SPAN = 1800
 
 # Text sensor types
 TEXT_SENSOR_TYPES = {
@@ -147,6 +315,42 @@ NUMERIC_SENSOR_TYPES = {
         "state_class": None,
         "icon": "mdi:format-list-numbered",
     },
+    # Electrical readings of the plain-text status format (see API.md)
+    "voltage": {
+        "name": "Voltage",
+        "unit": UnitOfElectricPotential.VOLT,
+        "device_class": SensorDeviceClass.VOLTAGE,
+        "state_class": SensorStateClass.MEASUREMENT,
+        "icon": "mdi:sine-wave",
+    },
+    "current": {
+        "name": "Current",
+        "unit": UnitOfElectricCurrent.AMPERE,
+        "device_class": SensorDeviceClass.CURRENT,
+        "state_class": SensorStateClass.MEASUREMENT,
+        "icon": "mdi:current-ac",
+    },
+    "power": {
+        "name": "Power",
+        "unit": UnitOfPower.WATT,
+        "device_class": SensorDeviceClass.POWER,
+        "state_class": SensorStateClass.MEASUREMENT,
+        "icon": "mdi:flash",
+    },
+    "energy": {
+        "name": "Energy",
+        "unit": UnitOfEnergy.KILO_WATT_HOUR,
+        "device_class": SensorDeviceClass.ENERGY,
+        "state_class": SensorStateClass.TOTAL_INCREASING,
+        "icon": "mdi:lightning-bolt",
+    },
+    "frequency": {
+        "name": "Frequency",
+        "unit": UnitOfFrequency.HERTZ,
+        "device_class": SensorDeviceClass.FREQUENCY,
+        "state_class": SensorStateClass.MEASUREMENT,
+        "icon": "mdi:sine-wave",
+    },
 }
 
 # Binary sensor types
@@ -177,3 +381,16 @@ BINARY_SENSOR_TYPES = {
         "icon": "mdi:shield-check",
     },
 }
+
+# Every payload key an entity is declared for; anything else is dropped
+STATUS_KEYS = frozenset(
+    (*TEXT_SENSOR_TYPES, *NUMERIC_SENSOR_TYPES, *BINARY_SENSOR_TYPES)
+)
+
+# Keys rolling statistics can be kept for. Min/mean/max of a counter is
+# meaningless, and HA rejects the measurement state class on energy sensors
+STATISTICS_ELIGIBLE_KEYS = frozenset(
+    key
+    for key, info in NUMERIC_SENSOR_TYPES.items()
+    if info["state_class"] is not SensorStateClass.TOTAL_INCREASING
+)
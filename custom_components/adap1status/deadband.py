@@ -0,0 +1,31 @@
+"""Significant-change filtering for the Adap1Status integration."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from .const import DEADBAND_MODE_RELATIVE
+
+
+@dataclass(frozen=True, slots=True)
+class Deadband:
+    """Deadband of a numeric sensor.
+
+    A new value is only published once it moved at least threshold away
+    from the value published last: in the sensor's unit for the absolute
+    mode, in percent of the published value for the relative mode. Once
+    max_silence seconds passed without publishing, any change is published
+    again (0 means no limit).
+    """
+
+    mode: str
+    threshold: float
+    max_silence: float = 0
+
+    def is_significant(self, published: float, value: float, silence: float) -> bool:
+        """Return True if value should replace the published value."""
+        if self.max_silence and silence >= self.max_silence:
+            return True
+        delta = abs(value - published)
+        if self.mode == DEADBAND_MODE_RELATIVE:
+            return delta >= abs(published) * self.threshold / 100
+        return delta >= self.threshold
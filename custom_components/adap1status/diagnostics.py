@@ -0,0 +1,46 @@
+"""Diagnostics support for the Adap1Status integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+
+from . import Adap1StatusDataUpdateCoordinator
+from .const import CONF_MQTT_TOPIC, DATA_SCHEDULER, DOMAIN
+
+TO_REDACT_CONFIG = {CONF_HOST, CONF_MQTT_TOPIC, "title", "unique_id"}
+TO_REDACT_DATA = {"local_ip", "hostname", "ssid", "mqtt_server"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: Adap1StatusDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    breaker = coordinator.breaker
+    
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT_CONFIG),
+        "data": async_redact_data(coordinator.data or {}, TO_REDACT_DATA),
+        "last_update_success": coordinator.last_update_success,
+        "poll_interval": coordinator.poll_interval.total_seconds(),
+        "push_sources": sorted(coordinator.push_sources),
+        "circuit_breaker": (
+            None
+            if breaker is None
+            else {
+                "state": breaker.state.value,
+                "failures": breaker.failures,
+                "retry_in": breaker.retry_in,
+            }
+        ),
+        "metrics": coordinator.metrics.as_dict(),
+        "scheduler": (
+            scheduler.as_dict()
+            if (scheduler := hass.data.get(DATA_SCHEDULER)) is not None
+            else None
+        ),
+    }
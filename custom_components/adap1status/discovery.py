@@ -0,0 +1,95 @@
+"""Subnet discovery of ADA-P1 meters."""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import ipaddress
+import logging
+from typing import Any
+
+import aiohttp
+
+from .const import (
+    DEFAULT_PORT,
+    DISCOVERY_CONCURRENCY,
+    DISCOVERY_SIGNATURE_KEYS,
+    DISCOVERY_TIMEOUT,
+    MAX_DISCOVERY_HOSTS,
+)
+from .parser import decode_status
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class DiscoveredMeter:
+    """A meter found while scanning a network."""
+
+    host: str
+    port: int
+    hostname: str
+
+
+def is_meter(payload: dict[str, Any]) -> bool:
+    """Return True if a status payload looks like it came from an ADA-P1 meter."""
+    return all(key in payload for key in DISCOVERY_SIGNATURE_KEYS)
+
+
+def network_hosts(network: str) -> list[str]:
+    """Return the host addresses of an IPv4 CIDR network.
+
+    Raises ValueError if the network is invalid, not IPv4 or larger than
+    MAX_DISCOVERY_HOSTS addresses. The meters only speak IPv4, and the probe
+    and poll URLs are built from bare IPv4 addresses.
+    """
+    parsed = ipaddress.ip_network(network.strip(), strict=False)
+    if not isinstance(parsed, ipaddress.IPv4Network):
+        raise ValueError(f"{parsed} is not an IPv4 network")
+    if parsed.num_addresses > MAX_DISCOVERY_HOSTS:
+        raise ValueError(
+            f"{parsed} has {parsed.num_addresses} addresses, "
+            f"at most {MAX_DISCOVERY_HOSTS} can be scanned"
+        )
+    return [str(address) for address in parsed.hosts()]
+
+
+async def async_discover_meters(
+    session: aiohttp.ClientSession,
+    network: str,
+    port: int = DEFAULT_PORT,
+    *,
+    concurrency: int = DISCOVERY_CONCURRENCY,
+    timeout: float = DISCOVERY_TIMEOUT,
+) -> list[DiscoveredMeter]:
+    """Probe /status on every host of a network and return the meters found.
+
+    At most concurrency probes are in flight at a time and each one gives up
+    after timeout seconds, so an empty /24 takes a few seconds to scan.
+    Raises ValueError if the network cannot be scanned.
+    """
+    hosts = network_hosts(network)
+    semaphore = asyncio.Semaphore(concurrency)
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+
+    async def _async_probe(host: str) -> DiscoveredMeter | None:
+        """Return the meter at host, if there is one."""
+        async with semaphore:
+            try:
+                async with session.get(
+                    f"http://{host}:{port}/status", timeout=client_timeout
+                ) as response:
+                    if response.status != 200:
+                        return None
+                    payload = decode_status(await response.read())
+            except (aiohttp.ClientError, TimeoutError, ValueError):
+                return None
+        if not is_meter(payload):
+            return None
+        return DiscoveredMeter(host, port, str(payload["hostname"]))
+
+    results = await asyncio.gather(*(_async_probe(host) for host in hosts))
+    meters = [meter for meter in results if meter is not None]
+    _LOGGER.debug(
+        "Found %d meter(s) among %d hosts of %s", len(meters), len(hosts), network
+    )
+    return meters
@@ -0,0 +1,114 @@
+"""In-memory downsampling of high-rate samples for the Adap1Status integration."""
+from __future__ import annotations
+
+import math
+from typing import Any
+
+from .const import NUMERIC_SENSOR_TYPES
+
+REDUCE_MEAN = "mean"
+REDUCE_MIN = "min"
+REDUCE_MAX = "max"
+REDUCE_LAST = "last"
+
+# How the samples of a key are reduced to the published value. Keys not
+# listed here (counters, categorical values, configuration) keep the last
+# sample: a mean of a WiFi channel or a counter is meaningless.
+REDUCERS: dict[str, str] = {
+    "wifi_rssi": REDUCE_MEAN,
+    "heap_free": REDUCE_MEAN,
+    "heap_max_alloc": REDUCE_MEAN,
+    "heap_fragmentation": REDUCE_MEAN,
+    "fs_used": REDUCE_MEAN,
+    "voltage": REDUCE_MEAN,
+    "current": REDUCE_MEAN,
+    "power": REDUCE_MEAN,
+    "frequency": REDUCE_MEAN,
+    # A low-water mark exists to show the lowest value
+    "heap_min_free": REDUCE_MIN,
+    # Ages: the worst one of the interval
+    "serial_recent_sec": REDUCE_MAX,
+    "watchdog_last_kick_ms": REDUCE_MAX,
+}
+
+
+class SampleAccumulator:
+    """Count, sum, minimum, maximum and last value of the samples of one key."""
+
+    __slots__ = ("count", "total", "minimum", "maximum", "last")
+
+    def __init__(self) -> None:
+        """Initialize an empty accumulator."""
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all samples."""
+        self.count = 0
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self.last = 0.0
+
+    def add(self, value: float) -> None:
+        """Add a sample."""
+        self.count += 1
+        self.total += value
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+        self.last = value
+
+    def reduce(self, reducer: str) -> float:
+        """Return the samples reduced to a single value."""
+        if reducer == REDUCE_MEAN:
+            return round(self.total / self.count, 3)
+        if reducer == REDUCE_MIN:
+            return self.minimum
+        if reducer == REDUCE_MAX:
+            return self.maximum
+        return self.last
+
+
+class Downsampler:
+    """Accumulate high-rate samples and reduce them once per publish interval.
+
+    Only O(1) state per numeric key is kept, however many samples arrive
+    between two publishes.
+    """
+
+    def __init__(self, keys: frozenset[str] = frozenset(NUMERIC_SENSOR_TYPES)) -> None:
+        """Initialize the downsampler for the given numeric keys."""
+        self._accumulators = {key: SampleAccumulator() for key in keys}
+        self.count = 0
+        # min/max/last/samples of every key as of the last flush
+        self.aggregates: dict[str, dict[str, float | int]] = {}
+
+    def add(self, data: dict[str, Any]) -> None:
+        """Add the numeric values of a sample."""
+        self.count += 1
+        for key, accumulator in self._accumulators.items():
+            value = data.get(key)
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                accumulator.add(value)
+
+    def flush(self, latest: dict[str, Any]) -> dict[str, Any]:
+        """Return latest with every numeric value reduced, and start over.
+
+        Every key is reduced as listed in REDUCERS, by default to its last
+        sample.
+        """
+        data = dict(latest)
+        aggregates: dict[str, dict[str, float | int]] = {}
+        for key, accumulator in self._accumulators.items():
+            if not accumulator.count:
+                continue
+            data[key] = accumulator.reduce(REDUCERS.get(key, REDUCE_LAST))
+            aggregates[key] = {
+                "min": accumulator.minimum,
+                "max": accumulator.maximum,
+                "last": accumulator.last,
+                "samples": accumulator.count,
+            }
+            accumulator.reset()
+        self.aggregates = aggregates
+        self.count = 0
+        return data
@@ -0,0 +1,44 @@
+"""Base entity for the Adap1Status integration."""
+from __future__ import annotations
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from . import Adap1StatusDataUpdateCoordinator
+from .const import DOMAIN, DEFAULT_NAME
+
+
+class Adap1StatusEntity(CoordinatorEntity[Adap1StatusDataUpdateCoordinator]):
+    """Common base of all Adap1Status entities."""
+
+    def __init__(
+        self,
+        coordinator: Adap1StatusDataUpdateCoordinator,
+        key: str,
+        config_entry: ConfigEntry,
+        context: str | None = None,
+    ) -> None:
+        """Initialize the entity.
+
+        Entities backed by a single payload key pass it as context, so that
+        the coordinator only notifies them when that key changes.
+        """
+        super().__init__(coordinator, context=context)
+        self._config_entry = config_entry
+
+        # Use the config entry's entry_id as the stable device/entity identifier.
+        # This is assigned once at setup and never changes, regardless of the
+        # device's network address or any runtime value returned by the device.
+        device_id = config_entry.entry_id
+        self._attr_unique_id = f"{device_id}_{key}"
+
+        # All entities of an entry share one DeviceInfo instance
+        if coordinator.device_info is None:
+            coordinator.device_info = DeviceInfo(
+                identifiers={(DOMAIN, device_id)},
+                name=DEFAULT_NAME,
+                manufacturer="ADA",
+                model="ADA-P1Meter",
+            )
+        self._attr_device_info = coordinator.device_info
@@ -0,0 +1,150 @@
+"""Bounded sample history for the Adap1Status integration."""
+from __future__ import annotations
+
+from array import array
+import csv
+from datetime import UTC, datetime
+import io
+import math
+import struct
+import sys
+import time
+from typing import Any
+
+# Binary export layout, all little-endian:
+#   magic b"ADH1", uint32 row count, uint16 column count,
+#   per column: uint8 name length and the UTF-8 name,
+#   the timestamps (float64 Unix seconds),
+#   per column: one float64 per row, NaN where the key was not reported.
+HISTORY_MAGIC = b"ADH1"
+_HEADER = struct.Struct("<4sIH")
+
+
+class HistoryBuffer:
+    """Fixed-size, array-backed ring buffer of timestamped samples.
+
+    Every sample is a row holding its timestamp and one value per key, with
+    NaN for keys the sample did not report. A key's column is only allocated
+    once the key is first reported, so the buffer never holds more than
+    size * 8 bytes per reported key plus the timestamps.
+    """
+
+    __slots__ = ("size", "keys", "count", "_timestamps", "_columns", "_next")
+
+    def __init__(self, size: int, keys: frozenset[str]) -> None:
+        """Initialize an empty buffer holding up to size samples of keys."""
+        self.size = size
+        self.keys = keys
+        self.count = 0
+        self._timestamps = array("d", bytes(8 * size))
+        self._columns: dict[str, array[float]] = {}
+        self._next = 0
+
+    def add(self, data: dict[str, Any], timestamp: float | None = None) -> None:
+        """Add the numeric values of a (possibly partial) payload as a row."""
+        values = {
+            key: value
+            for key, value in data.items()
+            if key in self.keys
+            and isinstance(value, (int, float))
+            and not isinstance(value, bool)
+        }
+        if not values:
+            return
+
+        index = self._next
+        self._timestamps[index] = time.time() if timestamp is None else timestamp
+        for key in values.keys() - self._columns.keys():
+            self._columns[key] = array("d", [math.nan]) * self.size
+        for key, column in self._columns.items():
+            column[index] = values.get(key, math.nan)
+        self._next = (index + 1) % self.size
+        self.count = min(self.count + 1, self.size)
+
+    def _ordered(self, values: array[float]) -> array[float]:
+        """Return the stored part of a column, oldest row first."""
+        if self.count < self.size:
+            return values[: self.count]
+        return values[self._next :] + values[: self._next]
+
+    def snapshot(self) -> tuple[array[float], dict[str, array[float]]]:
+        """Return copies of the timestamps and columns, oldest row first.
+
+        The copies can be formatted outside the event loop.
+        """
+        return self._ordered(self._timestamps), {
+            key: self._ordered(self._columns[key]) for key in sorted(self._columns)
+        }
+
+
+def format_csv(timestamps: array[float], columns: dict[str, array[float]]) -> str:
+    """Return a snapshot as CSV with an ISO 8601 timestamp column."""
+    output = io.StringIO()
+    writer = csv.writer(output, lineterminator="\n")
+    writer.writerow(["timestamp", *columns])
+    for row, timestamp in enumerate(timestamps):
+        writer.writerow(
+            [
+                datetime.fromtimestamp(timestamp, UTC).isoformat(),
+                *(_format_value(column[row]) for column in columns.values()),
+            ]
+        )
+    return output.getvalue()
+
+
+def format_binary(
+    timestamps: array[float], columns: dict[str, array[float]]
+) -> bytes:
+    """Return a snapshot in the compact binary layout described above."""
+    parts = [_HEADER.pack(HISTORY_MAGIC, len(timestamps), len(columns))]
+    for key in columns:
+        name = key.encode()
+        parts.append(struct.pack("<B", len(name)) + name)
+    for values in (timestamps, *columns.values()):
+        if sys.byteorder == "big":
+            values = array("d", values)
+            values.byteswap()
+        parts.append(values.tobytes())
+    return b"".join(parts)
+
+
+def _format_value(value: float) -> str:
+    """Format a stored value for CSV, leaving missing values empty."""
+    if math.isnan(value):
+        return ""
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def read_binary(payload: bytes) -> tuple[array[float], dict[str, array[float]]]:
+    """Parse a binary export back into timestamps and columns by key.
+
+    Raises ValueError if the payload is not a history export.
+    """
+    try:
+        magic, rows, column_count = _HEADER.unpack_from(payload)
+    except struct.error as err:
+        raise ValueError("Truncated history header") from err
+    if magic != HISTORY_MAGIC:
+        raise ValueError("Not a history export")
+
+    offset = _HEADER.size
+    keys = []
+    try:
+        for _ in range(column_count):
+            length = payload[offset]
+            keys.append(payload[offset + 1 : offset + 1 + length].decode())
+            offset += 1 + length
+    except (IndexError, UnicodeDecodeError) as err:
+        raise ValueError("Truncated history column names") from err
+
+    series = []
+    for _ in range(column_count + 1):
+        values = array("d")
+        values.frombytes(payload[offset : offset + 8 * rows])
+        if len(values) != rows:
+            raise ValueError("Truncated history data")
+        if sys.byteorder == "big":
+            values.byteswap()
+        series.append(values)
+        offset += 8 * rows
+    return series[0], dict(zip(keys, series[1:]))
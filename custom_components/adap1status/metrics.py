@@ -0,0 +1,127 @@
+"""Poll instrumentation for the Adap1Status integration."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, callback
+
+from .const import BYTES_BUCKETS, DECODE_TIME_BUCKETS, LATENCY_BUCKETS
+
+
+class Histogram:
+    """Fixed-bucket histogram; observing a value is O(log buckets)."""
+
+    __slots__ = ("bounds", "counts", "count", "total")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        """Initialize the histogram with ascending upper bucket bounds."""
+        self.bounds = bounds
+        # The last bucket catches everything above the largest bound
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean of the observed values."""
+        return self.total / self.count if self.count else None
+
+    def observe(self, value: float) -> None:
+        """Add a value."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def quantile(self, q: float) -> float | None:
+        """Return the upper bound of the bucket holding the q-quantile.
+
+        None if nothing was observed, or the quantile is above every bound.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram in a JSON-serialisable form."""
+        buckets = {f"le_{bound:g}": count for bound, count in zip(self.bounds, self.counts)}
+        buckets["inf"] = self.counts[-1]
+        return {"count": self.count, "mean": self.mean, "buckets": buckets}
+
+
+class PollMetrics:
+    """Counters and histograms describing the polls of one meter."""
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.failure_reasons: Counter[str] = Counter()
+        self.last_failure_reason: str | None = None
+        # Latest observations; latency and decode time in milliseconds
+        self.latency: float | None = None
+        self.payload_bytes: int | None = None
+        self.decode_time: float | None = None
+        self.latency_histogram = Histogram(LATENCY_BUCKETS)
+        self.bytes_histogram = Histogram(BYTES_BUCKETS)
+        self.decode_time_histogram = Histogram(DECODE_TIME_BUCKETS)
+        self._listeners: list[Callable[[], None]] = []
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> CALLBACK_TYPE:
+        """Listen for new observations; return a callback that stops listening."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def _async_remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return _async_remove_listener
+
+    def _notify(self) -> None:
+        """Notify the listeners."""
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    def record_success(self, latency: float, payload_bytes: int, decode_time: float) -> None:
+        """Record a successful request; times are in seconds."""
+        self.requests += 1
+        self.consecutive_failures = 0
+        self.latency = round(latency * 1000, 1)
+        self.payload_bytes = payload_bytes
+        self.decode_time = round(decode_time * 1000, 3)
+        self.latency_histogram.observe(latency * 1000)
+        self.bytes_histogram.observe(payload_bytes)
+        self.decode_time_histogram.observe(decode_time * 1000)
+        self._notify()
+
+    def record_failure(self, reason: str) -> None:
+        """Record a failed request."""
+        self.requests += 1
+        self.failures += 1
+        self.consecutive_failures += 1
+        self.failure_reasons[reason] += 1
+        self.last_failure_reason = reason
+        self._notify()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics in a JSON-serialisable form."""
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+            "failure_reasons": dict(self.failure_reasons),
+            "last_failure_reason": self.last_failure_reason,
+            "latency_ms": self.latency_histogram.as_dict(),
+            "payload_bytes": self.bytes_histogram.as_dict(),
+            "decode_time_ms": self.decode_time_histogram.as_dict(),
+        }
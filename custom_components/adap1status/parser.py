@@ -0,0 +1,168 @@
+"""Status payload decoding for the Adap1Status integration."""
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    orjson = None
+
+from .const import (
+    MAX_STATUS_BODY_BYTES,
+    MAX_STATUS_LINE_BYTES,
+    MAX_STREAM_FRAME_BYTES,
+    NUMERIC_SENSOR_TYPES,
+    STATUS_KEYS,
+)
+
+# Both decoders accept the raw bytes and raise a ValueError subclass on
+# malformed input, so callers do not have to care which one is in use.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# A number optionally followed by a unit, e.g. "230.5 V", "1200W", "-65 dBm"
+_NUMBER_WITH_UNIT = re.compile(
+    r"([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)(?:\s*[^\d\s.,:;+-]\S*)?"
+)
+_NUMERIC_KEYS = frozenset(NUMERIC_SENSOR_TYPES)
+
+
+def decode_status(
+    body: bytes | str, keys: frozenset[str] = STATUS_KEYS
+) -> dict[str, Any]:
+    """Decode a JSON status body, keeping only the known keys.
+
+    Fields the integration has no entity for (e.g. added by newer firmware)
+    are dropped right away instead of being kept alive in coordinator.data.
+    Raises ValueError if the body is not a JSON object.
+    """
+    payload = _json_loads(body)
+    if not isinstance(payload, dict):
+        raise ValueError(f"Expected a JSON object, got {type(payload).__name__}")
+    return {key: payload[key] for key in keys if key in payload}
+
+
+class StreamFrameDecoder:
+    """Split a status stream into frames as the chunks arrive.
+
+    Understands server-sent events (one or more "data:" lines terminated by
+    an empty line) as well as newline-delimited JSON (one object per line).
+    SSE comments and the event, id and retry fields are skipped.
+    """
+
+    def __init__(self, max_frame_bytes: int = MAX_STREAM_FRAME_BYTES) -> None:
+        """Initialize the decoder."""
+        self.max_frame_bytes = max_frame_bytes
+        self._buffer = bytearray()
+        self._event: list[bytes] = []
+        self._event_bytes = 0
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """Consume a chunk and return the frames it completed.
+
+        Raises ValueError if a frame grows beyond max_frame_bytes.
+        """
+        self._buffer += chunk
+        frames: list[bytes] = []
+        while (end := self._buffer.find(b"\n")) != -1:
+            line = bytes(self._buffer[:end]).rstrip(b"\r")
+            del self._buffer[: end + 1]
+            if not line:
+                if self._event:
+                    frames.append(b"\n".join(self._event))
+                    self._event.clear()
+                    self._event_bytes = 0
+            elif line.startswith(b"data:"):
+                data = line[5:].removeprefix(b" ")
+                self._event.append(data)
+                self._event_bytes += len(data)
+                if self._event_bytes > self.max_frame_bytes:
+                    raise ValueError("Stream event exceeds the maximum frame size")
+            elif line.startswith(b"{"):
+                frames.append(line)
+
+        if len(self._buffer) > self.max_frame_bytes:
+            raise ValueError("Stream line exceeds the maximum frame size")
+        return frames
+
+
+def _parse_number(value: str) -> Any:
+    """Return a plain-text value as a number with its unit stripped, if it is one."""
+    if (match := _NUMBER_WITH_UNIT.fullmatch(value)) is None:
+        return value
+    number = match.group(1)
+    try:
+        return int(number)
+    except ValueError:
+        return float(number)
+
+
+class TextStatusDecoder:
+    """Parse a plain-text "key: value unit" status body as the chunks arrive.
+
+    Keys are matched case-insensitively and only the known ones are kept;
+    lines without a colon are ignored. Values of numeric keys lose their
+    unit, all other values are kept as text. The body and every line are bounded, so
+    a misbehaving meter cannot make the decoder buffer without limit.
+    """
+
+    def __init__(
+        self,
+        keys: frozenset[str] = STATUS_KEYS,
+        max_body_bytes: int = MAX_STATUS_BODY_BYTES,
+        max_line_bytes: int = MAX_STATUS_LINE_BYTES,
+    ) -> None:
+        """Initialize the decoder."""
+        self.keys = keys
+        self.max_body_bytes = max_body_bytes
+        self.max_line_bytes = max_line_bytes
+        self.size = 0
+        self._buffer = bytearray()
+        self._data: dict[str, Any] = {}
+
+    def feed(self, chunk: bytes) -> None:
+        """Consume a chunk, parsing every line it completes.
+
+        Raises ValueError if the body or a line grows beyond its limit.
+        """
+        self.size += len(chunk)
+        if self.size > self.max_body_bytes:
+            raise ValueError("Status body exceeds the maximum size")
+        self._buffer += chunk
+        start = 0
+        while (end := self._buffer.find(b"\n", start)) != -1:
+            self._parse_line(self._buffer[start:end])
+            start = end + 1
+        del self._buffer[:start]
+        if len(self._buffer) > self.max_line_bytes:
+            raise ValueError("Status line exceeds the maximum size")
+
+    def finish(self) -> dict[str, Any]:
+        """Parse the last, unterminated line and return the decoded status.
+
+        Raises ValueError if the body did not contain a single known key.
+        """
+        self._parse_line(self._buffer)
+        self._buffer.clear()
+        if not self._data:
+            raise ValueError("No known status key found in the body")
+        return self._data
+
+    def _parse_line(self, line: bytes | bytearray) -> None:
+        """Parse a single "key: value" line."""
+        key, separator, value = bytes(line).decode("utf-8", "replace").partition(":")
+        if not separator:
+            return
+        key = key.strip().lower()
+        if key in self.keys:
+            value = value.strip()
+            self._data[key] = _parse_number(value) if key in _NUMERIC_KEYS else value
+
+
+def decode_text_status(body: bytes, keys: frozenset[str] = STATUS_KEYS) -> dict[str, Any]:
+    """Decode a complete plain-text status body, keeping only the known keys."""
+    decoder = TextStatusDecoder(keys)
+    decoder.feed(body)
+    return decoder.finish()
@@ -0,0 +1,67 @@
+"""Rolling-window statistics for the Adap1Status integration."""
+from __future__ import annotations
+
+from array import array
+import math
+
+
+class RollingWindow:
+    """Fixed-size, array-backed ring buffer with incremental aggregates.
+
+    The running sum is updated in O(1) per sample. Minimum and maximum are
+    updated in O(1) as well, except when the sample being evicted was the
+    current extreme, in which case the window is rescanned once.
+    """
+
+    __slots__ = ("size", "count", "minimum", "maximum", "_values", "_next", "_sum")
+
+    def __init__(self, size: int) -> None:
+        """Initialize an empty window holding up to size samples."""
+        self.size = size
+        self.count = 0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self._values = array("d", bytes(8 * size))
+        self._next = 0
+        self._sum = 0.0
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean of the samples in the window."""
+        return self._sum / self.count if self.count else None
+
+    def aggregates(self) -> tuple[float, float, float] | None:
+        """Return (minimum, mean, maximum), or None if the window is empty."""
+        if not self.count:
+            return None
+        return (self.minimum, self._sum / self.count, self.maximum)
+
+    def add(self, value: float) -> bool:
+        """Add a sample; return True if any aggregate changed."""
+        before = self.aggregates()
+        index = self._next
+        evicted = self._values[index] if self.count == self.size else None
+
+        self._values[index] = value
+        self._next = (index + 1) % self.size
+        if evicted is None:
+            self.count += 1
+            self._sum += value
+        else:
+            self._sum += value - evicted
+
+        if evicted is not None and (evicted == self.minimum or evicted == self.maximum):
+            self._rescan()
+        else:
+            self.minimum = min(self.minimum, value)
+            self.maximum = max(self.maximum, value)
+
+        return self.aggregates() != before
+
+    def _rescan(self) -> None:
+        """Recompute the aggregates from the stored samples."""
+        values = self._values[: self.count]
+        self.minimum = min(values)
+        self.maximum = max(values)
+        # Also drops the rounding error accumulated by the running sum
+        self._sum = math.fsum(values)
@@ -0,0 +1,179 @@
+"""Fleet-wide poll scheduler for the Adap1Status integration."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import datetime
+import logging
+import random
+from typing import TYPE_CHECKING
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import DATA_SCHEDULER, DEFAULT_MAX_CONCURRENT_POLLS, POLL_JITTER
+
+if TYPE_CHECKING:
+    from . import Adap1StatusDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Successive multiples of the golden ratio conjugate (mod 1) are spread evenly
+# over [0, 1) however many meters end up registered, so the offsets never have
+# to be recomputed when an entry is added or removed.
+_GOLDEN_RATIO_CONJUGATE = 0.6180339887498949
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> Adap1StatusPollScheduler:
+    """Return the scheduler shared by all config entries, creating it if needed."""
+    if (scheduler := hass.data.get(DATA_SCHEDULER)) is None:
+        scheduler = hass.data[DATA_SCHEDULER] = Adap1StatusPollScheduler(hass)
+    return scheduler
+
+
+@callback
+def async_shutdown_scheduler(hass: HomeAssistant) -> None:
+    """Stop the shared scheduler, once the last config entry is unloaded."""
+    if (scheduler := hass.data.pop(DATA_SCHEDULER, None)) is not None:
+        scheduler.async_shutdown()
+
+
+class Adap1StatusPollScheduler:
+    """Stagger the polls of all meters and bound the in-flight requests.
+
+    Every registered coordinator gets its own start offset within its poll
+    interval and is re-armed with a small random jitter after each poll, so
+    meters sharing the same interval never line up. HTTP requests acquire a
+    slot from a shared semaphore; requests waiting for a slot make up the
+    queue depth.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT_POLLS,
+        jitter: float = POLL_JITTER,
+    ) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self.max_concurrent = max_concurrent
+        self.jitter = jitter
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._next_slot = 0
+        self._waiting = 0
+        self._peak_waiting = 0
+        self._in_flight = 0
+        self._timers: dict[Adap1StatusDataUpdateCoordinator, CALLBACK_TYPE] = {}
+        self._unsub_stop: CALLBACK_TYPE | None = hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, self._async_handle_stop
+        )
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of requests waiting for a free slot."""
+        return self._waiting
+
+    @property
+    def peak_queue_depth(self) -> int:
+        """Return the highest number of requests that waited at the same time."""
+        return self._peak_waiting
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of requests currently being executed."""
+        return self._in_flight
+
+    @property
+    def registered(self) -> int:
+        """Return the number of coordinators driven by the scheduler."""
+        return len(self._timers)
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the scheduler state for diagnostics."""
+        return {
+            "registered": self.registered,
+            "max_concurrent": self.max_concurrent,
+            "in_flight": self._in_flight,
+            "queue_depth": self._waiting,
+            "peak_queue_depth": self._peak_waiting,
+        }
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel every pending poll timer."""
+        if self._unsub_stop is not None:
+            self._unsub_stop()
+            self._unsub_stop = None
+        for cancel in self._timers.values():
+            cancel()
+        self._timers.clear()
+
+    @callback
+    def _async_handle_stop(self, _event: Event) -> None:
+        """Stop polling when Home Assistant stops."""
+        # The listener is gone once it fired
+        self._unsub_stop = None
+        self.async_shutdown()
+
+    @callback
+    def async_register(
+        self, coordinator: Adap1StatusDataUpdateCoordinator
+    ) -> CALLBACK_TYPE:
+        """Start polling a coordinator; return a callback that stops it."""
+        offset = (self._next_slot * _GOLDEN_RATIO_CONJUGATE) % 1.0
+        self._next_slot += 1
+        self._async_schedule(
+            coordinator, offset * coordinator.poll_interval.total_seconds()
+        )
+
+        @callback
+        def _async_unregister() -> None:
+            if (cancel := self._timers.pop(coordinator, None)) is not None:
+                cancel()
+
+        return _async_unregister
+
+    @callback
+    def _async_schedule(
+        self, coordinator: Adap1StatusDataUpdateCoordinator, delay: float
+    ) -> None:
+        """Arm the timer for the next poll of a coordinator."""
+
+        async def _async_poll(_now: datetime) -> None:
+            await coordinator.async_refresh()
+            # The entry may have been unloaded while the poll was running.
+            if coordinator in self._timers:
+                self._async_schedule(coordinator, self._next_delay(coordinator))
+
+        self._timers[coordinator] = async_call_later(self.hass, delay, _async_poll)
+
+    def _next_delay(self, coordinator: Adap1StatusDataUpdateCoordinator) -> float:
+        """Return the jittered delay until the next poll of a coordinator."""
+        interval = coordinator.poll_interval.total_seconds()
+        return interval * (1 + random.uniform(-self.jitter, self.jitter))
+
+    @asynccontextmanager
+    async def async_request_slot(self) -> AsyncIterator[None]:
+        """Wait for a free request slot and hold it for the duration."""
+        self._waiting += 1
+        self._peak_waiting = max(self._peak_waiting, self._waiting)
+        if self._semaphore.locked():
+            _LOGGER.debug(
+                "All %s request slots busy, %s request(s) queued",
+                self.max_concurrent,
+                self._waiting,
+            )
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+
+        self._in_flight += 1
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            self._semaphore.release()
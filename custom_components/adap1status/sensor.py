@@ -1,27 +1,220 @@
 """Sensor platform for Adap1Status integration."""
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import partial
 import logging
 from typing import Any
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.const import (
+    EntityCategory,
+    UnitOfDataRate,
+    UnitOfInformation,
+    UnitOfTime,
+)
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.helpers.typing import StateType
 
-from . import Adap1StatusDataUpdateCoordinator
+from . import Adap1StatusDataUpdateCoordinator, async_remove_entities
+from .circuit_breaker import CircuitState
 from .const import (
     DOMAIN,
     DEFAULT_NAME,
     TEXT_SENSOR_TYPES,
     NUMERIC_SENSOR_TYPES,
+    STATISTICS_CONTEXT_SUFFIX,
+    STATISTICS_ELIGIBLE_KEYS,
+    HEAP_TREND_CONTEXT,
+    METRICS_CONTEXT,
+    CIRCUIT_BREAKER_CONTEXT,
 )
+from .entity import Adap1StatusEntity
+from .metrics import PollMetrics
+from .trend import HeapTrend
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, kw_only=True)
+class Adap1StatusSensorEntityDescription(SensorEntityDescription):
+    """Describes an Adap1Status sensor backed by a payload key."""
+    
+    value_fn: Callable[[Any], StateType]
+
+
+@dataclass(frozen=True, kw_only=True)
+class Adap1StatusStatisticSensorEntityDescription(SensorEntityDescription):
+    """Describes a rolling-window statistic of a numeric payload key."""
+    
+    source_key: str
+    # Position in RollingWindow.aggregates(): 0 = min, 1 = mean, 2 = max
+    aggregate_index: int
+
+
+@dataclass(frozen=True, kw_only=True)
+class Adap1StatusHeapTrendSensorEntityDescription(SensorEntityDescription):
+    """Describes an estimate of the coordinator's heap-leak trend."""
+    
+    value_fn: Callable[[HeapTrend], float | None]
+
+
+@dataclass(frozen=True, kw_only=True)
+class Adap1StatusMetricSensorEntityDescription(SensorEntityDescription):
+    """Describes a poll metric of the coordinator."""
+    
+    value_fn: Callable[[PollMetrics], StateType]
+    attributes_fn: Callable[[PollMetrics], dict[str, Any]] | None = None
+
+
+def _to_text(value: Any) -> str | None:
+    """Convert a raw payload value to a text state."""
+    return str(value) if value is not None else None
+
+
+def _to_number(sensor_key: str, value: Any) -> float | int | None:
+    """Convert a raw payload value to a numeric state."""
+    if value is None or isinstance(value, (int, float)):
+        return value
+    
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        _LOGGER.warning(
+            "Could not convert value '%s' for sensor '%s' to number",
+            value,
+            sensor_key,
+        )
+        return None
+
+
+# The const tables are compiled once at import time
+TEXT_SENSOR_DESCRIPTIONS: dict[str, Adap1StatusSensorEntityDescription] = {
+    sensor_key: Adap1StatusSensorEntityDescription(
+        key=sensor_key,
+        name=f"{DEFAULT_NAME} {sensor_info['name']}",
+        icon=sensor_info["icon"],
+        value_fn=_to_text,
+    )
+    for sensor_key, sensor_info in TEXT_SENSOR_TYPES.items()
+}
+
+NUMERIC_SENSOR_DESCRIPTIONS: dict[str, Adap1StatusSensorEntityDescription] = {
+    sensor_key: Adap1StatusSensorEntityDescription(
+        key=sensor_key,
+        name=f"{DEFAULT_NAME} {sensor_info['name']}",
+        icon=sensor_info["icon"],
+        native_unit_of_measurement=sensor_info["unit"],
+        device_class=sensor_info["device_class"],
+        state_class=sensor_info["state_class"],
+        value_fn=partial(_to_number, sensor_key),
+    )
+    for sensor_key, sensor_info in NUMERIC_SENSOR_TYPES.items()
+}
+
+STATISTIC_SENSOR_DESCRIPTIONS: tuple[Adap1StatusStatisticSensorEntityDescription, ...] = tuple(
+    Adap1StatusStatisticSensorEntityDescription(
+        key=f"{sensor_key}_{statistic}",
+        name=f"{DEFAULT_NAME} {sensor_info['name']} {statistic_name}",
+        icon="mdi:chart-bell-curve",
+        native_unit_of_measurement=sensor_info["unit"],
+        device_class=sensor_info["device_class"],
+        state_class=SensorStateClass.MEASUREMENT,
+        source_key=sensor_key,
+        aggregate_index=aggregate_index,
+    )
+    for sensor_key, sensor_info in NUMERIC_SENSOR_TYPES.items()
+    if sensor_key in STATISTICS_ELIGIBLE_KEYS
+    for aggregate_index, (statistic, statistic_name) in enumerate(
+        (("min", "Min"), ("mean", "Mean"), ("max", "Max"))
+    )
+)
+
+HEAP_TREND_SENSOR_DESCRIPTIONS: tuple[Adap1StatusHeapTrendSensorEntityDescription, ...] = (
+    Adap1StatusHeapTrendSensorEntityDescription(
+        key="heap_leak_rate",
+        name=f"{DEFAULT_NAME} Heap Leak Rate",
+        icon="mdi:memory-arrow-down",
+        native_unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
+        device_class=SensorDeviceClass.DATA_RATE,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=3,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda trend: trend.leak_rate,
+    ),
+    Adap1StatusHeapTrendSensorEntityDescription(
+        key="heap_time_to_exhaustion",
+        name=f"{DEFAULT_NAME} Heap Time to Exhaustion",
+        icon="mdi:timer-alert-outline",
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda trend: trend.time_to_exhaustion,
+    ),
+)
+
+METRIC_SENSOR_DESCRIPTIONS: tuple[Adap1StatusMetricSensorEntityDescription, ...] = (
+    Adap1StatusMetricSensorEntityDescription(
+        key="poll_latency",
+        name=f"{DEFAULT_NAME} Poll Latency",
+        icon="mdi:timer-outline",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda metrics: metrics.latency,
+        attributes_fn=lambda metrics: {
+            "mean": metrics.latency_histogram.mean,
+            "p95": metrics.latency_histogram.quantile(0.95),
+        },
+    ),
+    Adap1StatusMetricSensorEntityDescription(
+        key="payload_size",
+        name=f"{DEFAULT_NAME} Payload Size",
+        icon="mdi:file-outline",
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda metrics: metrics.payload_bytes,
+    ),
+    Adap1StatusMetricSensorEntityDescription(
+        key="decode_time",
+        name=f"{DEFAULT_NAME} Decode Time",
+        icon="mdi:code-json",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda metrics: metrics.decode_time,
+    ),
+    Adap1StatusMetricSensorEntityDescription(
+        key="consecutive_failures",
+        name=f"{DEFAULT_NAME} Consecutive Failures",
+        icon="mdi:alert-circle-outline",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda metrics: metrics.consecutive_failures,
+        attributes_fn=lambda metrics: {
+            "last_failure_reason": metrics.last_failure_reason
+        },
+    ),
+    Adap1StatusMetricSensorEntityDescription(
+        key="poll_failures",
+        name=f"{DEFAULT_NAME} Poll Failures",
+        icon="mdi:alert-circle",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.failures,
+        attributes_fn=lambda metrics: dict(metrics.failure_reasons),
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -32,20 +225,115 @@ async def async_setup_entry(
         config_entry.entry_id
     ]
     
-    entities: list[SensorEntity] = []
+    @callback
+    def _async_add_key_sensors(keys: set[str]) -> None:
+        """Add the sensors of keys the meter reported for the first time."""
+        key_entities: list[SensorEntity] = []
+        
+        # Add text sensors
+        for sensor_key in TEXT_SENSOR_DESCRIPTIONS:
+            if sensor_key not in keys:
+                continue
+            key_entities.append(
+                Adap1StatusTextSensor(coordinator, sensor_key, config_entry)
+            )
+        
+        # Add numeric sensors
+        for sensor_key in NUMERIC_SENSOR_DESCRIPTIONS:
+            if sensor_key not in keys:
+                continue
+            key_entities.append(
+                Adap1StatusNumericSensor(coordinator, sensor_key, config_entry)
+            )
+        
+        # Add rolling-window statistics sensors of the selected keys
+        if coordinator.statistics:
+            for description in STATISTIC_SENSOR_DESCRIPTIONS:
+                if (
+                    description.source_key in keys
+                    and description.source_key in coordinator.statistics
+                ):
+                    key_entities.append(
+                        Adap1StatusStatisticSensor(
+                            coordinator, description, config_entry
+                        )
+                    )
+        
+        if key_entities:
+            async_add_entities(key_entities)
     
-    # Add text sensors
-    for sensor_key in TEXT_SENSOR_TYPES:
-        entities.append(Adap1StatusTextSensor(coordinator, sensor_key, config_entry))
+    # Statistics sensors of keys that are not (or no longer) selected
+    async_remove_entities(
+        hass,
+        config_entry,
+        [
+            f"{sensor_key}_{statistic}"
+            for sensor_key in NUMERIC_SENSOR_TYPES
+            if sensor_key not in coordinator.statistics
+            for statistic in ("min", "mean", "max")
+        ],
+    )
     
-    # Add numeric sensors
-    for sensor_key in NUMERIC_SENSOR_TYPES:
-        entities.append(Adap1StatusNumericSensor(coordinator, sensor_key, config_entry))
+    # Sensors of payload keys are only created once the meter reports them
+    config_entry.async_on_unload(coordinator.async_track_keys(_async_add_key_sensors))
+    
+    entities: list[SensorEntity] = []
+    
+    # Add diagnostic sensors
+    for description in METRIC_SENSOR_DESCRIPTIONS:
+        entities.append(Adap1StatusMetricSensor(coordinator, description, config_entry))
+    for description in HEAP_TREND_SENSOR_DESCRIPTIONS:
+        entities.append(
+            Adap1StatusHeapTrendSensor(coordinator, description, config_entry)
+        )
+    if coordinator.breaker is not None:
+        entities.append(Adap1StatusCircuitBreakerSensor(coordinator, config_entry))
     
     async_add_entities(entities)
 
 
-class Adap1StatusTextSensor(CoordinatorEntity[Adap1StatusDataUpdateCoordinator], SensorEntity):
+class Adap1StatusSensor(Adap1StatusEntity, SensorEntity):
+    """Representation of an Adap1Status sensor backed by a payload key.
+    
+    The value is converted once per coordinator update instead of on every
+    state read.
+    """
+    
+    entity_description: Adap1StatusSensorEntityDescription
+    
+    def __init__(
+        self,
+        coordinator: Adap1StatusDataUpdateCoordinator,
+        description: Adap1StatusSensorEntityDescription,
+        config_entry: ConfigEntry,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, description.key, config_entry, description.key)
+        self.entity_description = description
+        self._sensor_key = description.key
+        self._update_native_value()
+    
+    @property
+    def available(self) -> bool:
+        """Return False once the meter stopped reporting the sensor's key."""
+        return (
+            super().available and self._sensor_key not in self.coordinator.stale_keys
+        )
+    
+    def _update_native_value(self) -> None:
+        """Convert the current payload value of the sensor's key."""
+        data = self.coordinator.data
+        value = data.get(self._sensor_key) if data is not None else None
+        self._attr_native_value = self.entity_description.value_fn(value)
+    
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_native_value()
+        super()._handle_coordinator_update()
+
+
+class Adap1StatusTextSensor(Adap1StatusSensor):
     """Representation of an Adap1Status text sensor."""
     
     def __init__(
@@ -55,98 +343,173 @@ class Adap1StatusTextSensor(CoordinatorEntity[Adap1StatusDataUpdateCoordinator],
         config_entry: ConfigEntry,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._sensor_key = sensor_key
-        self._config_entry = config_entry
-        
-        sensor_info = TEXT_SENSOR_TYPES[sensor_key]
-        self._attr_name = f"{DEFAULT_NAME} {sensor_info['name']}"
-        self._attr_icon = sensor_info["icon"]
-        
-        # Use the config entry's entry_id as the stable device/entity identifier.
-        # This is assigned once at setup and never changes, regardless of the
-        # device's network address or any runtime value returned by the device.
-        device_id = self._config_entry.entry_id
-        self._attr_unique_id = f"{device_id}_{sensor_key}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, device_id)},
-            name=DEFAULT_NAME,
-            manufacturer="ADA",
-            model="ADA-P1Meter",
+        super().__init__(
+            coordinator, TEXT_SENSOR_DESCRIPTIONS[sensor_key], config_entry
+        )
+
+
+class Adap1StatusNumericSensor(Adap1StatusSensor):
+    """Representation of an Adap1Status numeric sensor."""
+    
+    def __init__(
+        self,
+        coordinator: Adap1StatusDataUpdateCoordinator,
+        sensor_key: str,
+        config_entry: ConfigEntry,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(
+            coordinator, NUMERIC_SENSOR_DESCRIPTIONS[sensor_key], config_entry
         )
     
     @property
-    def native_value(self) -> str | None:
-        """Return the state of the sensor."""
-        if self.coordinator.data is None:
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return min/max/last of the samples behind a downsampled value."""
+        if (downsampler := self.coordinator.downsampler) is None:
             return None
-        
-        value = self.coordinator.data.get(self._sensor_key)
-        return str(value) if value is not None else None
+        return downsampler.aggregates.get(self._sensor_key)
+
+
+class Adap1StatusStatisticSensor(Adap1StatusEntity, SensorEntity):
+    """Rolling-window statistic of a numeric sensor, kept by the coordinator."""
+    
+    entity_description: Adap1StatusStatisticSensorEntityDescription
+    
+    def __init__(
+        self,
+        coordinator: Adap1StatusDataUpdateCoordinator,
+        description: Adap1StatusStatisticSensorEntityDescription,
+        config_entry: ConfigEntry,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(
+            coordinator,
+            description.key,
+            config_entry,
+            f"{description.source_key}{STATISTICS_CONTEXT_SUFFIX}",
+        )
+        self.entity_description = description
+        self._window = coordinator.statistics[description.source_key]
     
     @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.last_update_success
+    def native_value(self) -> float | None:
+        """Return the statistic over the current window."""
+        if (aggregates := self._window.aggregates()) is None:
+            return None
+        return round(aggregates[self.entity_description.aggregate_index], 2)
+    
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the number of samples in the window."""
+        return {"samples": self._window.count}
 
 
-class Adap1StatusNumericSensor(CoordinatorEntity[Adap1StatusDataUpdateCoordinator], SensorEntity):
-    """Representation of an Adap1Status numeric sensor."""
+class Adap1StatusHeapTrendSensor(Adap1StatusEntity, SensorEntity):
+    """Heap-leak estimate fitted by the coordinator since the last reboot."""
+    
+    entity_description: Adap1StatusHeapTrendSensorEntityDescription
     
     def __init__(
         self,
         coordinator: Adap1StatusDataUpdateCoordinator,
-        sensor_key: str,
+        description: Adap1StatusHeapTrendSensorEntityDescription,
         config_entry: ConfigEntry,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._sensor_key = sensor_key
-        self._config_entry = config_entry
-        
-        sensor_info = NUMERIC_SENSOR_TYPES[sensor_key]
-        self._attr_name = f"{DEFAULT_NAME} {sensor_info['name']}"
-        self._attr_native_unit_of_measurement = sensor_info["unit"]
-        self._attr_device_class = sensor_info["device_class"]
-        self._attr_state_class = sensor_info["state_class"]
-        self._attr_icon = sensor_info["icon"]
-        
-        # Use the config entry's entry_id as the stable device/entity identifier.
-        # This is assigned once at setup and never changes, regardless of the
-        # device's network address or any runtime value returned by the device.
-        device_id = self._config_entry.entry_id
-        self._attr_unique_id = f"{device_id}_{sensor_key}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, device_id)},
-            name=DEFAULT_NAME,
-            manufacturer="ADA",
-            model="ADA-P1Meter",
+        super().__init__(coordinator, description.key, config_entry, HEAP_TREND_CONTEXT)
+        self.entity_description = description
+    
+    @property
+    def native_value(self) -> float | None:
+        """Return the current estimate, None until enough samples were fitted."""
+        return self.entity_description.value_fn(self.coordinator.heap_trend)
+    
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the number of samples since the last reboot."""
+        return {"samples": self.coordinator.heap_trend.count}
+
+
+class Adap1StatusMetricSensor(Adap1StatusEntity, SensorEntity):
+    """Disabled-by-default diagnostic sensor exposing a poll metric."""
+    
+    entity_description: Adap1StatusMetricSensorEntityDescription
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    
+    def __init__(
+        self,
+        coordinator: Adap1StatusDataUpdateCoordinator,
+        description: Adap1StatusMetricSensorEntityDescription,
+        config_entry: ConfigEntry,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, description.key, config_entry, METRICS_CONTEXT)
+        self.entity_description = description
+    
+    async def async_added_to_hass(self) -> None:
+        """Follow every request, including those of a meter that keeps failing."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.metrics.async_add_listener(self.async_write_ha_state)
         )
     
     @property
-    def native_value(self) -> float | int | None:
-        """Return the state of the sensor."""
-        if self.coordinator.data is None:
-            return None
-        
-        value = self.coordinator.data.get(self._sensor_key)
-        if value is None:
-            return None
-        
-        try:
-            # Try to convert to numeric type
-            if isinstance(value, (int, float)):
-                return value
-            return float(value)
-        except (ValueError, TypeError):
-            _LOGGER.warning(
-                "Could not convert value '%s' for sensor '%s' to number",
-                value,
-                self._sensor_key,
-            )
+    def native_value(self) -> StateType:
+        """Return the metric."""
+        return self.entity_description.value_fn(self.coordinator.metrics)
+    
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return details of the metric, if any."""
+        if self.entity_description.attributes_fn is None:
             return None
+        return self.entity_description.attributes_fn(self.coordinator.metrics)
+    
+    @property
+    def available(self) -> bool:
+        """Return True: the metrics are known even if the device is not."""
+        return True
+
+
+class Adap1StatusCircuitBreakerSensor(Adap1StatusEntity, SensorEntity):
+    """Diagnostic sensor exposing the state of the device's circuit breaker."""
+    
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:electric-switch"
+    _attr_options = [state.value for state in CircuitState]
+    
+    def __init__(
+        self,
+        coordinator: Adap1StatusDataUpdateCoordinator,
+        config_entry: ConfigEntry,
+    ) -> None:
+        """Initialize the sensor."""
+        # A context no payload key uses, so per-key dispatches skip the sensor
+        super().__init__(
+            coordinator, "circuit_breaker", config_entry, CIRCUIT_BREAKER_CONTEXT
+        )
+        self._attr_name = f"{DEFAULT_NAME} Circuit Breaker"
+    
+    async def async_added_to_hass(self) -> None:
+        """Also follow breaker transitions that happen while polls keep failing."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.breaker.async_add_listener(self.async_write_ha_state)
+        )
+    
+    @property
+    def native_value(self) -> str:
+        """Return the state of the circuit breaker."""
+        return self.coordinator.breaker.state.value
+    
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the breaker's consecutive failure count."""
+        return {"consecutive_failures": self.coordinator.breaker.failures}
     
     @property
     def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.last_update_success
+        """Return True: the breaker state is known even if the device is not."""
+        return True
@@ -0,0 +1,191 @@
+"""Services of the Adap1Status integration."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers import device_registry as dr
+from homeassistant.util import dt as dt_util, slugify
+
+from .bulk_import import async_import_meters, load_meter_file
+from .const import (
+    ATTR_DIRECTORY,
+    ATTR_FILE,
+    ATTR_FORMAT,
+    ATTR_METERS,
+    DOMAIN,
+    HISTORY_EXPORT_DIR,
+    HISTORY_FORMAT_BINARY,
+    HISTORY_FORMAT_CSV,
+    SERVICE_EXPORT_HISTORY,
+    SERVICE_IMPORT_METERS,
+    SERVICE_REFRESH,
+)
+from .history import format_binary, format_csv
+
+if TYPE_CHECKING:
+    from array import array
+
+    from . import Adap1StatusDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_IMPORT_METERS_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(ATTR_METERS): vol.All(cv.ensure_list, [dict]),
+            vol.Optional(ATTR_FILE): cv.string,
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_METERS, ATTR_FILE),
+)
+
+SERVICE_REFRESH_SCHEMA = vol.Schema(
+    {vol.Required(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string])}
+)
+
+SERVICE_EXPORT_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_FORMAT, default=HISTORY_FORMAT_CSV): vol.In(
+            (HISTORY_FORMAT_CSV, HISTORY_FORMAT_BINARY)
+        ),
+        vol.Optional(ATTR_DIRECTORY): cv.string,
+    }
+)
+
+
+def _write_history(
+    path: str,
+    snapshot: tuple[array[float], dict[str, array[float]]],
+    export_format: str,
+) -> int:
+    """Format a history snapshot and write it to path; return the row count."""
+    timestamps, columns = snapshot
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if export_format == HISTORY_FORMAT_BINARY:
+        with open(path, "wb") as file:
+            file.write(format_binary(timestamps, columns))
+    else:
+        with open(path, "w", encoding="utf-8", newline="") as file:
+            file.write(format_csv(timestamps, columns))
+    return len(timestamps)
+
+
+def _async_get_coordinators(
+    hass: HomeAssistant, device_ids: list[str]
+) -> list[Adap1StatusDataUpdateCoordinator]:
+    """Return the coordinators of the targeted devices.
+
+    Raises HomeAssistantError if a device is not an ADA-P1 meter.
+    """
+    device_reg = dr.async_get(hass)
+    coordinators = hass.data.get(DOMAIN, {})
+    targeted = []
+    for device_id in device_ids:
+        device = device_reg.async_get(device_id)
+        entry_ids = device.config_entries if device is not None else set()
+        matches = [
+            coordinators[entry_id] for entry_id in entry_ids if entry_id in coordinators
+        ]
+        if not matches:
+            raise HomeAssistantError(
+                f"Device {device_id} is not a loaded ADA-P1 Meter"
+            )
+        targeted.extend(matches)
+    return targeted
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services of the integration."""
+
+    async def _async_import_meters(call: ServiceCall) -> ServiceResponse:
+        """Import the meters listed in the call and/or a file."""
+        rows = list(call.data.get(ATTR_METERS, []))
+        if path := call.data.get(ATTR_FILE):
+            if not hass.config.is_allowed_path(path):
+                raise HomeAssistantError(f"Access to {path} is not allowed")
+            try:
+                rows += await hass.async_add_executor_job(load_meter_file, path)
+            except (OSError, ValueError, HomeAssistantError) as err:
+                raise HomeAssistantError(f"Cannot read {path}: {err}") from err
+        
+        summary = await async_import_meters(hass, rows)
+        _LOGGER.info(
+            "Imported %d meter(s), %d already configured, %d failed",
+            len(summary["added"]),
+            len(summary["already_configured"]),
+            len(summary["failed"]),
+        )
+        return summary
+
+    async def _async_refresh(call: ServiceCall) -> None:
+        """Refresh the targeted meters now."""
+        coordinators = _async_get_coordinators(hass, call.data[ATTR_DEVICE_ID])
+        await asyncio.gather(
+            *(coordinator.async_refresh_on_demand() for coordinator in coordinators)
+        )
+
+    async def _async_export_history(call: ServiceCall) -> ServiceResponse:
+        """Write the sample history of the targeted meters to files."""
+        coordinators = _async_get_coordinators(hass, call.data[ATTR_DEVICE_ID])
+        if directory := call.data.get(ATTR_DIRECTORY):
+            if not hass.config.is_allowed_path(directory):
+                raise HomeAssistantError(f"Access to {directory} is not allowed")
+        else:
+            directory = hass.config.path(HISTORY_EXPORT_DIR)
+        
+        export_format = call.data[ATTR_FORMAT]
+        extension = "bin" if export_format == HISTORY_FORMAT_BINARY else "csv"
+        stamp = dt_util.utcnow().strftime("%Y%m%dT%H%M%SZ")
+        files = []
+        for coordinator in coordinators:
+            if coordinator.history is None:
+                raise HomeAssistantError(
+                    f"Sample history is disabled for {coordinator.host}"
+                )
+            path = os.path.join(
+                directory, f"{slugify(coordinator.host)}_{stamp}.{extension}"
+            )
+            # Copied in the event loop, formatted and written in the executor
+            snapshot = coordinator.history.snapshot()
+            try:
+                rows = await hass.async_add_executor_job(
+                    _write_history, path, snapshot, export_format
+                )
+            except OSError as err:
+                raise HomeAssistantError(f"Cannot write {path}: {err}") from err
+            files.append({"host": coordinator.host, "path": path, "samples": rows})
+        
+        return {"files": files}
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_REFRESH, _async_refresh, schema=SERVICE_REFRESH_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_IMPORT_METERS,
+        _async_import_meters,
+        schema=SERVICE_IMPORT_METERS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXPORT_HISTORY,
+        _async_export_history,
+        schema=SERVICE_EXPORT_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
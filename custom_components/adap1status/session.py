@@ -0,0 +1,66 @@
+"""HTTP session handling for the Adap1Status integration."""
+from __future__ import annotations
+
+import aiohttp
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
+
+from .const import (
+    CONNECTIONS_PER_HOST,
+    DATA_SESSION,
+    DATA_SESSION_CLOSE_LISTENER,
+    KEEPALIVE_TIMEOUT,
+)
+
+
+@callback
+def async_get_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """Return the integration-owned session, creating it if needed.
+
+    The session has its own connector so that connections to the meters are
+    kept alive between polls (instead of paying a TCP handshake on every
+    request) and each meter gets at most CONNECTIONS_PER_HOST sockets. It is
+    shared by the coordinators and the config and options flows.
+    """
+    session: aiohttp.ClientSession | None = hass.data.get(DATA_SESSION)
+    if session is not None and not session.closed:
+        return session
+    # A session closed behind our back still has its close listener
+    _async_remove_close_listener(hass)
+
+    connector = aiohttp.TCPConnector(
+        limit_per_host=CONNECTIONS_PER_HOST,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+    )
+    session = aiohttp.ClientSession(
+        connector=connector,
+        headers={aiohttp.hdrs.USER_AGENT: SERVER_SOFTWARE},
+    )
+    hass.data[DATA_SESSION] = session
+
+    async def _async_close_session(_event: Event) -> None:
+        # The listener is gone once it fired
+        hass.data.pop(DATA_SESSION_CLOSE_LISTENER, None)
+        await session.close()
+
+    hass.data[DATA_SESSION_CLOSE_LISTENER] = hass.bus.async_listen_once(
+        EVENT_HOMEASSISTANT_CLOSE, _async_close_session
+    )
+    return session
+
+
+@callback
+def _async_remove_close_listener(hass: HomeAssistant) -> None:
+    """Stop listening for Home Assistant closing on behalf of the old session."""
+    if (unsubscribe := hass.data.pop(DATA_SESSION_CLOSE_LISTENER, None)) is not None:
+        unsubscribe()
+
+
+async def async_close_session(hass: HomeAssistant) -> None:
+    """Close the integration-owned session, if one is open."""
+    _async_remove_close_listener(hass)
+    session: aiohttp.ClientSession | None = hass.data.pop(DATA_SESSION, None)
+    if session is not None and not session.closed:
+        await session.close()
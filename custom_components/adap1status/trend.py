@@ -0,0 +1,96 @@
+"""Heap-leak trend estimation for the Adap1Status integration."""
+from __future__ import annotations
+
+from .const import HEAP_TREND_MIN_SAMPLES, HEAP_TREND_MIN_SPAN
+
+
+class HeapTrend:
+    """Online least-squares fit of free heap against uptime.
+
+    Running means and co-moments are updated in O(1) per sample (Welford),
+    so no samples are kept and no history has to be read back from the
+    recorder. The fit restarts whenever the uptime goes down, i.e. the meter
+    rebooted and its heap was reset.
+    """
+
+    __slots__ = (
+        "count",
+        "leak_rate",
+        "time_to_exhaustion",
+        "_first_uptime",
+        "_last_uptime",
+        "_mean_x",
+        "_mean_y",
+        "_m2_x",
+        "_c_xy",
+        "_low_water",
+    )
+
+    def __init__(self) -> None:
+        """Initialize an empty fit."""
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all samples."""
+        self.count = 0
+        # Bytes per second lost, positive while the free heap shrinks
+        self.leak_rate: float | None = None
+        # Hours until the free heap reaches zero at the current leak rate
+        self.time_to_exhaustion: float | None = None
+        self._first_uptime = 0.0
+        self._last_uptime: float | None = None
+        self._mean_x = 0.0
+        self._mean_y = 0.0
+        self._m2_x = 0.0
+        self._c_xy = 0.0
+        self._low_water = float("inf")
+
+    def add(
+        self, uptime: float, heap_free: float, heap_min_free: float | None = None
+    ) -> bool:
+        """Add a sample; return True if the published estimate changed."""
+        before = (self.leak_rate, self.time_to_exhaustion)
+        if self._last_uptime is not None:
+            if uptime < self._last_uptime:
+                self.reset()
+            elif uptime == self._last_uptime:
+                # Same sample delivered twice (e.g. a push and a poll)
+                return False
+        if not self.count:
+            self._first_uptime = uptime
+        self._last_uptime = uptime
+
+        self.count += 1
+        dx = uptime - self._mean_x
+        self._mean_x += dx / self.count
+        self._mean_y += (heap_free - self._mean_y) / self.count
+        self._m2_x += dx * (uptime - self._mean_x)
+        self._c_xy += dx * (heap_free - self._mean_y)
+        # The meter's own low-water mark also covers dips between polls
+        self._low_water = min(
+            self._low_water,
+            heap_free if heap_min_free is None else min(heap_free, heap_min_free),
+        )
+
+        self._estimate(uptime)
+        return (self.leak_rate, self.time_to_exhaustion) != before
+
+    def _estimate(self, uptime: float) -> None:
+        """Update leak_rate and time_to_exhaustion from the running fit."""
+        if (
+            self.count < HEAP_TREND_MIN_SAMPLES
+            or uptime - self._first_uptime < HEAP_TREND_MIN_SPAN
+            or not self._m2_x
+        ):
+            self.leak_rate = self.time_to_exhaustion = None
+            return
+
+        slope = self._c_xy / self._m2_x
+        self.leak_rate = round(-slope, 3)
+        if slope >= 0:
+            self.time_to_exhaustion = None
+            return
+
+        fitted = self._mean_y + slope * (uptime - self._mean_x)
+        remaining = max(0.0, min(fitted, self._low_water))
+        self.time_to_exhaustion = round(remaining / -slope / 3600, 1)
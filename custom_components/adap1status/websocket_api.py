@@ -0,0 +1,153 @@
+"""WebSocket commands of the Adap1Status integration."""
+from __future__ import annotations
+
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import (
+    DOMAIN,
+    SIGNAL_METER_CHANGED,
+    WS_TYPE_FLEET,
+    WS_TYPE_FLEET_SUBSCRIBE,
+)
+
+if TYPE_CHECKING:
+    from . import Adap1StatusDataUpdateCoordinator
+
+
+@callback
+def async_setup_websocket_api(hass: HomeAssistant) -> None:
+    """Register the WebSocket commands of the integration."""
+    websocket_api.async_register_command(hass, websocket_fleet)
+    websocket_api.async_register_command(hass, websocket_subscribe_fleet)
+
+
+def _meter_state(
+    hass: HomeAssistant, entry_id: str, coordinator: Adap1StatusDataUpdateCoordinator
+) -> dict[str, Any]:
+    """Return the latest payload, update time and availability of a meter."""
+    entry = hass.config_entries.async_get_entry(entry_id)
+    updated = coordinator.last_update_success_time
+    return {
+        "title": entry.title if entry is not None else coordinator.host,
+        "available": coordinator.last_update_success,
+        "last_update": updated.isoformat() if updated is not None else None,
+        "data": dict(coordinator.data or {}),
+    }
+
+
+def _fleet_state(
+    hass: HomeAssistant, coordinators: dict[str, Adap1StatusDataUpdateCoordinator]
+) -> dict[str, dict[str, Any]]:
+    """Return the state of every meter by config entry id."""
+    return {
+        entry_id: _meter_state(hass, entry_id, coordinator)
+        for entry_id, coordinator in coordinators.items()
+    }
+
+
+@websocket_api.websocket_command({vol.Required("type"): WS_TYPE_FLEET})
+@callback
+def websocket_fleet(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return the state of every meter in a single message."""
+    connection.send_result(
+        msg["id"], {"meters": _fleet_state(hass, hass.data.get(DOMAIN, {}))}
+    )
+
+
+@websocket_api.websocket_command({vol.Required("type"): WS_TYPE_FLEET_SUBSCRIBE})
+@callback
+def websocket_subscribe_fleet(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Send the state of every meter, then only what changed per meter.
+
+    Each event maps config entry ids to the fields that changed; changed
+    payload keys are listed under "data", with None for a key that is gone.
+    A meter that is set up or reloaded is sent in full again, replacing what
+    was sent for it before, and a meter that is unloaded is sent as None.
+    """
+    sent: dict[str, dict[str, Any]] = {}
+    removers: dict[str, CALLBACK_TYPE] = {}
+
+    @callback
+    def _async_send(meters: dict[str, Any]) -> None:
+        """Send an event with the given meters."""
+        connection.send_message(
+            websocket_api.event_message(msg["id"], {"meters": meters})
+        )
+
+    @callback
+    def _async_send_delta(
+        entry_id: str, coordinator: Adap1StatusDataUpdateCoordinator
+    ) -> None:
+        """Send the part of a meter's state that changed since the last event."""
+        current = _meter_state(hass, entry_id, coordinator)
+        previous, sent[entry_id] = sent[entry_id], current
+        old, new = previous["data"], current["data"]
+        delta: dict[str, Any] = {}
+        if changed := {
+            key: value
+            for key, value in new.items()
+            if key not in old or old[key] != value
+        } | dict.fromkeys(old.keys() - new.keys()):
+            delta["data"] = changed
+        for field in ("title", "available"):
+            if current[field] != previous[field]:
+                delta[field] = current[field]
+        if delta:
+            delta["last_update"] = current["last_update"]
+            _async_send({entry_id: delta})
+
+    @callback
+    def _async_bind(entry_id: str) -> dict[str, Any] | None:
+        """Follow the current coordinator of an entry and return its state."""
+        if (remove := removers.pop(entry_id, None)) is not None:
+            remove()
+        sent.pop(entry_id, None)
+        coordinator = hass.data.get(DOMAIN, {}).get(entry_id)
+        if coordinator is None:
+            return None
+        sent[entry_id] = _meter_state(hass, entry_id, coordinator)
+        # Listeners without a context hear about every dispatched change
+        removers[entry_id] = coordinator.async_add_listener(
+            partial(_async_send_delta, entry_id, coordinator)
+        )
+        return sent[entry_id]
+
+    @callback
+    def _async_meter_changed(entry_id: str) -> None:
+        """Re-bind to a meter that was set up, reloaded or unloaded."""
+        was_sent = entry_id in sent
+        if (state := _async_bind(entry_id)) is not None or was_sent:
+            _async_send({entry_id: state})
+
+    for entry_id in hass.data.get(DOMAIN, {}):
+        _async_bind(entry_id)
+    remove_dispatcher = async_dispatcher_connect(
+        hass, SIGNAL_METER_CHANGED, _async_meter_changed
+    )
+
+    @callback
+    def _async_unsubscribe() -> None:
+        """Stop listening to the meters."""
+        remove_dispatcher()
+        for remove in removers.values():
+            remove()
+        removers.clear()
+
+    connection.subscriptions[msg["id"]] = _async_unsubscribe
+    connection.send_result(msg["id"])
+    _async_send(dict(sent))
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Asyncio fleet simulator for ADA-P1 Meters.
+
+Serves thousands of virtual meters from a single process, each with its own
+state evolution (uptime, heap drift with an optional slow leak, RSSI random
+walk, filesystem usage, serial and ACK activity). Latency, timeouts, HTTP
+errors, malformed JSON and reboots can be injected per request.
+
+Usage:
+    python3 examples/fleet_simulator.py --meters 500 --base-port 9000
+    python3 examples/fleet_simulator.py --meters 500 --layout paths --port 8989
+
+Layouts:
+    ports   meter i listens on base-port + i and serves /status and
+            /status/stream, exactly like a real meter (default)
+    paths   all meters share --port; meter i serves /meters/<i>/status and
+            /meters/<i>/status/stream
+
+Requires aiohttp (installed with Home Assistant).
+"""
+
+import argparse
+import asyncio
+from dataclasses import dataclass
+import json
+import random
+import time
+
+from aiohttp import web
+
+HEAP_TOTAL = 327680
+HEAP_START = 140000
+FS_TOTAL = 1048576
+
+
+@dataclass
+class FaultProfile:
+    """Per-request fault injection settings; rates are probabilities 0..1."""
+
+    latency_ms: float = 0.0
+    latency_jitter_ms: float = 0.0
+    timeout_rate: float = 0.0
+    timeout_duration: float = 30.0
+    error_rate: float = 0.0
+    malformed_rate: float = 0.0
+    reboot_rate: float = 0.0
+
+
+class VirtualMeter:
+    """State of one simulated meter."""
+
+    def __init__(self, index, seed, leak_rate):
+        """Initialize the meter with randomised, reproducible starting values."""
+        self.index = index
+        self.rng = random.Random(seed * 100003 + index)
+        self.hostname = f"ada-p1-{index:05d}"
+        self.local_ip = f"10.{(index >> 16) & 255}.{(index >> 8) & 255}.{index & 255}"
+        self.wifi_channel = self.rng.choice([1, 6, 11])
+        self.wifi_rssi = float(self.rng.randint(-80, -50))
+        # Bytes per second lost by this meter; 0 for a healthy one
+        self.leak_rate = leak_rate * self.rng.random()
+        self.requests = 0
+        self.boot()
+        # Pretend the meter has already been running for a while
+        self.boot_time -= self.rng.uniform(0, 86400)
+
+    def boot(self):
+        """(Re)start the meter."""
+        now = time.monotonic()
+        self.boot_time = now
+        self.last_step = now
+        self.heap_free = float(HEAP_START)
+        self.heap_min_free = HEAP_START
+        self.fs_used = float(FS_TOTAL // 2)
+        self.last_serial = now
+        self.ack_items = 0
+
+    def step(self):
+        """Advance the state to now."""
+        now = time.monotonic()
+        elapsed = now - self.last_step
+        self.last_step = now
+        rng = self.rng
+
+        self.wifi_rssi = min(-30.0, max(-95.0, self.wifi_rssi + rng.gauss(0, 1.5)))
+        self.heap_free += rng.gauss(0, 400) - self.leak_rate * elapsed
+        self.heap_free = min(HEAP_TOTAL * 0.6, max(4096.0, self.heap_free))
+        self.heap_min_free = min(self.heap_min_free, int(self.heap_free))
+        self.fs_used = min(FS_TOTAL * 0.95, max(0.0, self.fs_used + rng.gauss(0, 200)))
+        if rng.random() < 0.5:
+            self.last_serial = now
+        if rng.random() < 0.2:
+            self.ack_items = rng.randint(0, 5)
+
+    def status(self):
+        """Return the current status payload."""
+        self.step()
+        now = time.monotonic()
+        uptime = int(now - self.boot_time)
+        heap_free = int(self.heap_free)
+        return {
+            "os_version": "1.2.3",
+            "local_ip": self.local_ip,
+            "hostname": self.hostname,
+            "ssid": "SimWiFi",
+            "mqtt_server": "10.0.0.10",
+            "mqtt_connected": True,
+            "uptime_hhmm": f"{uptime // 3600:02d}:{uptime % 3600 // 60:02d}",
+            "uptime_seconds": uptime,
+            "wifi_rssi": round(self.wifi_rssi),
+            "wifi_channel": self.wifi_channel,
+            "serial_recent_sec": int(now - self.last_serial),
+            "heap_total": HEAP_TOTAL,
+            "heap_free": heap_free,
+            "heap_min_free": self.heap_min_free,
+            "heap_max_alloc": int(heap_free * 0.8),
+            "heap_fragmentation": self.rng.randint(10, 25),
+            "fs_total": FS_TOTAL,
+            "fs_used": int(self.fs_used),
+            "watchdog_enabled": True,
+            "watchdog_last_kick_ms": self.rng.randint(50, 200),
+            "telegram_url_mode": False,
+            "telegram_url_set": True,
+            "rules_loaded": True,
+            "chip_cores": 2,
+            "ack_items": self.ack_items,
+        }
+
+
+class FleetSimulator:
+    """Serve a fleet of virtual meters over HTTP."""
+
+    def __init__(self, meters, faults, stream_interval):
+        """Initialize the simulator."""
+        self.meters = meters
+        self.faults = faults
+        self.stream_interval = stream_interval
+        self.rng = random.Random()
+        self.counters = {"requests": 0, "timeouts": 0, "errors": 0, "malformed": 0, "reboots": 0}
+
+    async def _inject_faults(self, meter):
+        """Apply latency, reboots, timeouts and HTTP errors to a request.
+
+        Returns an error response to send instead of the payload, or None.
+        """
+        faults = self.faults
+        rng = self.rng
+        self.counters["requests"] += 1
+        meter.requests += 1
+
+        delay = faults.latency_ms + rng.uniform(-1, 1) * faults.latency_jitter_ms
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+        if rng.random() < faults.reboot_rate:
+            self.counters["reboots"] += 1
+            meter.boot()
+        if rng.random() < faults.timeout_rate:
+            self.counters["timeouts"] += 1
+            await asyncio.sleep(faults.timeout_duration)
+        if rng.random() < faults.error_rate:
+            self.counters["errors"] += 1
+            return web.Response(status=rng.choice([500, 503]), text="Simulated error")
+        return None
+
+    async def handle_status(self, request, meter):
+        """Serve the status of a meter."""
+        if (error := await self._inject_faults(meter)) is not None:
+            return error
+        body = json.dumps(meter.status(), separators=(",", ":"))
+        if self.rng.random() < self.faults.malformed_rate:
+            self.counters["malformed"] += 1
+            body = body[: self.rng.randint(1, len(body) - 1)]
+        return web.Response(text=body, content_type="application/json")
+
+    async def handle_stream(self, request, meter):
+        """Stream the status of a meter as server-sent events or NDJSON."""
+        if (error := await self._inject_faults(meter)) is not None:
+            return error
+        ndjson = request.query.get("format") == "ndjson"
+        response = web.StreamResponse(
+            headers={
+                "Content-Type": "application/x-ndjson" if ndjson else "text/event-stream",
+                "Cache-Control": "no-cache",
+            }
+        )
+        await response.prepare(request)
+        try:
+            while True:
+                frame = json.dumps(meter.status(), separators=(",", ":"))
+                await response.write(
+                    f"{frame}\n".encode() if ndjson else f"data: {frame}\n\n".encode()
+                )
+                await asyncio.sleep(self.stream_interval)
+        except ConnectionResetError:
+            pass
+        return response
+
+    def meter_app(self, meter):
+        """Return an application serving a single meter at the device paths."""
+        app = web.Application()
+        app.router.add_get("/status", lambda request: self.handle_status(request, meter))
+        app.router.add_get(
+            "/status/stream", lambda request: self.handle_stream(request, meter)
+        )
+        return app
+
+    def fleet_app(self):
+        """Return an application serving every meter below /meters/<index>."""
+
+        def _meter(request):
+            index = int(request.match_info["index"])
+            if not 0 <= index < len(self.meters):
+                raise web.HTTPNotFound(text="Unknown meter")
+            return self.meters[index]
+
+        app = web.Application()
+        app.router.add_get(
+            r"/meters/{index:\d+}/status",
+            lambda request: self.handle_status(request, _meter(request)),
+        )
+        app.router.add_get(
+            r"/meters/{index:\d+}/status/stream",
+            lambda request: self.handle_stream(request, _meter(request)),
+        )
+        return app
+
+    async def report(self, interval):
+        """Print request counters every interval seconds."""
+        previous = 0
+        while True:
+            await asyncio.sleep(interval)
+            requests = self.counters["requests"]
+            rate = (requests - previous) / interval
+            previous = requests
+            print(f"{rate:8.1f} req/s  " + "  ".join(f"{k}={v}" for k, v in self.counters.items()))
+
+
+async def serve(args):
+    """Start the simulator and run until interrupted."""
+    faults = FaultProfile(
+        latency_ms=args.latency,
+        latency_jitter_ms=args.latency_jitter,
+        timeout_rate=args.timeout_rate,
+        timeout_duration=args.timeout_duration,
+        error_rate=args.error_rate,
+        malformed_rate=args.malformed_rate,
+        reboot_rate=args.reboot_rate,
+    )
+    meters = [VirtualMeter(index, args.seed, args.leak_rate) for index in range(args.meters)]
+    simulator = FleetSimulator(meters, faults, args.stream_interval)
+
+    runners = []
+    if args.layout == "paths":
+        runner = web.AppRunner(simulator.fleet_app(), access_log=None)
+        await runner.setup()
+        await web.TCPSite(runner, args.bind, args.port).start()
+        runners.append(runner)
+        print(f"Serving {len(meters)} meters on http://{args.bind}:{args.port}/meters/<0..{len(meters) - 1}>/status")
+    else:
+        for meter in meters:
+            runner = web.AppRunner(simulator.meter_app(meter), access_log=None)
+            await runner.setup()
+            await web.TCPSite(runner, args.bind, args.base_port + meter.index).start()
+            runners.append(runner)
+        print(
+            f"Serving {len(meters)} meters on http://{args.bind}:"
+            f"{args.base_port}..{args.base_port + len(meters) - 1}/status"
+        )
+
+    print("Press Ctrl+C to stop")
+    try:
+        if args.report:
+            await simulator.report(args.report)
+        else:
+            await asyncio.Event().wait()
+    finally:
+        for runner in runners:
+            await runner.cleanup()
+
+
+def build_parser():
+    """Return the command line parser."""
+    parser = argparse.ArgumentParser(description="Simulate a fleet of ADA-P1 Meters.")
+    parser.add_argument("--meters", type=int, default=1, help="number of virtual meters")
+    parser.add_argument("--layout", choices=["ports", "paths"], default="ports")
+    parser.add_argument("--bind", default="0.0.0.0", help="address to listen on")
+    parser.add_argument("--base-port", type=int, default=9000, help="first port (ports layout)")
+    parser.add_argument("--port", type=int, default=8989, help="port (paths layout)")
+    parser.add_argument("--seed", type=int, default=1, help="seed for the meter states")
+    parser.add_argument("--leak-rate", type=float, default=0.0, help="max heap leak in bytes/s")
+    parser.add_argument("--stream-interval", type=float, default=1.0, help="seconds between stream frames")
+    parser.add_argument("--latency", type=float, default=0.0, help="added latency in ms")
+    parser.add_argument("--latency-jitter", type=float, default=0.0, help="latency jitter in ms")
+    parser.add_argument("--timeout-rate", type=float, default=0.0, help="probability a request hangs")
+    parser.add_argument("--timeout-duration", type=float, default=30.0, help="seconds a hung request hangs")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="probability of HTTP 500/503")
+    parser.add_argument("--malformed-rate", type=float, default=0.0, help="probability of truncated JSON")
+    parser.add_argument("--reboot-rate", type=float, default=0.0, help="probability a request reboots the meter")
+    parser.add_argument("--report", type=float, default=0.0, help="print counters every N seconds")
+    return parser
+
+
+def main(argv=None):
+    """Run the simulator from the command line."""
+    args = build_parser().parse_args(argv)
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        print("\nShutting down simulator...")
+
+
+if __name__ == "__main__":
+    main()
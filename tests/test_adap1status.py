@@ -1,6 +1,8 @@
 """Tests for the Adap1Status integration."""
 from __future__ import annotations
 
+import json
+import time
 from unittest.mock import AsyncMock, patch
 
 import aiohttp
@@ -86,7 +88,9 @@ async def test_coordinator_successful_update(hass: HomeAssistant, mock_status_da
     
     mock_response = AsyncMock()
     mock_response.status = 200
-    mock_response.json = AsyncMock(return_value=mock_status_data)
+    mock_response.read = AsyncMock(
+        return_value=json.dumps(mock_status_data).encode()
+    )
     
     with patch.object(coordinator.session, "get") as mock_get:
         mock_get.return_value.__aenter__.return_value = mock_response
@@ -145,9 +149,11 @@ async def test_setup_entry(hass: HomeAssistant, mock_config_entry, mock_status_d
     
     mock_response = AsyncMock()
     mock_response.status = 200
-    mock_response.json = AsyncMock(return_value=mock_status_data)
+    mock_response.read = AsyncMock(
+        return_value=json.dumps(mock_status_data).encode()
+    )
     
-    with patch("custom_components.adap1status.async_get_clientsession") as mock_session:
+    with patch("custom_components.adap1status.async_get_session") as mock_session:
         mock_session.return_value.get.return_value.__aenter__.return_value = mock_response
         
         with patch(
@@ -299,4 +305,1390 @@ async def test_migrate_entry_v1_to_v2(hass: HomeAssistant):
     mock_update_entry.assert_called_once_with(v1_entry, version=2)
 
 
+@pytest.mark.asyncio
+async def test_coordinator_dispatches_only_changed_keys(
+    hass: HomeAssistant, mock_status_data
+):
+    """Test that only listeners for changed keys are notified."""
+    from datetime import timedelta
+    from unittest.mock import MagicMock
+
+    coordinator = Adap1StatusDataUpdateCoordinator(
+        hass, "192.168.1.100", DEFAULT_PORT, timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+    )
+
+    hostname_listener = MagicMock()
+    heap_listener = MagicMock()
+    global_listener = MagicMock()
+    removers = [
+        coordinator.async_add_listener(hostname_listener, "hostname"),
+        coordinator.async_add_listener(heap_listener, "heap_free"),
+        coordinator.async_add_listener(global_listener),
+    ]
+
+    # The first dispatch reaches every listener.
+    coordinator.async_set_updated_data(dict(mock_status_data))
+    assert hostname_listener.call_count == 1
+    assert heap_listener.call_count == 1
+    assert global_listener.call_count == 1
+
+    # Only the heap value moves.
+    coordinator.async_set_updated_data({**mock_status_data, "heap_free": 120000})
+    assert hostname_listener.call_count == 1
+    assert heap_listener.call_count == 2
+    assert global_listener.call_count == 2
+
+    # Identical payload: nobody is notified.
+    coordinator.async_set_updated_data({**mock_status_data, "heap_free": 120000})
+    assert heap_listener.call_count == 2
+    assert global_listener.call_count == 2
+
+    for remove in removers:
+        remove()
+
+
+@pytest.mark.asyncio
+async def test_scheduler_bounds_concurrent_requests(hass: HomeAssistant):
+    """Test that the scheduler caps in-flight requests and reports the queue."""
+    import asyncio
+
+    from custom_components.adap1status.scheduler import Adap1StatusPollScheduler
+
+    scheduler = Adap1StatusPollScheduler(hass, max_concurrent=1)
+    release = asyncio.Event()
+
+    async def _request() -> None:
+        async with scheduler.async_request_slot():
+            await release.wait()
+
+    first = hass.async_create_task(_request())
+    second = hass.async_create_task(_request())
+    await asyncio.sleep(0)
+
+    assert scheduler.in_flight == 1
+    assert scheduler.queue_depth == 1
+
+    release.set()
+    await asyncio.gather(first, second)
+
+    assert scheduler.in_flight == 0
+    assert scheduler.queue_depth == 0
+    assert scheduler.as_dict()["peak_queue_depth"] == 1
+    scheduler.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_scheduler_staggers_registered_coordinators(hass: HomeAssistant):
+    """Test that coordinators registered together get distinct poll offsets."""
+    from datetime import timedelta
+
+    from custom_components.adap1status.scheduler import Adap1StatusPollScheduler
+
+    scheduler = Adap1StatusPollScheduler(hass)
+    coordinators = [
+        Adap1StatusDataUpdateCoordinator(
+            hass,
+            f"192.168.1.{index}",
+            DEFAULT_PORT,
+            timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+            scheduler=scheduler,
+        )
+        for index in range(4)
+    ]
+
+    with patch(
+        "custom_components.adap1status.scheduler.async_call_later"
+    ) as mock_call_later:
+        removers = [scheduler.async_register(c) for c in coordinators]
+
+    delays = [call.args[1] for call in mock_call_later.call_args_list]
+    assert len(set(delays)) == len(coordinators)
+    assert all(0 <= delay < DEFAULT_SCAN_INTERVAL for delay in delays)
+    assert all(c.update_interval is None for c in coordinators)
+    assert scheduler.registered == len(coordinators)
+
+    for remove in removers:
+        remove()
+    assert scheduler.registered == 0
+    scheduler.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_scheduler_cancels_timers_when_hass_stops(hass: HomeAssistant):
+    """Test that no poll timer outlives Home Assistant."""
+    from datetime import timedelta
+
+    from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+
+    from custom_components.adap1status.scheduler import Adap1StatusPollScheduler
+
+    scheduler = Adap1StatusPollScheduler(hass)
+    coordinator = Adap1StatusDataUpdateCoordinator(
+        hass,
+        "192.168.1.100",
+        DEFAULT_PORT,
+        timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+        scheduler=scheduler,
+    )
+    scheduler.async_register(coordinator)
+    assert scheduler.registered == 1
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+
+    assert scheduler.registered == 0
+
+
+@pytest.mark.asyncio
+async def test_session_is_shared_and_closed(hass: HomeAssistant):
+    """Test that the integration-owned session is reused until closed."""
+    from custom_components.adap1status.const import CONNECTIONS_PER_HOST
+    from custom_components.adap1status.session import (
+        async_close_session,
+        async_get_session,
+    )
+
+    session = async_get_session(hass)
+    assert async_get_session(hass) is session
+    assert session.connector.limit_per_host == CONNECTIONS_PER_HOST
+
+    await async_close_session(hass)
+    assert session.closed
+    assert async_get_session(hass) is not session
+    await async_close_session(hass)
+
+
+@pytest.mark.asyncio
+async def test_session_close_listener_is_not_leaked(hass: HomeAssistant):
+    """Test that re-creating the session keeps a single close listener."""
+    from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+
+    from custom_components.adap1status.session import (
+        async_close_session,
+        async_get_session,
+    )
+
+    def _listeners() -> int:
+        return hass.bus.async_listeners().get(EVENT_HOMEASSISTANT_CLOSE, 0)
+
+    before = _listeners()
+    for _ in range(3):
+        async_get_session(hass)
+        assert _listeners() == before + 1
+        await async_close_session(hass)
+        assert _listeners() == before
+
+
+def test_decode_status_drops_unknown_keys(mock_status_data):
+    """Test that decoding keeps only the keys declared in const.py."""
+    from custom_components.adap1status.parser import decode_status
+
+    body = json.dumps(
+        {**mock_status_data, "future_firmware_field": [1, 2, 3]}
+    ).encode()
+
+    assert decode_status(body) == mock_status_data
+
+
+def test_decode_status_rejects_non_object():
+    """Test that a JSON body that is not an object is rejected."""
+    from custom_components.adap1status.parser import decode_status
+
+    with pytest.raises(ValueError):
+        decode_status(b"[1, 2, 3]")
+    with pytest.raises(ValueError):
+        decode_status(b"{not json")
+
+
+def test_adaptive_poll_interval(mock_status_data):
+    """Test that the adaptive interval follows activity and reachability."""
+    from custom_components.adap1status.adaptive import AdaptivePollInterval
+
+    adaptive = AdaptivePollInterval(30, 10, 300)
+
+    # Stable values back off towards the maximum.
+    assert adaptive.success(mock_status_data).total_seconds() == 45
+    assert adaptive.success(mock_status_data).total_seconds() == 67.5
+
+    # New ACK items mean the meter is busy: poll at the minimum interval.
+    busy = {**mock_status_data, "ack_items": 3}
+    assert adaptive.success(busy).total_seconds() == 10
+
+    # A new serial frame resets serial_recent_sec.
+    adaptive.success({**busy, "serial_recent_sec": 20})
+    assert adaptive.success({**busy, "serial_recent_sec": 1}).total_seconds() == 10
+
+    # Unreachable: exponential back-off capped at the maximum.
+    assert adaptive.failure().total_seconds() == 60
+    assert adaptive.failure().total_seconds() == 120
+    assert adaptive.failure().total_seconds() == 240
+    assert adaptive.failure().total_seconds() == 300
+
+    # Reachable again: resume from the configured interval.
+    assert adaptive.success(busy).total_seconds() == 30
+
+
+def test_circuit_breaker_transitions():
+    """Test the closed -> open -> half-open -> closed cycle."""
+    from custom_components.adap1status.circuit_breaker import (
+        CircuitBreaker,
+        CircuitState,
+    )
+
+    breaker = CircuitBreaker("192.168.1.100", failure_threshold=2, recovery_timeout=60)
+    transitions = []
+    breaker.async_add_listener(lambda: transitions.append(breaker.state))
+
+    with patch(
+        "custom_components.adap1status.circuit_breaker.time.monotonic",
+        return_value=1000.0,
+    ) as mock_monotonic:
+        breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.allow_request() is False
+
+        # A failed probe re-opens the circuit for another recovery period.
+        mock_monotonic.return_value = 1061.0
+        assert breaker.allow_request() is True
+        assert breaker.state is CircuitState.HALF_OPEN
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.allow_request() is False
+
+        mock_monotonic.return_value = 1122.0
+        assert breaker.allow_request() is True
+        breaker.record_success()
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.failures == 0
+
+    assert transitions == [
+        CircuitState.OPEN,
+        CircuitState.HALF_OPEN,
+        CircuitState.OPEN,
+        CircuitState.HALF_OPEN,
+        CircuitState.CLOSED,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_coordinator_skips_request_while_circuit_open(hass: HomeAssistant):
+    """Test that an open circuit fails the poll without an HTTP request."""
+    from datetime import timedelta
+
+    from custom_components.adap1status.circuit_breaker import CircuitBreaker
+
+    breaker = CircuitBreaker("192.168.1.100", failure_threshold=1, recovery_timeout=60)
+    coordinator = Adap1StatusDataUpdateCoordinator(
+        hass,
+        "192.168.1.100",
+        DEFAULT_PORT,
+        timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+        breaker=breaker,
+    )
+
+    with patch.object(coordinator.session, "get") as mock_get:
+        mock_get.side_effect = aiohttp.ClientError("Timeout")
+
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
+        with pytest.raises(UpdateFailed) as exc_info:
+            await coordinator._async_update_data()
+
+        assert "Circuit breaker open" in str(exc_info.value)
+        mock_get.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_applies_mqtt_push(
+    hass: HomeAssistant, mqtt_mock, mock_status_data
+):
+    """Test that status messages pushed over MQTT update the coordinator."""
+    from datetime import timedelta
+
+    from pytest_homeassistant_custom_component.common import (
+        async_fire_mqtt_message,
+        async_fire_time_changed,
+    )
+
+    from homeassistant.util import dt as dt_util
+
+    from custom_components.adap1status.const import (
+        MQTT_PUSH_TIMEOUT,
+        PUSH_FALLBACK_SCAN_INTERVAL,
+    )
+
+    coordinator = Adap1StatusDataUpdateCoordinator(
+        hass, "192.168.1.100", DEFAULT_PORT, timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+    )
+
+    unsubscribe = await coordinator.async_subscribe_mqtt("ada-p1/status")
+    assert unsubscribe is not None
+    # Polling only slows down once messages actually arrive
+    assert coordinator.poll_interval == timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+
+    async_fire_mqtt_message(hass, "ada-p1/status", json.dumps(mock_status_data))
+    await hass.async_block_till_done()
+    assert coordinator.data == mock_status_data
+    assert coordinator.poll_interval == timedelta(seconds=PUSH_FALLBACK_SCAN_INTERVAL)
+
+    # Partial and malformed messages: the former is merged, the latter ignored.
+    async_fire_mqtt_message(hass, "ada-p1/status", '{"heap_free": 1000}')
+    async_fire_mqtt_message(hass, "ada-p1/status", "not json")
+    await hass.async_block_till_done()
+    assert coordinator.data == {**mock_status_data, "heap_free": 1000}
+
+    # Silence hands the meter back to regular polling
+    with patch(
+        "custom_components.adap1status.time.monotonic",
+        return_value=time.monotonic() + MQTT_PUSH_TIMEOUT + 1,
+    ):
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + timedelta(seconds=MQTT_PUSH_TIMEOUT + 1)
+        )
+        await hass.async_block_till_done()
+    assert coordinator.push_sources == frozenset()
+    assert coordinator.poll_interval == timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+
+    unsubscribe()
+
+
+def test_stream_frame_decoder():
+    """Test that SSE and NDJSON frames are split across chunk boundaries."""
+    from custom_components.adap1status.parser import StreamFrameDecoder
+
+    decoder = StreamFrameDecoder()
+
+    assert decoder.feed(b'data: {"heap_free":') == []
+    assert decoder.feed(b' 1}\n\n: keep-alive\nevent: status\ndata: {"ack_items": 2}\r\n\r\n') == [
+        b'{"heap_free": 1}',
+        b'{"ack_items": 2}',
+    ]
+    assert decoder.feed(b'{"wifi_rssi": -60}\n{"chip') == [b'{"wifi_rssi": -60}']
+    assert decoder.feed(b'_cores": 2}\n') == [b'{"chip_cores": 2}']
+
+    with pytest.raises(ValueError):
+        StreamFrameDecoder(max_frame_bytes=16).feed(b"data: " + b"x" * 32)
+
+
+@pytest.mark.asyncio
+async def test_stream_status_reconnects_and_stops_with_session(
+    hass: HomeAssistant, mock_status_data
+):
+    """Test that the stream applies frames, backs off and ends with the session."""
+    from contextlib import asynccontextmanager
+    from datetime import timedelta
+    from types import SimpleNamespace
+
+    from custom_components.adap1status.const import STREAM_RECONNECT_MIN_DELAY
+
+    class FakeSession:
+        """Session whose requests follow a script."""
+
+        def __init__(self, script) -> None:
+            self.closed = False
+            self.script = list(script)
+
+        @asynccontextmanager
+        async def get(self, url, **kwargs):
+            step = self.script.pop(0)
+            if isinstance(step, BaseException):
+                raise step
+            if callable(step):
+                step()
+                raise RuntimeError("Session is closed")
+
+            async def iter_any():
+                for chunk in step:
+                    yield chunk
+
+            yield SimpleNamespace(
+                status=200, content=SimpleNamespace(iter_any=iter_any)
+            )
+
+    coordinator = Adap1StatusDataUpdateCoordinator(
+        hass, "192.168.1.100", DEFAULT_PORT, timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+    )
+    coordinator.data = dict(mock_status_data)
+    session = FakeSession(
+        [
+            # Connects, delivers a valid, an invalid and another valid frame
+            [
+                b'data: {"heap_free": 1000}\n\n',
+                b"data: not json\n\n",
+                b'{"ack_items": 7}\n',
+            ],
+            aiohttp.ClientConnectionError("refused"),
+            lambda: setattr(session, "closed", True),
+        ]
+    )
+    coordinator.session = session
+    sleeps = []
+
+    async def _sleep(delay):
+        assert coordinator.push_sources == frozenset()
+        sleeps.append(delay)
+
+    with patch("custom_components.adap1status.asyncio.sleep", side_effect=_sleep):
+        await coordinator.async_stream_status()
+
+    assert coordinator.data == {**mock_status_data, "heap_free": 1000, "ack_items": 7}
+    # Back-off resets after a connection and doubles after every failure
+    assert sleeps == [STREAM_RECONNECT_MIN_DELAY, STREAM_RECONNECT_MIN_DELAY * 2]
+    assert session.script == []
+    assert coordinator.push_sources == frozenset()
+
+    # Nothing is requested over a session that is already closed
+    await coordinator.async_stream_status()
+
+
+@pytest.mark.asyncio
+async def test_entities_share_device_info_and_convert_on_update(
+    hass: HomeAssistant, mock_config_entry, mock_status_data
+):
+    """Test that entities share one DeviceInfo and convert values on update."""
+    from datetime import timedelta
+
+    from custom_components.adap1status.binary_sensor import Adap1StatusBinarySensor
+    from custom_components.adap1status.sensor import (
+        NUMERIC_SENSOR_DESCRIPTIONS,
+        Adap1StatusNumericSensor,
+        Adap1StatusTextSensor,
+    )
+
+    coordinator = Adap1StatusDataUpdateCoordinator(
+        hass, "192.168.1.100", DEFAULT_PORT, timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+    )
+    coordinator.data = dict(mock_status_data)
+
+    text = Adap1StatusTextSensor(coordinator, "hostname", mock_config_entry)
+    numeric = Adap1StatusNumericSensor(coordinator, "heap_free", mock_config_entry)
+    binary = Adap1StatusBinarySensor(coordinator, "mqtt_connected", mock_config_entry)
+
+    assert text.device_info is numeric.device_info is binary.device_info
+    assert numeric.entity_description is NUMERIC_SENSOR_DESCRIPTIONS["heap_free"]
+    assert text.native_value == "ada-p1-meter"
+    assert numeric.native_value == 123456
+    assert binary.is_on is True
+
+    coordinator.data = {**mock_status_data, "heap_free": "1000", "mqtt_connected": "off"}
+    with patch.object(numeric, "async_write_ha_state"), patch.object(
+        binary, "async_write_ha_state"
+    ):
+        numeric._handle_coordinator_update()
+        binary._handle_coordinator_update()
+
+    assert numeric.native_value == 1000.0
+    assert binary.is_on is False
+
+
+def test_rolling_window_aggregates():
+    """Test that the ring buffer keeps min/mean/max of the last samples."""
+    from custom_components.adap1status.rolling import RollingWindow
+
+    window = RollingWindow(3)
+    assert window.aggregates() is None
+
+    for value in (-70, -60, -65):
+        assert window.add(value) is True
+    assert window.aggregates() == (-70, -65, -60)
+
+    # -70 is evicted: the minimum has to be found again.
+    window.add(-62)
+    assert window.aggregates() == (-65, -62.333333333333336, -60)
+    assert window.count == 3
+
+    # Replacing the evicted -60 by another -60 leaves the aggregates alone.
+    assert window.add(-60) is False
+
+
+@pytest.mark.asyncio
+async def test_coordinator_statistics_notify_statistic_sensors(
+    hass: HomeAssistant, mock_status_data
+):
+    """Test that the coordinator keeps rolling statistics per numeric key."""
+    from datetime import timedelta
+    from unittest.mock import MagicMock
+
+    coordinator = Adap1StatusDataUpdateCoordinator(
+        hass,
+        "192.168.1.100",
+        DEFAULT_PORT,
+        timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+        statistics_window=10,
+    )
+    statistics_listener = MagicMock()
+    remove = coordinator.async_add_listener(
+        statistics_listener, "heap_free_statistics"
+    )
+
+    coordinator.async_apply_push(dict(mock_status_data))
+    coordinator.async_apply_push({"heap_free": 100000})
+
+    assert coordinator.statistics["heap_free"].aggregates() == (
+        100000,
+        111728,
+        123456,
+    )
+    assert statistics_listener.call_count == 2
+
+    remove()
+
+
+@pytest.mark.asyncio
+async def test_statistics_only_for_selected_keys(hass: HomeAssistant):
+    """Test that windows and entities only exist for the selected keys."""
+    from datetime import timedelta
+
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+    from homeassistant.helpers import entity_registry as er
+
+    from custom_components.adap1status import async_remove_entities
+
+    coordinator = Adap1StatusDataUpdateCoordinator(
+        hass,
+        "192.168.1.100",
+        DEFAULT_PORT,
+        timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+        statistics_window=10,
+        statistics_keys=["heap_free", "not_a_key"],
+    )
+    assert list(coordinator.statistics) == ["heap_free"]
+
+    # Counters never get statistics, whatever the options say
+    from custom_components.adap1status.sensor import STATISTIC_SENSOR_DESCRIPTIONS
+
+    assert not {
+        description.source_key for description in STATISTIC_SENSOR_DESCRIPTIONS
+    } & {"energy", "uptime_seconds"}
+
+    entry = MockConfigEntry(domain=DOMAIN, version=2)
+    entry.add_to_hass(hass)
+    ent_reg = er.async_get(hass)
+    for key in ("heap_free_min", "wifi_rssi_min"):
+        ent_reg.async_get_or_create(
+            "sensor", DOMAIN, f"{entry.entry_id}_{key}", config_entry=entry
+        )
+
+    async_remove_entities(hass, entry, ["wifi_rssi_min", "wifi_rssi_max"])
+
+    assert [
+        entity_entry.unique_id
+        for entity_entry in er.async_entries_for_config_entry(ent_reg, entry.entry_id)
+    ] == [f"{entry.entry_id}_heap_free_min"]
+
+
+@pytest.mark.asyncio
+async def test_coordinator_deadband_suppresses_small_changes(
+    hass: HomeAssistant, mock_status_data
+):
+    """Test that keys with a deadband only dispatch significant changes."""
+    from datetime import timedelta
+    from unittest.mock import MagicMock
+
+    from custom_components.adap1status.deadband import Deadband
+
+    coordinator = Adap1StatusDataUpdateCoordinator(
+        hass,
+        "192.168.1.100",
+        DEFAULT_PORT,
+        timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+        deadbands={
+            "heap_free": Deadband("absolute", 1000),
+            "fs_used": Deadband("relative", 10, max_silence=60),
+        },
+    )
+    heap_listener = MagicMock()
+    fs_listener = MagicMock()
+    remove_heap = coordinator.async_add_listener(heap_listener, "heap_free")
+    remove_fs = coordinator.async_add_listener(fs_listener, "fs_used")
+
+    coordinator.async_set_updated_data(dict(mock_status_data))
+    assert heap_listener.call_count == 1
+
+    # Small steps do not add up against the last dispatched value
+    coordinator.async_set_updated_data({**mock_status_data, "heap_free": 123956})
+    coordinator.async_set_updated_data({**mock_status_data, "heap_free": 124356})
+    assert heap_listener.call_count == 1
+    coordinator.async_set_updated_data({**mock_status_data, "heap_free": 124456})
+    assert heap_listener.call_count == 2
+
+    # Relative deadband, released by the maximum silence
+    fs_used = mock_status_data["fs_used"]
+    coordinator.async_set_updated_data({**mock_status_data, "fs_used": fs_used + 1})
+    assert fs_listener.call_count == 1
+    with patch(
+        "custom_components.adap1status.time.monotonic",
+        return_value=time.monotonic() + 61,
+    ):
+        coordinator.async_set_updated_data(
+            {**mock_status_data, "fs_used": fs_used + 2}
+        )
+    assert fs_listener.call_count == 2
+
+    remove_heap()
+    remove_fs()
+
+
+def test_heap_trend_estimates_leak_and_resets_on_reboot():
+    """Test the online heap-leak regression."""
+    from custom_components.adap1status.trend import HeapTrend
+
+    trend = HeapTrend()
+    # 2 bytes per second lost, one sample a minute for an hour
+    for minute in range(61):
+        trend.add(600 + minute * 60, 100000 - minute * 120, 90000)
+
+    assert trend.leak_rate == 2.0
+    # Starts from the low-water mark rather than the fitted 92800 bytes
+    assert trend.time_to_exhaustion == 12.5
+
+    assert trend.add(30, 140000) is True
+    assert trend.count == 1
+    assert trend.leak_rate is None
+    assert trend.time_to_exhaustion is None
+
+
+@pytest.mark.asyncio
+async def test_setup_entry_starts_from_cached_state(
+    hass: HomeAssistant, hass_storage, mock_config_entry, mock_status_data
+):
+    """Test that setup does not wait for an offline meter with a cached state."""
+    hass.data[DOMAIN] = {}
+    hass_storage[f"{DOMAIN}.{mock_config_entry.entry_id}"] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": f"{DOMAIN}.{mock_config_entry.entry_id}",
+        "data": {"data": {**mock_status_data, "removed_key": 1}},
+    }
+
+    with patch.object(
+        Adap1StatusDataUpdateCoordinator,
+        "_async_update_data",
+        side_effect=UpdateFailed("offline"),
+    ), patch(
+        "homeassistant.config_entries.ConfigEntries.async_forward_entry_setups"
+    ):
+        assert await async_setup_entry(hass, mock_config_entry) is True
+        coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+        assert coordinator.data == mock_status_data
+
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert coordinator.last_update_success is False
+
+
+@pytest.mark.asyncio
+async def test_state_cache_is_flushed_on_close(
+    hass: HomeAssistant, hass_storage, mock_status_data
+):
+    """Test that closing writes the pending save and blocks later ones."""
+    from custom_components.adap1status.cache import Adap1StatusStateCache
+
+    key = f"{DOMAIN}.entry_1"
+    cache = Adap1StatusStateCache(hass, "entry_1")
+    cache.async_schedule_save(dict(mock_status_data))
+    assert key not in hass_storage
+
+    await cache.async_close()
+    assert hass_storage[key]["data"] == {"data": mock_status_data}
+
+    # Nothing is written any more once the entry is on its way out
+    cache.async_schedule_save({"heap_free": 1})
+    await cache.async_remove()
+    await hass.async_block_till_done()
+    assert key not in hass_storage
+
+
+@pytest.mark.asyncio
+async def test_discover_meters_recognises_payload_shape(mock_status_data):
+    """Test that a scan only reports hosts serving a meter status payload."""
+    from contextlib import asynccontextmanager
+    from unittest.mock import MagicMock
+
+    from custom_components.adap1status.discovery import (
+        DiscoveredMeter,
+        async_discover_meters,
+    )
+
+    bodies = {
+        "10.0.0.1": mock_status_data,
+        "10.0.0.2": {"hostname": "printer", "status": "idle"},
+    }
+
+    @asynccontextmanager
+    async def _get(url, **kwargs):
+        host = url.split("//")[1].split(":")[0]
+        if host not in bodies:
+            raise aiohttp.ClientConnectionError("unreachable")
+        response = AsyncMock()
+        response.status = 200
+        response.read = AsyncMock(return_value=json.dumps(bodies[host]).encode())
+        yield response
+
+    session = MagicMock()
+    session.get = _get
+
+    meters = await async_discover_meters(session, "10.0.0.0/29")
+
+    assert meters == [DiscoveredMeter("10.0.0.1", DEFAULT_PORT, "ada-p1-meter")]
+    with pytest.raises(ValueError):
+        await async_discover_meters(session, "10.0.0.0/16")
+
+
+def test_network_hosts_only_accepts_ipv4():
+    """Test that only IPv4 networks within the scan limit are expanded."""
+    from custom_components.adap1status.discovery import network_hosts
+
+    assert network_hosts(" 10.0.0.0/30 ") == ["10.0.0.1", "10.0.0.2"]
+    for network in ("fd00::/120", "fe80::1/128", "10.0.0.0/16", "not a network"):
+        with pytest.raises(ValueError):
+            network_hosts(network)
+
+
+@pytest.mark.asyncio
+async def test_import_meters_service(hass: HomeAssistant, tmp_path):
+    """Test bulk import from a service call and a CSV file."""
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+    from custom_components.adap1status import async_setup
+
+    MockConfigEntry(
+        domain=DOMAIN, version=2, unique_id="192.168.1.100"
+    ).add_to_hass(hass)
+    meter_file = tmp_path / "meters.csv"
+    meter_file.write_text("host,port,name\n10.0.0.1,8989,Kitchen\n10.0.0.3,,\n")
+    hass.config.allowlist_external_dirs = {str(tmp_path)}
+
+    async def _validate(hass, data):
+        if data[CONF_HOST] == "10.0.0.3":
+            raise ConnectionError("Cannot connect to device: timeout")
+        return {"title": data[CONF_HOST]}
+
+    assert await async_setup(hass, {})
+    with patch(
+        "custom_components.adap1status.bulk_import.validate_input",
+        side_effect=_validate,
+    ), patch("custom_components.adap1status.async_setup_entry", return_value=True):
+        summary = await hass.services.async_call(
+            DOMAIN,
+            "import_meters",
+            {
+                "meters": [{"host": "192.168.1.100"}, {"host": "10.0.0.2"}],
+                "file": str(meter_file),
+            },
+            blocking=True,
+            return_response=True,
+        )
+
+    assert sorted(summary["added"]) == ["10.0.0.1", "10.0.0.2"]
+    assert summary["already_configured"] == ["192.168.1.100"]
+    assert list(summary["failed"]) == ["10.0.0.3"]
+    titles = {entry.title for entry in hass.config_entries.async_entries(DOMAIN)}
+    assert "Kitchen" in titles
+
+
+@pytest.mark.asyncio
+async def test_coordinator_records_poll_metrics(hass: HomeAssistant, mock_status_data):
+    """Test that polls are instrumented and failures counted by reason."""
+    from datetime import timedelta
+
+    from custom_components.adap1status.diagnostics import (
+        async_get_config_entry_diagnostics,
+    )
+
+    coordinator = Adap1StatusDataUpdateCoordinator(
+        hass, "192.168.1.100", DEFAULT_PORT, timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+    )
+    body = json.dumps(mock_status_data).encode()
+    ok_response = AsyncMock()
+    ok_response.status = 200
+    ok_response.read = AsyncMock(return_value=body)
+    error_response = AsyncMock()
+    error_response.status = 503
+
+    with patch.object(coordinator.session, "get") as mock_get:
+        mock_get.return_value.__aenter__.return_value = ok_response
+        await coordinator._async_update_data()
+
+        mock_get.return_value.__aenter__.return_value = error_response
+        for _ in range(2):
+            with pytest.raises(UpdateFailed):
+                await coordinator._async_update_data()
+
+        mock_get.side_effect = TimeoutError
+        with pytest.raises(UpdateFailed, match="Timeout"):
+            await coordinator._async_update_data()
+
+    metrics = coordinator.metrics
+    assert metrics.requests == 4
+    assert metrics.payload_bytes == len(body)
+    assert metrics.latency_histogram.count == 1
+    assert metrics.consecutive_failures == 3
+    assert metrics.failure_reasons == {"http_503": 2, "timeout": 1}
+
+    entry = ConfigEntry(
+        version=2,
+        domain=DOMAIN,
+        title="ADA-P1 Meter (192.168.1.100)",
+        data={CONF_HOST: "192.168.1.100", CONF_PORT: DEFAULT_PORT},
+        options={},
+        source="user",
+        entry_id="diagnostics_entry",
+    )
+    coordinator.data = mock_status_data
+    hass.data[DOMAIN] = {entry.entry_id: coordinator}
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+    assert diagnostics["entry"]["data"][CONF_HOST] == "**REDACTED**"
+    assert diagnostics["data"]["local_ip"] == "**REDACTED**"
+    assert diagnostics["metrics"]["failure_reasons"] == {"http_503": 2, "timeout": 1}
+
+
+@pytest.mark.asyncio
+async def test_refresh_on_demand_coalesces_concurrent_calls(
+    hass: HomeAssistant, mock_status_data
+):
+    """Test that concurrent refresh calls share a single request."""
+    import asyncio
+    from datetime import timedelta
+
+    coordinator = Adap1StatusDataUpdateCoordinator(
+        hass, "192.168.1.100", DEFAULT_PORT, timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+    )
+    release = asyncio.Event()
+
+    async def _slow_poll():
+        await release.wait()
+        return dict(mock_status_data)
+
+    with patch.object(
+        coordinator, "_async_guarded_poll", side_effect=_slow_poll
+    ) as mock_poll:
+        calls = [
+            hass.async_create_task(coordinator.async_refresh_on_demand())
+            for _ in range(10)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(*calls)
+        # Data that was just polled answers the next call as well
+        await coordinator.async_refresh_on_demand()
+
+    assert mock_poll.call_count == 1
+    assert coordinator.data == mock_status_data
+
+
+@pytest.mark.asyncio
+async def test_coordinator_republishes_static_keys_on_reboot_or_interval(
+    hass: HomeAssistant, mock_status_data
+):
+    """Test that static keys publish changes at once and are re-published when due."""
+    from datetime import timedelta
+    from unittest.mock import MagicMock
+
+    coordinator = Adap1StatusDataUpdateCoordinator(
+        hass, "192.168.1.100", DEFAULT_PORT, timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+    )
+    version_listener = MagicMock()
+    ip_listener = MagicMock()
+    removers = [
+        coordinator.async_add_listener(version_listener, "os_version"),
+        coordinator.async_add_listener(ip_listener, "local_ip"),
+    ]
+    coordinator.async_set_updated_data(dict(mock_status_data))
+
+    # A real change, e.g. after a DHCP renewal, is published right away
+    coordinator.async_set_updated_data({**mock_status_data, "local_ip": "10.0.0.9"})
+    assert ip_listener.call_count == 2
+    assert version_listener.call_count == 1
+
+    # Unchanged static keys are re-published at the periodic check...
+    with patch(
+        "custom_components.adap1status.time.monotonic",
+        return_value=time.monotonic() + 3601,
+    ):
+        coordinator.async_set_updated_data(
+            {**mock_status_data, "local_ip": "10.0.0.9", "uptime_seconds": 45300}
+        )
+    assert ip_listener.call_count == 3
+    assert version_listener.call_count == 2
+
+    # ...and whenever the meter rebooted
+    coordinator.async_set_updated_data(
+        {**mock_status_data, "local_ip": "10.0.0.9", "uptime_seconds": 12}
+    )
+    assert version_listener.call_count == 3
+
+    for remove in removers:
+        remove()
+
+
+def test_text_status_decoder_strips_units_and_bounds_input():
+    """Test the plain-text parser across chunk boundaries and on bad input."""
+    from custom_components.adap1status.parser import (
+        TextStatusDecoder,
+        decode_text_status,
+    )
+
+    decoder = TextStatusDecoder()
+    body = (
+        b"Voltage: 230.5 V\r\ncurrent: 5.2 A\n# comment\npower: 1200 W\n"
+        b"uptime_hhmm: 12:34\nunknown: 1\nenergy: 145.6 kWh\nfrequency: 50.0 Hz"
+    )
+    for start in range(0, len(body), 7):
+        decoder.feed(body[start : start + 7])
+    assert decoder.finish() == {
+        "voltage": 230.5,
+        "current": 5.2,
+        "power": 1200,
+        "uptime_hhmm": "12:34",
+        "energy": 145.6,
+        "frequency": 50.0,
+    }
+
+    with pytest.raises(ValueError):
+        TextStatusDecoder(max_line_bytes=64).feed(b"voltage: " + b"9" * 128)
+    with pytest.raises(ValueError):
+        TextStatusDecoder(max_body_bytes=64).feed(b"power: 1 W\n" * 10)
+    with pytest.raises(ValueError):
+        decode_text_status(b"<html>nothing here</html>")
+
+
+@pytest.mark.asyncio
+async def test_coordinator_parses_plain_text_response(hass: HomeAssistant):
+    """Test that the content type selects the plain-text parser."""
+    from datetime import timedelta
+    from unittest.mock import MagicMock
+
+    coordinator = Adap1StatusDataUpdateCoordinator(
+        hass, "192.168.1.100", DEFAULT_PORT, timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+    )
+
+    async def _chunks(size):
+        yield b"voltage: 230.5 V\npow"
+        yield b"er: 1200 W\n"
+
+    mock_response = AsyncMock()
+    mock_response.status = 200
+    mock_response.content_type = "text/plain"
+    mock_response.content = MagicMock()
+    mock_response.content.iter_chunked = _chunks
+
+    with patch.object(coordinator.session, "get") as mock_get:
+        mock_get.return_value.__aenter__.return_value = mock_response
+        data = await coordinator._async_update_data()
+
+    assert data == {"voltage": 230.5, "power": 1200}
+    assert coordinator.metrics.payload_bytes == 31
+
+
+@pytest.mark.asyncio
+async def test_coordinator_downsamples_high_rate_samples(
+    hass: HomeAssistant, mock_status_data
+):
+    """Test that samples are only published, downsampled, once per interval."""
+    from datetime import timedelta
+
+    coordinator = Adap1StatusDataUpdateCoordinator(
+        hass,
+        "192.168.1.100",
+        DEFAULT_PORT,
+        timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+        sample_interval=timedelta(seconds=1),
+    )
+    assert coordinator.poll_interval == timedelta(seconds=1)
+    samples = [
+        {
+            **mock_status_data,
+            "heap_free": heap_free,
+            "heap_min_free": heap_min_free,
+            "wifi_channel": channel,
+            "uptime_seconds": uptime,
+        }
+        for heap_free, heap_min_free, channel, uptime in (
+            (1000, 900, 1, 1),
+            (2000, 800, 6, 2),
+            (6000, 850, 11, 3),
+        )
+    ]
+
+    with patch.object(coordinator, "_async_update_sample", side_effect=samples):
+        # The first sample is published right away
+        first = await coordinator._async_update_data()
+        assert first["heap_free"] == 1000
+        coordinator.data = first
+
+        # Samples within the interval are only accumulated
+        assert await coordinator._async_update_data() is first
+        with patch(
+            "custom_components.adap1status.time.monotonic",
+            return_value=time.monotonic() + DEFAULT_SCAN_INTERVAL,
+        ):
+            published = await coordinator._async_update_data()
+
+    # Means for measurements, the lowest low-water mark, the last channel
+    assert published["heap_free"] == 4000
+    assert published["heap_min_free"] == 800
+    assert published["wifi_channel"] == 11
+    assert published["uptime_seconds"] == 3
+    assert coordinator.downsampler.aggregates["heap_free"] == {
+        "min": 2000,
+        "max": 6000,
+        "last": 6000,
+        "samples": 2,
+    }
+
+
+@pytest.mark.asyncio
+async def test_coordinator_reports_new_keys_and_marks_stale_ones(
+    hass: HomeAssistant, mock_config_entry, mock_status_data
+):
+    """Test that keys are reported once when first seen and go stale when absent."""
+    from datetime import timedelta
+    from unittest.mock import MagicMock
+
+    from custom_components.adap1status.sensor import Adap1StatusNumericSensor
+
+    coordinator = Adap1StatusDataUpdateCoordinator(
+        hass,
+        "192.168.1.100",
+        DEFAULT_PORT,
+        timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+        stale_after=600,
+    )
+    coordinator.async_apply_push({"heap_free": 123456, "uptime_seconds": 45296})
+
+    key_callback = MagicMock()
+    remove_keys = coordinator.async_track_keys(key_callback)
+    key_callback.assert_called_once_with({"heap_free", "uptime_seconds"})
+
+    # Only keys that were never reported before are passed on
+    heap_listener = MagicMock()
+    remove = coordinator.async_add_listener(heap_listener, "heap_free")
+    coordinator.async_apply_push({"uptime_seconds": 45300, "voltage": 230.5})
+    key_callback.assert_called_with({"voltage"})
+    assert key_callback.call_count == 2
+
+    sensor = Adap1StatusNumericSensor(coordinator, "heap_free", mock_config_entry)
+    assert sensor.available is True
+
+    # heap_free was not pushed for longer than stale_after
+    with patch(
+        "custom_components.adap1status.time.monotonic",
+        return_value=time.monotonic() + 601,
+    ):
+        coordinator.async_apply_push({"uptime_seconds": 45901, "voltage": 231.0})
+    assert coordinator.stale_keys == {"heap_free"}
+    assert sensor.available is False
+    assert heap_listener.call_count == 1
+
+    remove()
+    remove_keys()
+
+
+@pytest.mark.asyncio
+async def test_remove_unreported_entities(hass: HomeAssistant):
+    """Test that registry entries of keys the meter never reported are removed."""
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+    from homeassistant.helpers import entity_registry as er
+
+    from custom_components.adap1status import async_remove_unreported_entities
+
+    entry = MockConfigEntry(domain=DOMAIN, version=2)
+    entry.add_to_hass(hass)
+    ent_reg = er.async_get(hass)
+    for platform, key in (
+        ("sensor", "heap_free"),
+        ("sensor", "voltage"),
+        ("sensor", "voltage_max"),
+        ("sensor", "circuit_breaker"),
+        ("binary_sensor", "rules_loaded"),
+    ):
+        ent_reg.async_get_or_create(
+            platform, DOMAIN, f"{entry.entry_id}_{key}", config_entry=entry
+        )
+
+    async_remove_unreported_entities(hass, entry, {"heap_free", "uptime_seconds"})
+
+    # Entities not backed by a payload key are left alone
+    assert sorted(
+        entity_entry.unique_id
+        for entity_entry in er.async_entries_for_config_entry(ent_reg, entry.entry_id)
+    ) == [f"{entry.entry_id}_circuit_breaker", f"{entry.entry_id}_heap_free"]
+
+
+@pytest.mark.asyncio
+async def test_migrate_entry_removes_unreported_entities_once(
+    hass: HomeAssistant, hass_storage, mock_status_data
+):
+    """Test that the 2.2 migration runs once and keeps customised entities."""
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+    from homeassistant.helpers import entity_registry as er
+
+    from custom_components.adap1status import async_migrate_entry
+
+    entry = MockConfigEntry(domain=DOMAIN, version=2, minor_version=1)
+    entry.add_to_hass(hass)
+    ent_reg = er.async_get(hass)
+
+    def _create(key: str) -> str:
+        return ent_reg.async_get_or_create(
+            "sensor",
+            DOMAIN,
+            f"{entry.entry_id}_{key}",
+            config_entry=entry,
+            original_name=f"ADA-P1 Meter {key}",
+            suggested_object_id=f"ADA-P1 Meter {key}",
+        ).entity_id
+
+    for key in ("heap_free", "voltage", "voltage_max", "frequency"):
+        _create(key)
+    ent_reg.async_update_entity(_create("current"), new_entity_id="sensor.grid_current")
+    ent_reg.async_update_entity(_create("power"), name="Grid power")
+    ent_reg.async_update_entity(_create("energy"), area_id="kitchen")
+
+    # Without a cached state the meter's keys are unknown, so nothing happens
+    assert await async_migrate_entry(hass, entry) is True
+    assert entry.minor_version == 1
+    assert len(er.async_entries_for_config_entry(ent_reg, entry.entry_id)) == 7
+
+    hass_storage[f"{DOMAIN}.{entry.entry_id}"] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": f"{DOMAIN}.{entry.entry_id}",
+        "data": {"data": mock_status_data},
+    }
+    assert await async_migrate_entry(hass, entry) is True
+    assert entry.minor_version == 2
+
+    def _remaining() -> list[str]:
+        return sorted(
+            entity_entry.unique_id.removeprefix(f"{entry.entry_id}_")
+            for entity_entry in er.async_entries_for_config_entry(
+                ent_reg, entry.entry_id
+            )
+        )
+
+    assert _remaining() == ["current", "energy", "heap_free", "power"]
+
+    # Later starts no longer touch the registry
+    _create("frequency")
+    assert await async_migrate_entry(hass, entry) is True
+    assert _remaining() == ["current", "energy", "frequency", "heap_free", "power"]
+
+
+def test_history_buffer_keeps_last_samples_and_exports_them():
+    """Test the ring buffer and both export formats."""
+    import math
+
+    from custom_components.adap1status.history import (
+        HistoryBuffer,
+        format_binary,
+        format_csv,
+        read_binary,
+    )
+
+    history = HistoryBuffer(3, frozenset({"heap_free", "wifi_rssi"}))
+    history.add({"heap_free": 1000, "hostname": "ada-p1-meter"}, 10.0)
+    history.add({"heap_free": 900, "wifi_rssi": -65}, 20.0)
+    # Non-numeric payloads do not take a row
+    history.add({"mqtt_connected": True}, 25.0)
+    history.add({"wifi_rssi": -70.5}, 30.0)
+    history.add({"heap_free": 800}, 40.0)
+
+    timestamps, columns = history.snapshot()
+    assert list(timestamps) == [20.0, 30.0, 40.0]
+    assert list(columns) == ["heap_free", "wifi_rssi"]
+    assert columns["heap_free"][0] == 900 and math.isnan(columns["heap_free"][1])
+
+    assert format_csv(timestamps, columns).splitlines() == [
+        "timestamp,heap_free,wifi_rssi",
+        "1970-01-01T00:00:20+00:00,900,-65",
+        "1970-01-01T00:00:30+00:00,,-70.5",
+        "1970-01-01T00:00:40+00:00,800,",
+    ]
+
+    decoded_timestamps, decoded = read_binary(format_binary(timestamps, columns))
+    assert decoded_timestamps == timestamps
+    assert decoded["wifi_rssi"][:2].tolist() == [-65, -70.5]
+    with pytest.raises(ValueError):
+        read_binary(b"ADH1\x05")
+
+
+@pytest.mark.asyncio
+async def test_export_history_service(hass: HomeAssistant, tmp_path):
+    """Test exporting the history of a targeted meter to a file."""
+    from datetime import timedelta
+
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+    from homeassistant.helpers import device_registry as dr
+
+    from custom_components.adap1status import async_setup
+    from custom_components.adap1status.history import read_binary
+
+    entry = MockConfigEntry(domain=DOMAIN, version=2, unique_id="192.168.1.100")
+    entry.add_to_hass(hass)
+    device = dr.async_get(hass).async_get_or_create(
+        config_entry_id=entry.entry_id, identifiers={(DOMAIN, entry.entry_id)}
+    )
+    coordinator = Adap1StatusDataUpdateCoordinator(
+        hass,
+        "192.168.1.100",
+        DEFAULT_PORT,
+        timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+        history_size=10,
+    )
+    coordinator.async_apply_push({"heap_free": 123456, "wifi_rssi": -65})
+    coordinator.async_apply_push({"heap_free": 123000})
+    hass.data[DOMAIN] = {entry.entry_id: coordinator}
+    hass.config.allowlist_external_dirs = {str(tmp_path)}
+
+    assert await async_setup(hass, {})
+    response = await hass.services.async_call(
+        DOMAIN,
+        "export_history",
+        {"device_id": device.id, "format": "binary", "directory": str(tmp_path)},
+        blocking=True,
+        return_response=True,
+    )
+
+    [exported] = response["files"]
+    assert exported["samples"] == 2
+    assert exported["path"].startswith(str(tmp_path))
+    with open(exported["path"], "rb") as file:
+        timestamps, columns = read_binary(file.read())
+    assert len(timestamps) == 2
+    assert columns["heap_free"].tolist() == [123456, 123000]
+
+
+@pytest.mark.asyncio
+async def test_websocket_fleet_snapshot_and_deltas(
+    hass: HomeAssistant, hass_ws_client, mock_status_data
+):
+    """Test the fleet snapshot command and its delta subscription."""
+    from datetime import timedelta
+
+    from custom_components.adap1status import async_setup
+
+    coordinator = Adap1StatusDataUpdateCoordinator(
+        hass, "192.168.1.100", DEFAULT_PORT, timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+    )
+    coordinator.async_apply_push(dict(mock_status_data))
+    hass.data[DOMAIN] = {"entry_1": coordinator}
+    assert await async_setup(hass, {})
+    client = await hass_ws_client(hass)
+
+    await client.send_json({"id": 1, "type": "adap1status/fleet"})
+    response = await client.receive_json()
+    assert response["success"]
+    meter = response["result"]["meters"]["entry_1"]
+    assert meter["available"] is True
+    assert meter["last_update"] is not None
+    assert meter["data"] == mock_status_data
+
+    await client.send_json({"id": 2, "type": "adap1status/fleet/subscribe"})
+    assert (await client.receive_json())["success"]
+    snapshot = await client.receive_json()
+    assert snapshot["event"]["meters"]["entry_1"]["data"] == mock_status_data
+
+    coordinator.async_apply_push({"heap_free": 100000})
+    delta = (await client.receive_json())["event"]["meters"]["entry_1"]
+    assert delta["data"] == {"heap_free": 100000}
+    assert "available" not in delta
+
+
+@pytest.mark.asyncio
+async def test_websocket_fleet_subscription_follows_reloads(
+    hass: HomeAssistant, hass_ws_client, mock_status_data
+):
+    """Test that an open subscription re-binds to a reloaded entry."""
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        minor_version=2,
+        title="ADA-P1 Meter (192.168.1.100)",
+        data={CONF_HOST: "192.168.1.100", CONF_PORT: DEFAULT_PORT},
+    )
+    entry.add_to_hass(hass)
+
+    with patch.object(
+        Adap1StatusDataUpdateCoordinator,
+        "_async_update_data",
+        side_effect=lambda: dict(mock_status_data),
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        client = await hass_ws_client(hass)
+
+        await client.send_json({"id": 1, "type": "adap1status/fleet/subscribe"})
+        assert (await client.receive_json())["success"]
+        snapshot = await client.receive_json()
+        assert snapshot["event"]["meters"][entry.entry_id]["data"] == mock_status_data
+
+        old_coordinator = hass.data[DOMAIN][entry.entry_id]
+        assert await hass.config_entries.async_reload(entry.entry_id)
+        await hass.async_block_till_done()
+        coordinator = hass.data[DOMAIN][entry.entry_id]
+        assert coordinator is not old_coordinator
+
+        # The old coordinator goes away, the new one is sent in full
+        removed = await client.receive_json()
+        assert removed["event"]["meters"] == {entry.entry_id: None}
+        added = (await client.receive_json())["event"]["meters"][entry.entry_id]
+        assert added["data"] == mock_status_data
+        assert added["available"] is True
+
+        # Changes of the new coordinator reach the subscription
+        coordinator.async_apply_push({"heap_free": 100000})
+        delta = (await client.receive_json())["event"]["meters"][entry.entry_id]
+        assert delta["data"] == {"heap_free": 100000}
+
+        # The old coordinator is no longer followed
+        old_coordinator.async_apply_push({"heap_free": 1})
+        await client.send_json({"id": 2, "type": "adap1status/fleet"})
+        response = await client.receive_json()
+        assert response["id"] == 2
+        assert response["result"]["meters"][entry.entry_id]["data"]["heap_free"] == 100000
+
+        assert await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+        removed = await client.receive_json()
+        assert removed["event"]["meters"] == {entry.entry_id: None}
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_sensor_skips_payload_dispatches(
+    hass: HomeAssistant, mock_config_entry, mock_status_data
+):
+    """Test that the breaker sensor is not notified of payload changes."""
+    from datetime import timedelta
+    from unittest.mock import MagicMock
+
+    from custom_components.adap1status.circuit_breaker import CircuitBreaker
+    from custom_components.adap1status.sensor import Adap1StatusCircuitBreakerSensor
+
+    coordinator = Adap1StatusDataUpdateCoordinator(
+        hass,
+        "192.168.1.100",
+        DEFAULT_PORT,
+        timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+        breaker=CircuitBreaker("192.168.1.100", 3, 120),
+    )
+    sensor = Adap1StatusCircuitBreakerSensor(coordinator, mock_config_entry)
+    listener = MagicMock()
+    remove = coordinator.async_add_listener(listener, sensor.coordinator_context)
+
+    coordinator.async_apply_push(dict(mock_status_data))
+    coordinator.async_apply_push({"heap_free": 100000, "wifi_rssi": -70})
+
+    # Only the very first dispatch reaches every listener
+    assert listener.call_count == 1
 
+    remove()